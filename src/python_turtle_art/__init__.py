@@ -1,13 +1,10 @@
 import os
 
-from beartype import BeartypeConf, BeartypeStrategy
-from beartype.claw import beartype_this_package
+# beartype can be turned off by setting DISABLE_BEARTYPE environment variable, in
+# which case the import hook is not installed, so beartype is not imported and
+# modules are not rewritten as they are imported
+if os.getenv("DISABLE_BEARTYPE") is None:
+    from beartype import BeartypeConf, BeartypeStrategy
+    from beartype.claw import beartype_this_package
 
-# beartype can be turned off by setting DISABLE_BEARTYPE environment variable
-_beartype_strategy = (
-    BeartypeStrategy.O0
-    if os.getenv("DISABLE_BEARTYPE") is not None
-    else BeartypeStrategy.O1
-)
-
-beartype_this_package(conf=BeartypeConf(strategy=_beartype_strategy))
+    beartype_this_package(conf=BeartypeConf(strategy=BeartypeStrategy.O1))
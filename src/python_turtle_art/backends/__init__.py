@@ -0,0 +1,45 @@
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .headless import HeadlessTurtle
+    from .raster import Raster, RasterTurtle
+    from .recording import DisplayList, Opcode, RecordingTurtle
+    from .state_tracking import StateTrackingTurtle
+    from .svg import SvgTurtle
+    from .tiled import Tile, TiledRaster
+
+# module each backend is imported from when first accessed, so importing one backend
+# does not import the dependencies, e.g. Pillow, of all of them
+_EXPORTS = {
+    "DisplayList": ".recording",
+    "HeadlessTurtle": ".headless",
+    "Opcode": ".recording",
+    "Raster": ".raster",
+    "RasterTurtle": ".raster",
+    "RecordingTurtle": ".recording",
+    "StateTrackingTurtle": ".state_tracking",
+    "SvgTurtle": ".svg",
+    "Tile": ".tiled",
+    "TiledRaster": ".tiled",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _EXPORTS:
+        return getattr(import_module(_EXPORTS[name], package=__name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = [
+    "DisplayList",
+    "HeadlessTurtle",
+    "Opcode",
+    "Raster",
+    "RasterTurtle",
+    "RecordingTurtle",
+    "StateTrackingTurtle",
+    "SvgTurtle",
+    "Tile",
+    "TiledRaster",
+]
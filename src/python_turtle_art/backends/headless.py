@@ -0,0 +1,277 @@
+"""Turtle that tracks pen state without a Tk screen."""
+
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Sequence
+from math import atan2, degrees, radians, sin
+from turtle import RawTurtle, Vec2D
+from typing import Any
+
+from numpy.typing import NDArray
+
+
+class HeadlessTurtle(RawTurtle, ABC):
+    """Turtle implementing the drawing surface used by the drawings without Tk.
+
+    The class inherits from RawTurtle so it can be passed anywhere a RawTurtle is
+    expected but RawTurtle.__init__ is not called, so no screen or canvas is created.
+    Only the subset of the turtle interface used by the drawings is implemented.
+
+    Pen movements are collected into polylines which are passed to _draw_line when
+    the pen state changes, in the same way RawTurtle builds Tk canvas line items.
+    Primitives created between begin_fill and end_fill are held back until the fill
+    polygon has been passed to _draw_polygon, so they end up on top of the fill as
+    they do on a Tk canvas.
+
+    Subclasses must implement the abstract _draw_line, _draw_polygon and _draw_dot.
+    Points may be passed to these as Vec2D objects or as an (n, 2) array.
+
+    """
+
+    def __init__(self):
+        self._position = Vec2D(0.0, 0.0)
+        self._orient = Vec2D(1.0, 0.0)
+        self._drawing = True
+        self._shown = True
+        self._pencolor: Any = "black"
+        self._fillcolor: Any = "black"
+        self._pensize: int | float = 1
+        self._current_line: list[Vec2D] = [self._position]
+        self._fill_path: list[Vec2D] | None = None
+        self._deferred: list[tuple[Callable, tuple]] = []
+
+    @abstractmethod
+    def _draw_line(
+        self, points: Sequence[Vec2D] | NDArray, colour: Any, width: int | float
+    ) -> None:
+        """Draw a polyline through points."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def _draw_polygon(self, points: Sequence[Vec2D] | NDArray, colour: Any) -> None:
+        """Draw a filled polygon with no outline."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def _draw_dot(
+        self, position: Vec2D | NDArray, size: int | float, colour: Any
+    ) -> None:
+        """Draw a filled circle with diameter size."""
+        raise NotImplementedError
+
+    def _emit(self, method: Callable, *args) -> None:
+        """Pass primitive on, or hold it back until end_fill if filling."""
+        if self._fill_path is None:
+            method(*args)
+        else:
+            self._deferred.append((method, args))
+
+    def _new_line(self) -> None:
+        """Finish the current polyline and start a new one at the current position."""
+        if len(self._current_line) > 1:
+            self._emit(
+                self._draw_line, self._current_line, self._pencolor, self._pensize
+            )
+        self._current_line = [self._position]
+
+    def polyline(
+        self, points: Sequence[Vec2D] | NDArray, colour: Any, width: int | float
+    ) -> None:
+        """Draw a line through points as a single primitive.
+
+        The pen colour and size are not changed. Afterwards the turtle is at the
+        last point with the pen down, as if it had moved to each point in turn.
+
+        """
+        self.penup()
+
+        if self._fill_path is not None:
+            self._fill_path.extend(Vec2D(x, y) for x, y in points)
+
+        self._emit(self._draw_line, points, colour, width)
+
+        self._position = Vec2D(*points[-1])
+        self._current_line = [self._position]
+        self._drawing = True
+
+    def goto(self, x, y=None) -> None:
+        """Move turtle to position, drawing a line if the pen is down."""
+        end = Vec2D(*x) if y is None else Vec2D(x, y)
+
+        if self._drawing:
+            self._current_line.append(end)
+        if self._fill_path is not None:
+            self._fill_path.append(end)
+
+        self._position = end
+
+    setpos = setposition = goto  # type: ignore
+
+    def position(self) -> Vec2D:  # type: ignore
+        return self._position
+
+    pos = position
+
+    def xcor(self) -> float:
+        return self._position[0]
+
+    def ycor(self) -> float:
+        return self._position[1]
+
+    def heading(self) -> float:
+        x, y = self._orient
+        return round(degrees(atan2(y, x)), 10) % 360
+
+    def setheading(self, to_angle: int | float) -> None:
+        self.left(to_angle - self.heading())
+
+    seth = setheading
+
+    def left(self, angle: int | float) -> None:
+        self._orient = self._orient.rotate(angle)
+
+    lt = left
+
+    def right(self, angle: int | float) -> None:
+        self.left(-angle)
+
+    rt = right
+
+    def forward(self, distance: int | float) -> None:
+        self.goto(self._position + self._orient * distance)
+
+    fd = forward
+
+    def penup(self) -> None:
+        if self._drawing:
+            self._new_line()
+            self._drawing = False
+
+    pu = up = penup
+
+    def pendown(self) -> None:
+        if not self._drawing:
+            self._new_line()
+            self._drawing = True
+
+    pd = down = pendown
+
+    def isdown(self) -> bool:
+        return self._drawing
+
+    def pensize(self, width: int | float | None = None):
+        if width is None:
+            return self._pensize
+        if width != self._pensize:
+            self._new_line()
+            self._pensize = width
+
+    width = pensize  # type: ignore
+
+    def pencolor(self, *args):
+        if not args:
+            return self._pencolor
+        colour = _colour_from_args(args)
+        if colour != self._pencolor:
+            self._new_line()
+            self._pencolor = colour
+
+    def fillcolor(self, *args):
+        if not args:
+            return self._fillcolor
+        self._fillcolor = _colour_from_args(args)
+
+    def filling(self) -> bool:
+        return self._fill_path is not None
+
+    def begin_fill(self) -> None:
+        self._new_line()
+        self._fill_path = [self._position]
+
+    def end_fill(self) -> None:
+        if self._fill_path is None:
+            return
+
+        self._new_line()
+
+        fill_path = self._fill_path
+        deferred = self._deferred
+
+        self._fill_path = None
+        self._deferred = []
+
+        if len(fill_path) > 2:
+            self._draw_polygon(fill_path, self._fillcolor)
+
+        for method, args in deferred:
+            method(*args)
+
+    def dot(self, size: Any = None, *color: Any) -> None:
+        """Draw a dot with diameter size, using color or the pencolor.
+
+        As RawTurtle.dot, a colour can be passed in place of size, in which case the
+        default size is used.
+
+        """
+        if not color and isinstance(size, str | tuple):
+            color = (size,)
+            size = None
+
+        if not size:
+            size = self._pensize + max(self._pensize, 4)
+
+        self._new_line()
+        self._emit(
+            self._draw_dot,
+            self._position,
+            size,
+            _colour_from_args(color) if color else self._pencolor,
+        )
+
+    def circle(
+        self,
+        radius: int | float,
+        extent: int | float | None = None,
+        steps: int | None = None,
+    ) -> None:
+        """Draw a circle approximated by a regular polygon, as RawTurtle.circle."""
+        if extent is None:
+            extent = 360
+        if steps is None:
+            frac = abs(extent) / 360
+            steps = 1 + int(min(11 + abs(radius) / 6.0, 59.0) * frac)
+
+        w = 1.0 * extent / steps
+        w2 = 0.5 * w
+        length = 2.0 * radius * sin(radians(w2))
+        if radius < 0:
+            length, w, w2 = -length, -w, -w2
+
+        self.left(w2)
+        for _ in range(steps):
+            self.forward(length)
+            self.left(w)
+        self.left(-w2)
+
+    def hideturtle(self) -> None:
+        self._shown = False
+
+    ht = hideturtle
+
+    def showturtle(self) -> None:
+        self._shown = True
+
+    st = showturtle
+
+    def isvisible(self) -> bool:
+        return self._shown
+
+    def speed(self, speed=None):
+        if speed is None:
+            return 0
+
+
+def _colour_from_args(args: tuple) -> Any:
+    """Get a single colour from turtle style colour arguments."""
+    if len(args) == 1:
+        return args[0]
+    return args
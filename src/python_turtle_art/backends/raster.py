@@ -0,0 +1,320 @@
+"""Rasterise turtle drawings straight into a NumPy RGB array."""
+
+from collections.abc import Iterable, Sequence
+from turtle import Vec2D
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+from PIL import Image, ImageColor
+
+from .headless import HeadlessTurtle
+
+# tolerance so pixel centres lying exactly on a shape boundary are drawn
+_EPSILON = 1e-9
+
+
+def colour_to_rgb(colour: Any) -> tuple[int, int, int]:
+    """Convert a turtle colour (name, hex string or 0-1 tuple) to 0-255 RGB values."""
+    if isinstance(colour, str):
+        return ImageColor.getrgb(colour)[:3]  # type: ignore
+    r, g, b = (round(255 * value) for value in colour)
+    return (r, g, b)
+
+
+class Raster:
+    """RGB image held in a NumPy array with simple drawing primitives.
+
+    Shapes are passed in turtle coordinates (y increasing upwards). The centre of
+    pixel (row, column) is at turtle coordinates
+    (left + (first_column + column) / scale, top - (first_row + row) / scale).
+
+    Pixel coverage follows the rules Ghostscript uses when rendering the postscript
+    output of a Tk canvas, so images are close to those from save_turtle_screen.
+    Lines narrower than one pixel paint the pixels whose centre lies within the line,
+    other lines and filled polygons paint any pixel touched by the shape.
+
+    Args:
+        width (int): width of the image in pixels.
+        height (int): height of the image in pixels.
+        background (Any): colour to initialise the image with.
+        left (int | float | None): x coordinate of the centre of the first column.
+            Defaults to -(width // 2) so the turtle origin is in the middle of the
+            image.
+        top (int | float | None): y coordinate of the centre of the first row.
+            Defaults to height // 2.
+        scale (int | float): number of pixels per unit of turtle distance.
+        first_column (int): column of a larger image that the first column of this
+            raster is, so a tile of a large image can be drawn on its own. left is the
+            x coordinate of column 0 of the larger image.
+        first_row (int): row of a larger image that the first row of this raster is.
+            top is the y coordinate of row 0 of the larger image.
+
+    """
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        background: Any = "white",
+        left: int | float | None = None,
+        top: int | float | None = None,
+        scale: int | float = 1.0,
+        first_column: int = 0,
+        first_row: int = 0,
+    ):
+        self.width = width
+        self.height = height
+        self.left = -(width // 2) if left is None else left
+        self.top = height // 2 if top is None else top
+        self.scale = scale
+        self.first_column = first_column
+        self.first_row = first_row
+        self.pixels = np.empty((height, width, 3), dtype=np.uint8)
+        self.pixels[...] = colour_to_rgb(background)
+        self._colours: dict[Any, tuple[int, int, int]] = {}
+
+    def _rgb(self, colour: Any) -> tuple[int, int, int]:
+        """Look up colour, caching the conversion."""
+        try:
+            return self._colours[colour]
+        except KeyError:
+            rgb = colour_to_rgb(colour)
+            self._colours[colour] = rgb
+            return rgb
+
+    def _pixel_window(
+        self, min_x: float, min_y: float, max_x: float, max_y: float
+    ) -> tuple[int, int, int, int] | None:
+        """Get the column and row ranges of pixel centres inside a bounding box."""
+        scale = self.scale
+
+        # indices in the larger image this raster is part of, made relative to the
+        # first row and column of this raster
+        column_start = int(np.ceil((min_x - self.left) * scale - _EPSILON))
+        column_stop = int(np.floor((max_x - self.left) * scale + _EPSILON)) + 1
+        row_start = int(np.ceil((self.top - max_y) * scale - _EPSILON))
+        row_stop = int(np.floor((self.top - min_y) * scale + _EPSILON)) + 1
+
+        column_start = max(column_start - self.first_column, 0)
+        column_stop = min(column_stop - self.first_column, self.width)
+        row_start = max(row_start - self.first_row, 0)
+        row_stop = min(row_stop - self.first_row, self.height)
+
+        if column_start >= column_stop or row_start >= row_stop:
+            return None
+
+        return column_start, column_stop, row_start, row_stop
+
+    def _column_centres(self, start: int, stop: int) -> NDArray[np.float64]:
+        """Get x coordinates of the centres of columns start to stop."""
+        columns = np.arange(start, stop) + self.first_column
+        return self.left + columns / self.scale
+
+    def _row_centres(self, start: int, stop: int) -> NDArray[np.float64]:
+        """Get y coordinates of the centres of rows start to stop."""
+        rows = np.arange(start, stop) + self.first_row
+        return self.top - rows / self.scale
+
+    def draw_polyline(
+        self, points: Iterable[Vec2D] | NDArray, colour: Any, width: int | float
+    ) -> None:
+        """Draw a line through points with round caps and joins."""
+        coordinates = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        radius = max(width, 1) / 2
+        rgb = self._rgb(colour)
+
+        if len(coordinates) == 1:
+            self._draw_capsule(coordinates[0], coordinates[0], radius, rgb)
+
+        for start, end in zip(coordinates[:-1], coordinates[1:], strict=True):
+            self._draw_capsule(start, end, radius, rgb)
+
+    def _draw_capsule(
+        self,
+        start: NDArray,
+        end: NDArray,
+        radius: float,
+        rgb: tuple[int, int, int],
+    ) -> None:
+        """Paint pixels within radius of the segment start -> end."""
+        # lines at least a pixel wide paint any pixel they touch, so measure distance
+        # to the nearest point of each pixel rather than its centre
+        half_pixel = 0.5 / self.scale if radius * self.scale >= 0.5 else 0.0
+
+        reach = radius + half_pixel
+
+        window = self._pixel_window(
+            min(start[0], end[0]) - reach,
+            min(start[1], end[1]) - reach,
+            max(start[0], end[0]) + reach,
+            max(start[1], end[1]) + reach,
+        )
+        if window is None:
+            return
+
+        column_start, column_stop, row_start, row_stop = window
+
+        xs = self._column_centres(column_start, column_stop) - start[0]
+        ys = self._row_centres(row_start, row_stop) - start[1]
+
+        dx, dy = end - start
+        length_squared = dx * dx + dy * dy
+
+        if length_squared == 0:
+            t = 0.0
+        else:
+            t = np.clip((xs[None, :] * dx + ys[:, None] * dy) / length_squared, 0, 1)
+
+        distance_x = np.maximum(np.abs(xs[None, :] - t * dx) - half_pixel, 0)
+        distance_y = np.maximum(np.abs(ys[:, None] - t * dy) - half_pixel, 0)
+
+        mask = distance_x**2 + distance_y**2 <= radius**2 + _EPSILON
+
+        self.pixels[row_start:row_stop, column_start:column_stop][mask] = rgb
+
+    def draw_polygon(self, points: Iterable[Vec2D] | NDArray, colour: Any) -> None:
+        """Fill a polygon, using the even-odd rule, with no outline."""
+        coordinates = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+
+        if len(coordinates) < 3:
+            return
+
+        window = self._pixel_window(
+            *(coordinates.min(axis=0) - 1), *(coordinates.max(axis=0) + 1)
+        )
+        if window is None:
+            return
+
+        column_start, column_stop, row_start, row_stop = window
+
+        xs = self._column_centres(column_start, column_stop)
+        ys = self._row_centres(row_start, row_stop)
+
+        # any pixel touched by the polygon is painted, approximated by sampling at
+        # the top and bottom of each pixel and widening the spans by half a pixel
+        half_pixel = 0.5 / self.scale + _EPSILON
+        mask = self._polygon_row_mask(coordinates, xs, ys - half_pixel, half_pixel) | (
+            self._polygon_row_mask(coordinates, xs, ys + half_pixel, half_pixel)
+        )
+
+        self.pixels[row_start:row_stop, column_start:column_stop][mask] = self._rgb(
+            colour
+        )
+
+    @staticmethod
+    def _polygon_row_mask(
+        coordinates: NDArray, xs: NDArray, ys: NDArray, pad: float
+    ) -> NDArray:
+        """Get (len(ys), len(xs)) mask of pixels inside the polygon.
+
+        A pixel is inside if its x coordinate is within pad of a span inside the
+        polygon at its y coordinate. All edge crossings for all rows are computed in
+        one pass, sorted per row and paired up into spans which are painted with a
+        cumulative sum.
+
+        """
+        x0, y0 = coordinates[:, 0], coordinates[:, 1]
+        x1, y1 = np.roll(x0, -1), np.roll(y0, -1)
+
+        crosses = (np.minimum(y0, y1)[None, :] <= ys[:, None]) & (
+            ys[:, None] < np.maximum(y0, y1)[None, :]
+        )
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            crossing_x = (
+                x0[None, :]
+                + (ys[:, None] - y0[None, :]) * ((x1 - x0) / (y1 - y0))[None, :]
+            )
+
+        crossing_x = np.sort(np.where(crosses, crossing_x, np.inf), axis=1)
+
+        span_starts = crossing_x[:, 0::2]
+        span_ends = crossing_x[:, 1::2]
+        n_spans = min(span_starts.shape[1], span_ends.shape[1])
+        span_starts, span_ends = span_starts[:, :n_spans], span_ends[:, :n_spans]
+
+        valid = np.isfinite(span_ends)
+        rows = np.broadcast_to(np.arange(len(ys))[:, None], valid.shape)[valid]
+
+        first_column = np.searchsorted(xs, span_starts[valid] - pad, side="left")
+        stop_column = np.searchsorted(xs, span_ends[valid] + pad, side="right")
+
+        changes = np.zeros((len(ys), len(xs) + 1), dtype=np.int32)
+        np.add.at(changes, (rows, first_column), 1)
+        np.add.at(changes, (rows, stop_column), -1)
+
+        return np.cumsum(changes[:, :-1], axis=1) > 0
+
+    def draw_dot(
+        self, position: Vec2D | NDArray, size: int | float, colour: Any
+    ) -> None:
+        """Draw a filled circle of diameter size."""
+        centre = np.asarray(position, dtype=np.float64)
+        self._draw_capsule(centre, centre, size / 2, self._rgb(colour))
+
+    def to_image(self) -> Image.Image:
+        """Get the raster as a PIL Image."""
+        return Image.fromarray(self.pixels, mode="RGB")
+
+
+class RasterTurtle(HeadlessTurtle):
+    """Turtle that draws into a NumPy RGB array instead of a Tk canvas.
+
+    Args:
+        width (int): width of the image in pixels.
+        height (int): height of the image in pixels.
+        background (Any): background colour of the image.
+        left (int | float | None): x coordinate of the centre of the first column.
+        top (int | float | None): y coordinate of the centre of the first row.
+        scale (int | float): number of pixels per unit of turtle distance.
+        first_column (int): column of a larger image the raster starts at.
+        first_row (int): row of a larger image the raster starts at.
+
+    """
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        background: Any = "white",
+        left: int | float | None = None,
+        top: int | float | None = None,
+        scale: int | float = 1.0,
+        first_column: int = 0,
+        first_row: int = 0,
+    ):
+        super().__init__()
+        self.raster = Raster(
+            width=width,
+            height=height,
+            background=background,
+            left=left,
+            top=top,
+            scale=scale,
+            first_column=first_column,
+            first_row=first_row,
+        )
+
+    def _draw_line(
+        self, points: Sequence[Vec2D] | NDArray, colour: Any, width: int | float
+    ) -> None:
+        self.raster.draw_polyline(points, colour, width)
+
+    def _draw_polygon(self, points: Sequence[Vec2D] | NDArray, colour: Any) -> None:
+        self.raster.draw_polygon(points, colour)
+
+    def _draw_dot(
+        self, position: Vec2D | NDArray, size: int | float, colour: Any
+    ) -> None:
+        self.raster.draw_dot(position, size, colour)
+
+    def get_array(self) -> NDArray[np.uint8]:
+        """Get the (height, width, 3) array of the drawing so far."""
+        self._new_line()
+        return self.raster.pixels
+
+    def get_image(self) -> Image.Image:
+        """Get the drawing so far as a PIL Image."""
+        self._new_line()
+        return self.raster.to_image()
@@ -0,0 +1,282 @@
+"""Record turtle drawings into a display list that can be replayed later."""
+
+import json
+from collections.abc import Sequence
+from enum import IntEnum
+from os import PathLike
+from turtle import RawTurtle, Vec2D
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+from ..helpers.turtle import draw_polyline
+from .headless import HeadlessTurtle
+
+
+class Opcode(IntEnum):
+    """Types of primitive held in a DisplayList."""
+
+    LINE = 0
+    POLYGON = 1
+    DOT = 2
+
+
+class DisplayList:
+    """Array backed list of the primitives making up a drawing.
+
+    Primitive i has type opcodes[i], its points are
+    coordinates[offsets[i]:offsets[i + 1]] and its colour and size are
+    styles[style_indices[i]]. The size is the pen width for lines, the diameter for
+    dots and None for polygons.
+
+    Args:
+        opcodes (NDArray[np.uint8]): Opcode of each primitive.
+        offsets (NDArray[np.int64]): Start of each primitive's points in coordinates,
+            with a final entry equal to len(coordinates).
+        coordinates (NDArray[np.float64]): (n, 2) array of the points of all
+            primitives.
+        style_indices (NDArray[np.int32]): Index into styles for each primitive.
+        styles (list[tuple[Any, int | float | None]]): Unique (colour, size) pairs.
+
+    """
+
+    def __init__(
+        self,
+        opcodes: NDArray[np.uint8],
+        offsets: NDArray[np.int64],
+        coordinates: NDArray[np.float64],
+        style_indices: NDArray[np.int32],
+        styles: list[tuple[Any, int | float | None]],
+    ):
+        if len(offsets) != len(opcodes) + 1:
+            raise ValueError("offsets must have one more entry than opcodes.")
+
+        if len(style_indices) != len(opcodes):
+            raise ValueError("style_indices must have the same length as opcodes.")
+
+        self.opcodes = opcodes
+        self.offsets = offsets
+        self.coordinates = coordinates
+        self.style_indices = style_indices
+        self.styles = styles
+
+    def __len__(self) -> int:
+        return len(self.opcodes)
+
+    def __eq__(self, other: Any) -> bool:
+        """Check if the display lists have the same primitives, in the same order."""
+        if not isinstance(other, DisplayList):
+            return False
+
+        return (
+            np.array_equal(self.opcodes, other.opcodes)
+            and np.array_equal(self.offsets, other.offsets)
+            and np.array_equal(self.coordinates, other.coordinates)
+            and [self.styles[i] for i in self.style_indices.tolist()]
+            == [other.styles[i] for i in other.style_indices.tolist()]
+        )
+
+    def get_bounding_boxes(self) -> NDArray[np.float64]:
+        """Get (n, 4) array of min x, min y, max x and max y of each primitive's points.
+
+        Pen sizes are not included, so lines and dots extend beyond their box.
+
+        """
+        if len(self) == 0:
+            return np.empty((0, 4), dtype=np.float64)
+
+        starts = self.offsets[:-1]
+
+        return np.concatenate(
+            (
+                np.minimum.reduceat(self.coordinates, starts, axis=0),
+                np.maximum.reduceat(self.coordinates, starts, axis=0),
+            ),
+            axis=1,
+        )
+
+    def save(self, file: str | PathLike) -> None:
+        """Save the display list to a .npz file."""
+        np.savez_compressed(
+            file,
+            opcodes=self.opcodes,
+            offsets=self.offsets,
+            coordinates=self.coordinates,
+            style_indices=self.style_indices,
+            styles=np.array(json.dumps(self.styles)),
+        )
+
+    @classmethod
+    def load(cls, file: str | PathLike) -> "DisplayList":
+        """Load a display list saved with the save method."""
+        with np.load(file) as data:
+            styles = [
+                (tuple(colour) if isinstance(colour, list) else colour, size)
+                for colour, size in json.loads(str(data["styles"]))
+            ]
+
+            return cls(
+                opcodes=data["opcodes"],
+                offsets=data["offsets"],
+                coordinates=data["coordinates"],
+                style_indices=data["style_indices"],
+                styles=styles,
+            )
+
+    def replay(
+        self,
+        turtle: RawTurtle,
+        scale: int | float = 1,
+        indices: NDArray[np.int64] | None = None,
+    ) -> None:
+        """Draw the primitives with turtle, scaling all coordinates and sizes.
+
+        A HeadlessTurtle is passed the primitives directly, any other turtle (e.g. one
+        on a Tk screen) draws them with turtle commands, with each line drawn as a
+        single item by draw_polyline. The pen colour, pen size, fill colour and pen
+        up or down state of the turtle are restored once the primitives are drawn.
+        If indices are passed only those primitives are drawn, in the order given.
+
+        """
+        coordinates = self.coordinates if scale == 1 else self.coordinates * scale
+
+        pen_state = None
+
+        if isinstance(turtle, HeadlessTurtle):
+            # finish the line being drawn, so it is not drawn over the primitives
+            turtle._new_line()
+            draw_line = turtle._draw_line
+            draw_polygon = turtle._draw_polygon
+            draw_dot = turtle._draw_dot
+        else:
+            draw_line, draw_polygon, draw_dot = _turtle_drawing_functions(turtle)
+            pen_state = (
+                turtle.pencolor(),
+                turtle.pensize(),
+                turtle.fillcolor(),
+                turtle.isdown(),
+            )
+
+        if indices is None:
+            indices = np.arange(len(self))
+
+        styles = self.styles
+
+        for opcode, start, stop, style_index in zip(
+            self.opcodes[indices].tolist(),
+            self.offsets[indices].tolist(),
+            self.offsets[indices + 1].tolist(),
+            self.style_indices[indices].tolist(),
+            strict=True,
+        ):
+            colour, size = styles[style_index]
+            points = coordinates[start:stop]
+
+            if opcode == Opcode.LINE:
+                draw_line(points, colour, size * scale)
+            elif opcode == Opcode.POLYGON:
+                draw_polygon(points, colour)
+            else:
+                draw_dot(points[0], size * scale, colour)
+
+        if pen_state is not None:
+            pencolor, pensize, fillcolor, drawing = pen_state
+            turtle.pencolor(pencolor)
+            turtle.pensize(pensize)
+            turtle.fillcolor(fillcolor)
+            if drawing:
+                turtle.pendown()
+            else:
+                turtle.penup()
+
+
+def _turtle_drawing_functions(turtle: RawTurtle) -> tuple:
+    """Get functions drawing each primitive with turtle commands."""
+
+    def draw_line(points: NDArray, colour: Any, width: int | float) -> None:
+        draw_polyline(turtle=turtle, points=points, colour=colour, size=width)
+
+    def draw_polygon(points: NDArray, colour: Any) -> None:
+        turtle.penup()
+        turtle.goto(*points[0])
+        turtle.fillcolor(colour)
+        turtle.begin_fill()
+        for x, y in points[1:]:
+            turtle.goto(x, y)
+        turtle.end_fill()
+
+    def draw_dot(position: NDArray, size: int | float, colour: Any) -> None:
+        turtle.penup()
+        turtle.goto(*position)
+        turtle.dot(size, colour)  # type: ignore
+
+    return draw_line, draw_polygon, draw_dot
+
+
+class RecordingTurtle(HeadlessTurtle):
+    """Turtle that records what it draws into a DisplayList.
+
+    Drawing code is run once against a RecordingTurtle and the resulting display list
+    can then be saved, or replayed onto other turtles at any scale, without running
+    the drawing code again.
+
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._opcodes: list[int] = []
+        self._offsets: list[int] = [0]
+        self._points: list[Sequence[Vec2D] | NDArray] = []
+        self._style_indices: list[int] = []
+        self._styles: dict[tuple[Any, int | float | None], int] = {}
+
+    def _record(
+        self,
+        opcode: Opcode,
+        points: Sequence[Vec2D] | NDArray,
+        colour: Any,
+        size: int | float | None,
+    ) -> None:
+        """Append primitive to the recorded lists."""
+        style = (colour, size)
+        style_index = self._styles.setdefault(style, len(self._styles))
+
+        self._opcodes.append(opcode)
+        self._offsets.append(self._offsets[-1] + len(points))
+        self._points.append(points)
+        self._style_indices.append(style_index)
+
+    def _draw_line(
+        self, points: Sequence[Vec2D] | NDArray, colour: Any, width: int | float
+    ) -> None:
+        self._record(Opcode.LINE, points, colour, width)
+
+    def _draw_polygon(self, points: Sequence[Vec2D] | NDArray, colour: Any) -> None:
+        self._record(Opcode.POLYGON, points, colour, None)
+
+    def _draw_dot(
+        self, position: Vec2D | NDArray, size: int | float, colour: Any
+    ) -> None:
+        self._record(
+            Opcode.DOT, np.asarray(position, dtype=np.float64)[None, :], colour, size
+        )
+
+    def get_display_list(self) -> DisplayList:
+        """Get the primitives drawn so far as a DisplayList."""
+        self._new_line()
+
+        if self._points:
+            coordinates = np.concatenate(
+                [np.asarray(points, dtype=np.float64) for points in self._points]
+            ).reshape(-1, 2)
+        else:
+            coordinates = np.empty((0, 2), dtype=np.float64)
+
+        return DisplayList(
+            opcodes=np.array(self._opcodes, dtype=np.uint8),
+            offsets=np.array(self._offsets, dtype=np.int64),
+            coordinates=coordinates,
+            style_indices=np.array(self._style_indices, dtype=np.int32),
+            styles=list(self._styles),
+        )
@@ -0,0 +1,216 @@
+"""Turtle wrapper dropping calls that would not change the wrapped turtle."""
+
+from collections import Counter
+from collections.abc import Sequence
+from turtle import RawTurtle, Vec2D
+from typing import Any
+
+from numpy.typing import NDArray
+
+from ..helpers.turtle import draw_polyline
+from ..instrumentation import increment_counter
+from .headless import _colour_from_args
+
+
+class StateTrackingTurtle(RawTurtle):
+    """Turtle passing calls on to another turtle, skipping calls that do nothing.
+
+    The pen colour, pen size, fill colour and position are cached so setting them to
+    their current value, or reading them, does not reach the wrapped turtle. Pen up
+    and down are only passed on when the turtle next moves or draws, so jumping to
+    the current position (penup, goto, pendown) makes no calls at all. On a Tk
+    screen each call avoided is a round trip to Tk avoided.
+
+    Calls that were not passed on are counted in elided_calls, by method name, and
+    in the turtle_calls_elided instrumentation counter. The command line tool adds
+    elided_calls to the turtle_calls_elided[{name}] counters once the drawing is
+    finished, so they are in the Profiler report.
+
+    Like HeadlessTurtle, RawTurtle.__init__ is not called and only the subset of the
+    turtle interface used by the drawings is implemented. The wrapped turtle should
+    not be used directly while wrapped, as the cached state would go out of date.
+
+    Args:
+        turtle (RawTurtle): turtle to pass calls on to.
+
+    """
+
+    def __init__(self, turtle: RawTurtle):
+        self.turtle = turtle
+        self.elided_calls: Counter[str] = Counter()
+
+        self._position = Vec2D(*turtle.position())
+        self._drawing = turtle.isdown()
+        self._turtle_drawing = self._drawing
+        self._pen_calls = 0
+        self._pencolor: Any = turtle.pencolor()
+        self._pensize: int | float = turtle.pensize()
+        self._fillcolor: Any = turtle.fillcolor()
+
+    def _elide(self, name: str, count: int = 1) -> None:
+        self.elided_calls[name] += count
+        increment_counter("turtle_calls_elided", count)
+
+    def flush(self) -> None:
+        """Pass any pen up or down waiting for the turtle to move on to the turtle."""
+        if self._pen_calls == 0:
+            return
+
+        if self._drawing != self._turtle_drawing:
+            if self._drawing:
+                self.turtle.pendown()
+            else:
+                self.turtle.penup()
+            self._turtle_drawing = self._drawing
+            self._pen_calls -= 1
+
+        if self._pen_calls > 0:
+            self._elide("pen", self._pen_calls)
+        self._pen_calls = 0
+
+    def polyline(
+        self, points: Sequence[Vec2D] | NDArray, colour: Any, width: int | float
+    ) -> None:
+        """Draw a line through points with draw_polyline on the wrapped turtle."""
+        self.flush()
+        draw_polyline(self.turtle, points, colour, width)
+
+        self._position = Vec2D(*points[-1])
+        self._drawing = self._turtle_drawing = True
+
+    def goto(self, x, y=None) -> None:
+        """Move turtle to position, unless already there with the pen up."""
+        end = Vec2D(*x) if y is None else Vec2D(x, y)
+
+        if end == self._position and not self._drawing:
+            self._elide("goto")
+            return
+
+        self.flush()
+        self.turtle.goto(end)
+        self._position = end
+
+    setpos = setposition = goto  # type: ignore
+
+    def position(self) -> Vec2D:  # type: ignore
+        return self._position
+
+    pos = position
+
+    def xcor(self) -> float:
+        return self._position[0]
+
+    def ycor(self) -> float:
+        return self._position[1]
+
+    def heading(self) -> float:
+        return self.turtle.heading()
+
+    def setheading(self, to_angle: int | float) -> None:
+        self.turtle.setheading(to_angle)
+
+    seth = setheading
+
+    def left(self, angle: int | float) -> None:
+        self.turtle.left(angle)
+
+    lt = left
+
+    def right(self, angle: int | float) -> None:
+        self.turtle.right(angle)
+
+    rt = right
+
+    def forward(self, distance: int | float) -> None:
+        self.flush()
+        self.turtle.forward(distance)
+        self._position = Vec2D(*self.turtle.position())
+
+    fd = forward
+
+    def penup(self) -> None:
+        self._pen_calls += 1
+        self._drawing = False
+
+    pu = up = penup
+
+    def pendown(self) -> None:
+        self._pen_calls += 1
+        self._drawing = True
+
+    pd = down = pendown
+
+    def isdown(self) -> bool:
+        return self._drawing
+
+    def pensize(self, width: int | float | None = None):
+        if width is None:
+            return self._pensize
+        if width == self._pensize:
+            self._elide("pensize")
+            return
+        self.turtle.pensize(width)  # type: ignore
+        self._pensize = width
+
+    width = pensize  # type: ignore
+
+    def pencolor(self, *args):
+        if not args:
+            return self._pencolor
+        colour = _colour_from_args(args)
+        if colour == self._pencolor:
+            self._elide("pencolor")
+            return
+        self.turtle.pencolor(colour)
+        self._pencolor = colour
+
+    def fillcolor(self, *args):
+        if not args:
+            return self._fillcolor
+        colour = _colour_from_args(args)
+        if colour == self._fillcolor:
+            self._elide("fillcolor")
+            return
+        self.turtle.fillcolor(colour)
+        self._fillcolor = colour
+
+    def filling(self) -> bool:
+        return self.turtle.filling()
+
+    def begin_fill(self) -> None:
+        self.flush()
+        self.turtle.begin_fill()
+
+    def end_fill(self) -> None:
+        self.flush()
+        self.turtle.end_fill()
+
+    def dot(self, size: Any = None, *color: Any) -> None:
+        self.flush()
+        self.turtle.dot(size, *color)
+
+    def circle(
+        self,
+        radius: int | float,
+        extent: int | float | None = None,
+        steps: int | None = None,
+    ) -> None:
+        self.flush()
+        self.turtle.circle(radius, extent, steps)
+        self._position = Vec2D(*self.turtle.position())
+
+    def hideturtle(self) -> None:
+        self.turtle.hideturtle()
+
+    ht = hideturtle
+
+    def showturtle(self) -> None:
+        self.turtle.showturtle()
+
+    st = showturtle
+
+    def isvisible(self) -> bool:
+        return self.turtle.isvisible()
+
+    def speed(self, speed=None):
+        return self.turtle.speed(speed)
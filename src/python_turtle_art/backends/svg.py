@@ -0,0 +1,102 @@
+"""Write turtle drawings to an SVG file as they are drawn."""
+
+from collections.abc import Sequence
+from io import TextIOBase
+from turtle import Vec2D
+from typing import Any
+
+from numpy.typing import NDArray
+
+from .headless import HeadlessTurtle
+from .raster import colour_to_rgb
+
+
+class SvgTurtle(HeadlessTurtle):
+    """Turtle that streams what it draws to a file handle as SVG elements.
+
+    Each line, fill and dot is written as soon as it is finished, so memory use does
+    not grow with the size of the drawing. The closing tag is written by close, or on
+    leaving the turtle's context manager.
+
+    Turtle coordinates are used in the SVG with the y axis flipped, the viewBox is
+    centred on the turtle origin.
+
+    Args:
+        file (TextIOBase): open text file handle to write the SVG to.
+        width (int): width of the image.
+        height (int): height of the image.
+        background (Any): colour of the background of the image, or None for a
+            transparent background.
+
+    """
+
+    def __init__(
+        self, file: TextIOBase, width: int, height: int, background: Any = "white"
+    ):
+        super().__init__()
+        self.file = file
+        self._colours: dict[Any, str] = {}
+
+        left = -(width // 2)
+        top = -(height // 2)
+
+        file.write(
+            '<svg xmlns="http://www.w3.org/2000/svg" '
+            f'width="{width}" height="{height}" '
+            f'viewBox="{left} {top} {width} {height}">\n'
+        )
+
+        if background is not None:
+            file.write(
+                f'<rect x="{left}" y="{top}" width="{width}" height="{height}" '
+                f'fill="{self._colour(background)}"/>\n'
+            )
+
+    def __enter__(self) -> "SvgTurtle":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Finish the current line and write the closing svg tag."""
+        self._new_line()
+        self.file.write("</svg>\n")
+
+    def _colour(self, colour: Any) -> str:
+        """Get colour as a hex string, caching the conversion."""
+        try:
+            return self._colours[colour]
+        except KeyError:
+            hex_colour = "#{:02x}{:02x}{:02x}".format(*colour_to_rgb(colour))
+            self._colours[colour] = hex_colour
+            return hex_colour
+
+    def _draw_line(
+        self, points: Sequence[Vec2D] | NDArray, colour: Any, width: int | float
+    ) -> None:
+        self.file.write(
+            f'<polyline points="{_format_points(points)}" fill="none" '
+            f'stroke="{self._colour(colour)}" stroke-width="{max(width, 1)}" '
+            'stroke-linecap="round" stroke-linejoin="round"/>\n'
+        )
+
+    def _draw_polygon(self, points: Sequence[Vec2D] | NDArray, colour: Any) -> None:
+        self.file.write(
+            f'<polygon points="{_format_points(points)}" '
+            f'fill="{self._colour(colour)}" fill-rule="evenodd"/>\n'
+        )
+
+    def _draw_dot(
+        self, position: Vec2D | NDArray, size: int | float, colour: Any
+    ) -> None:
+        x, y = position
+        self.file.write(
+            f'<circle cx="{x:.3f}" cy="{-y:.3f}" r="{size / 2}" '
+            f'fill="{self._colour(colour)}"/>\n'
+        )
+
+
+def _format_points(points: Sequence[Vec2D] | NDArray) -> str:
+    """Format points as an SVG points attribute, flipping the y axis."""
+    return " ".join(f"{x:.3f},{-y:.3f}" for x, y in points)
@@ -0,0 +1,300 @@
+"""Rasterise recorded drawings in tiles, in parallel across processes."""
+
+import os
+from collections.abc import Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, NamedTuple
+
+import numpy as np
+from numpy.typing import NDArray
+from PIL import Image
+
+from .raster import RasterTurtle, colour_to_rgb
+from .recording import DisplayList, Opcode
+
+# number of tiles per worker process submitted but not yet yielded by _render_tiles
+TILES_IN_FLIGHT_PER_PROCESS = 2
+
+
+class Tile(NamedTuple):
+    """Rectangle of pixels of a TiledRaster."""
+
+    first_row: int
+    first_column: int
+    height: int
+    width: int
+
+
+class TiledRaster:
+    """Large RGB image rasterised from a DisplayList one tile at a time.
+
+    The image is split into tiles of tile_size x tile_size pixels. Each recorded
+    primitive is binned into the tiles its bounding box overlaps and every tile is
+    drawn independently, with only its own primitives, on a RasterTurtle covering
+    just that tile. Tiles are drawn in worker processes and the output is identical
+    to replaying the display list onto a single RasterTurtle of the full size.
+
+    Args:
+        width (int): width of the image in pixels.
+        height (int): height of the image in pixels.
+        tile_size (int): width and height of the tiles in pixels.
+        background (Any): background colour of the image.
+        left (int | float | None): x coordinate of the centre of the first column.
+            Defaults to -(width // 2) so the turtle origin is in the middle of the
+            image.
+        top (int | float | None): y coordinate of the centre of the first row.
+            Defaults to height // 2.
+        scale (int | float): number of pixels per unit of turtle distance.
+
+    """
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        tile_size: int = 1024,
+        background: Any = "white",
+        left: int | float | None = None,
+        top: int | float | None = None,
+        scale: int | float = 1.0,
+    ):
+        if tile_size <= 0:
+            raise ValueError("tile_size must be greater than zero.")
+
+        self.width = width
+        self.height = height
+        self.tile_size = tile_size
+        self.background = background
+        self.left = -(width // 2) if left is None else left
+        self.top = height // 2 if top is None else top
+        self.scale = scale
+
+    def get_tiles(self) -> list[Tile]:
+        """Get the tiles covering the image, row by row."""
+        return [
+            Tile(
+                first_row=first_row,
+                first_column=first_column,
+                height=min(self.tile_size, self.height - first_row),
+                width=min(self.tile_size, self.width - first_column),
+            )
+            for first_row in range(0, self.height, self.tile_size)
+            for first_column in range(0, self.width, self.tile_size)
+        ]
+
+    def bin_primitives(
+        self, display_list: DisplayList
+    ) -> dict[Tile, NDArray[np.int64]]:
+        """Get the indices of the primitives that may paint pixels in each tile.
+
+        Bounding boxes are padded by half the pen size, for lines and dots, and by
+        a pixel so every pixel a primitive can paint is inside its padded box.
+        Tiles with no primitives are left out.
+
+        """
+        if len(display_list) == 0:
+            return {}
+
+        bounding_boxes = display_list.get_bounding_boxes()
+
+        sizes = np.array(
+            [size or 0 for _, size in display_list.styles], dtype=np.float64
+        )[display_list.style_indices]
+        sizes[display_list.opcodes == Opcode.LINE] = np.maximum(
+            sizes[display_list.opcodes == Opcode.LINE], 1
+        )
+        padding = sizes / 2 + 1 / self.scale + 1
+
+        first_columns = np.floor(
+            (bounding_boxes[:, 0] - padding - self.left) * self.scale
+        )
+        last_columns = np.ceil(
+            (bounding_boxes[:, 2] + padding - self.left) * self.scale
+        )
+        first_rows = np.floor((self.top - bounding_boxes[:, 3] - padding) * self.scale)
+        last_rows = np.ceil((self.top - bounding_boxes[:, 1] + padding) * self.scale)
+
+        bins = {}
+        for tile in self.get_tiles():
+            (indices,) = np.nonzero(
+                (first_columns < tile.first_column + tile.width)
+                & (last_columns >= tile.first_column)
+                & (first_rows < tile.first_row + tile.height)
+                & (last_rows >= tile.first_row)
+            )
+            if len(indices) > 0:
+                bins[tile] = indices
+
+        return bins
+
+    def _tile_turtle(self, tile: Tile) -> RasterTurtle:
+        return RasterTurtle(
+            width=tile.width,
+            height=tile.height,
+            background=self.background,
+            left=self.left,
+            top=self.top,
+            scale=self.scale,
+            first_column=tile.first_column,
+            first_row=tile.first_row,
+        )
+
+    def _render_tiles(
+        self, display_list: DisplayList, processes: int | None
+    ) -> Iterator[tuple[Tile, NDArray[np.uint8] | None]]:
+        """Yield each tile and its pixels, or None for tiles with no primitives.
+
+        Tiles are yielded as soon as they are drawn, in the order of get_tiles, so
+        they do not all have to be held in memory at once. At most
+        TILES_IN_FLIGHT_PER_PROCESS tiles per worker process are submitted ahead of
+        the tile being yielded, more are submitted as tiles are yielded, so tiles
+        finishing out of order are only held until the earlier tiles are done.
+
+        """
+        bins = self.bin_primitives(display_list)
+        tiles = self.get_tiles()
+
+        if processes == 1:
+            _set_worker_display_list(display_list)
+            try:
+                for tile in tiles:
+                    yield (
+                        tile,
+                        _render_tile(self, tile, bins[tile]) if tile in bins else None,
+                    )
+            finally:
+                _set_worker_display_list(None)
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=processes,
+            initializer=_set_worker_display_list,
+            initargs=(display_list,),
+        ) as executor:
+            binned_tiles = (tile for tile in tiles if tile in bins)
+            futures: dict[Tile, Future[NDArray[np.uint8]]] = {}
+
+            def submit_next_tile() -> None:
+                tile = next(binned_tiles, None)
+                if tile is not None:
+                    futures[tile] = executor.submit(
+                        _render_tile, self, tile, bins[tile]
+                    )
+
+            workers = processes or os.cpu_count() or 1
+            for _ in range(TILES_IN_FLIGHT_PER_PROCESS * workers):
+                submit_next_tile()
+
+            for tile in tiles:
+                if tile in futures:
+                    pixels = futures.pop(tile).result()
+                    submit_next_tile()
+                    yield tile, pixels
+                else:
+                    yield tile, None
+
+    def render(
+        self, display_list: DisplayList, processes: int | None = None
+    ) -> NDArray[np.uint8]:
+        """Draw display_list and stitch the tiles into one (height, width, 3) array.
+
+        Args:
+            display_list (DisplayList): primitives to draw.
+            processes (int | None): number of worker processes, defaults to the number
+                of CPUs. With 1 the tiles are drawn in this process.
+
+        """
+        image = np.empty((self.height, self.width, 3), dtype=np.uint8)
+        image[...] = colour_to_rgb(self.background)
+
+        for tile, pixels in self._render_tiles(display_list, processes):
+            if pixels is not None:
+                image[
+                    tile.first_row : tile.first_row + tile.height,
+                    tile.first_column : tile.first_column + tile.width,
+                ] = pixels
+
+        return image
+
+    def render_image(
+        self, display_list: DisplayList, processes: int | None = None
+    ) -> Image.Image:
+        """Draw display_list and stitch the tiles into one PIL Image."""
+        return Image.fromarray(self.render(display_list, processes), mode="RGB")
+
+    def write_tiles(
+        self,
+        display_list: DisplayList,
+        directory: str | os.PathLike,
+        levels: int = 1,
+        processes: int | None = None,
+    ) -> list[Path]:
+        """Draw display_list and write each tile to its own png, without stitching.
+
+        Tiles are written to {directory}/{level}/{row}_{column}.png, where row and
+        column are tile indices. Level 0 is drawn at the full scale and each further
+        level at half the scale of the previous one, so the levels form an image
+        pyramid.
+
+        Args:
+            display_list (DisplayList): primitives to draw.
+            directory (str | os.PathLike): directory to write the tiles to.
+            levels (int): number of levels of the pyramid to write.
+            processes (int | None): number of worker processes, defaults to the number
+                of CPUs. With 1 the tiles are drawn in this process.
+
+        """
+        directory = Path(directory)
+        files = []
+
+        for level in range(levels):
+            factor = 2**level
+            level_raster = TiledRaster(
+                width=max(self.width // factor, 1),
+                height=max(self.height // factor, 1),
+                tile_size=self.tile_size,
+                background=self.background,
+                left=self.left,
+                top=self.top,
+                scale=self.scale / factor,
+            )
+
+            level_directory = directory / str(level)
+            level_directory.mkdir(parents=True, exist_ok=True)
+
+            for tile, pixels in level_raster._render_tiles(display_list, processes):
+                if pixels is None:
+                    pixels = level_raster._tile_turtle(tile).raster.pixels
+
+                file = (
+                    level_directory / f"{tile.first_row // self.tile_size}_"
+                    f"{tile.first_column // self.tile_size}.png"
+                )
+                Image.fromarray(pixels, mode="RGB").save(file)
+                files.append(file)
+
+        return files
+
+
+# display list for the current worker process, set once when the worker starts so
+# it is not sent with every tile
+_worker_display_list: DisplayList | None = None
+
+
+def _set_worker_display_list(display_list: DisplayList | None) -> None:
+    global _worker_display_list
+    _worker_display_list = display_list
+
+
+def _render_tile(
+    tiled_raster: TiledRaster, tile: Tile, indices: NDArray[np.int64]
+) -> NDArray[np.uint8]:
+    """Draw the primitives in indices onto tile."""
+    if _worker_display_list is None:
+        raise ValueError("display list not set in worker process.")
+
+    turtle = tiled_raster._tile_turtle(tile)
+    _worker_display_list.replay(turtle, indices=indices)
+
+    return turtle.get_array()
@@ -0,0 +1,228 @@
+"""Render many seeds of a drawing in parallel with headless backends."""
+
+import json
+import os
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from time import perf_counter
+
+from .backends import RasterTurtle, SvgTurtle
+from .drawings import MODULE_DRAW_FUNCTION_MAPPING
+from .drawings.viewport import get_viewport
+
+BATCH_BACKEND_FILE_EXTENSIONS = {"raster": "png", "svg": "svg"}
+
+
+@dataclass(frozen=True)
+class BatchJob:
+    """Render of one seed of a drawing to a file.
+
+    Args:
+        drawing (str): name of the drawing in MODULE_DRAW_FUNCTION_MAPPING.
+        seed (int): seed passed to the drawing function.
+        output (Path): file to write the image to.
+        backend (str): "raster" to write a png or "svg" to write an svg.
+        width (int): width of the image.
+        height (int): height of the image.
+
+    """
+
+    drawing: str
+    seed: int
+    output: Path
+    backend: str
+    width: int
+    height: int
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    """Outcome of a BatchJob, seconds is the time taken to draw and write it.
+
+    If the job raised an exception error holds its description and seconds is None.
+
+    """
+
+    drawing: str
+    seed: int
+    output: str
+    seconds: float | None
+    error: str | None = None
+
+
+def render_job(job: BatchJob) -> BatchResult:
+    """Draw job with a new headless turtle and write it to job.output.
+
+    The image is written to a temporary file which is renamed once complete, so an
+    interrupted batch never leaves a partial output that would be skipped on resume.
+
+    """
+    start = perf_counter()
+
+    drawing_function = MODULE_DRAW_FUNCTION_MAPPING[job.drawing]
+    viewport = get_viewport(job.width, job.height)
+    partial_output = job.output.with_name(f"{job.output.name}.partial")
+
+    if job.backend == "raster":
+        turtle = RasterTurtle(width=job.width, height=job.height)
+        drawing_function(turtle=turtle, seed=job.seed, viewport=viewport)
+        turtle.get_image().save(partial_output, format="png")
+    elif job.backend == "svg":
+        with (
+            open(partial_output, "w") as file,
+            SvgTurtle(file=file, width=job.width, height=job.height) as svg_turtle,
+        ):
+            drawing_function(turtle=svg_turtle, seed=job.seed, viewport=viewport)
+    else:
+        raise ValueError(f"Unknown batch backend {job.backend}.")
+
+    os.replace(partial_output, job.output)
+
+    return BatchResult(
+        drawing=job.drawing,
+        seed=job.seed,
+        output=str(job.output),
+        seconds=perf_counter() - start,
+    )
+
+
+def get_batch_jobs(
+    drawing: str,
+    seeds: Iterable[int],
+    output_directory: Path,
+    backend: str = "raster",
+    width: int = 100,
+    height: int = 100,
+) -> list[BatchJob]:
+    """Get a job for each seed, writing to {drawing}_{seed}.{png|svg}."""
+    if drawing not in MODULE_DRAW_FUNCTION_MAPPING:
+        raise ValueError(f"Unknown drawing {drawing}.")
+
+    if backend not in BATCH_BACKEND_FILE_EXTENSIONS:
+        raise ValueError(f"Unknown batch backend {backend}.")
+
+    extension = BATCH_BACKEND_FILE_EXTENSIONS[backend]
+
+    return [
+        BatchJob(
+            drawing=drawing,
+            seed=seed,
+            output=output_directory / f"{drawing}_{seed}.{extension}",
+            backend=backend,
+            width=width,
+            height=height,
+        )
+        for seed in seeds
+    ]
+
+
+def run_batch(
+    drawing: str,
+    seeds: Iterable[int],
+    output_directory: str | os.PathLike,
+    processes: int | None = None,
+    backend: str = "raster",
+    width: int = 100,
+    height: int = 100,
+    progress: Callable[[str], None] = print,
+) -> list[BatchResult]:
+    """Render drawing for each seed across a pool of processes.
+
+    Seeds whose output file already exists are skipped, so a batch can be resumed by
+    running it again. The time taken by each job is reported through progress and
+    appended, as a line of JSON, to timings.jsonl in the output directory.
+
+    A job raising an exception does not stop the batch, a BatchResult with the error
+    is recorded for it and the remaining jobs are run. The number of failed jobs is
+    reported through progress at the end, failed seeds are rendered again when the
+    batch is resumed.
+
+    Args:
+        drawing (str): name of the drawing in MODULE_DRAW_FUNCTION_MAPPING.
+        seeds (Iterable[int]): seeds to render.
+        output_directory (str | os.PathLike): directory to write images to, created
+            if it does not exist.
+        processes (int | None): number of worker processes, defaults to the number
+            of CPUs. With 1 the jobs are run in this process.
+        backend (str): "raster" to write pngs or "svg" to write svgs.
+        width (int): width of the images.
+        height (int): height of the images.
+        progress (Callable[[str], None]): function passed progress messages.
+
+    """
+    output_directory = Path(output_directory)
+    output_directory.mkdir(parents=True, exist_ok=True)
+
+    jobs = get_batch_jobs(
+        drawing=drawing,
+        seeds=seeds,
+        output_directory=output_directory,
+        backend=backend,
+        width=width,
+        height=height,
+    )
+
+    pending_jobs = [job for job in jobs if not job.output.exists()]
+
+    if len(pending_jobs) < len(jobs):
+        progress(f"Skipping {len(jobs) - len(pending_jobs)} existing outputs.")
+
+    results: list[BatchResult] = []
+
+    with open(output_directory / "timings.jsonl", "a") as timings_file:
+
+        def record(result: BatchResult) -> None:
+            results.append(result)
+            timings_file.write(json.dumps(asdict(result)) + "\n")
+            timings_file.flush()
+            if result.error is None:
+                progress(
+                    f"[{len(results)}/{len(pending_jobs)}] seed {result.seed} "
+                    f"{result.seconds:.2f}s {result.output}"
+                )
+            else:
+                progress(
+                    f"[{len(results)}/{len(pending_jobs)}] seed {result.seed} "
+                    f"failed: {result.error}"
+                )
+
+        if processes == 1:
+            for job in pending_jobs:
+                try:
+                    result = render_job(job)
+                except Exception as error:
+                    result = _failed_result(job, error)
+                record(result)
+        elif pending_jobs:
+            with ProcessPoolExecutor(max_workers=processes) as executor:
+                futures = {
+                    executor.submit(render_job, job): job for job in pending_jobs
+                }
+                for future in as_completed(futures):
+                    try:
+                        result = future.result()
+                    except Exception as error:
+                        result = _failed_result(futures[future], error)
+                    record(result)
+
+    failed_seeds = [result.seed for result in results if result.error is not None]
+    if failed_seeds:
+        progress(
+            f"{len(failed_seeds)} of {len(pending_jobs)} jobs failed, seeds "
+            f"{', '.join(str(seed) for seed in sorted(failed_seeds))}."
+        )
+
+    return results
+
+
+def _failed_result(job: BatchJob, error: Exception) -> BatchResult:
+    """Get the BatchResult of job when it raised error."""
+    return BatchResult(
+        drawing=job.drawing,
+        seed=job.seed,
+        output=str(job.output),
+        seconds=None,
+        error=f"{type(error).__name__}: {error}",
+    )
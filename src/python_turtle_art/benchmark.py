@@ -0,0 +1,660 @@
+"""Benchmark suite timing geometry, filling, drawing, export and startup.
+
+Run with
+
+    DISABLE_BEARTYPE=1 python -m python_turtle_art.benchmark -o results.json
+
+Nothing is drawn on a Tk screen, drawings are made with headless turtles so no
+display is needed. Results are written to JSON and can be compared against the
+results from another commit with --compare.
+
+Each benchmark is timed over a number of repeats, then run once more under
+tracemalloc to record the peak memory allocated, the number of memory blocks
+allocated and not freed by the end of the run and the number of garbage
+collections triggered.
+
+Startup benchmarks time importing the command line tool in a new python process,
+with and without beartype, to keep track of import costs. Without beartype they
+also check that numpy, tkinter, Pillow and the modules used for profiling are not
+imported by the tool at startup, either on import or when parsing arguments.
+
+"""
+
+import gc
+import json
+import os
+import platform
+import random
+import re
+import subprocess
+import sys
+import tracemalloc
+from argparse import ArgumentParser, Namespace
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from functools import cache
+from io import BytesIO, StringIO
+from time import perf_counter
+from turtle import Vec2D
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .backends import (
+    DisplayList,
+    HeadlessTurtle,
+    RasterTurtle,
+    RecordingTurtle,
+    SvgTurtle,
+)
+from .drawings import MODULE_DRAW_FUNCTION_MAPPING
+from .drawings.pine_cones.pine_cone import PineCone, RandomPineConeFactory
+from .filling.stripes.stripes_calculation import (
+    get_filling_line_endpoints,
+    get_filling_line_spans,
+    get_filling_lines,
+)
+from .instrumentation import get_counters, reset_counters
+from .lines.offset_from_line import OffsetFromLine, offset_points_from_lines
+from .lines.quadratic_bezier_curve import get_points_on_quadratic_bezier_curve
+from .polygons.clipping import clip_polygon
+from .polygons.is_convex import is_convex, is_convex_many
+from .polygons.kites.convex_kite import ConvexKite
+from .polygons.kites.curved_kite import CurvedKite
+from .polygons.point_in_polygon import polygons_overlap_polygon
+
+# modules that importing the command line tool should not import, as they are only
+# needed once a drawing is made, saved or profiled
+CLI_NOT_IMPORTED_MODULES = ("numpy", "tkinter", "PIL", "cProfile", "json", "pkgutil")
+
+
+class NullTurtle(HeadlessTurtle):
+    """Turtle that tracks pen state but discards everything it draws."""
+
+    def _draw_line(self, points, colour, width) -> None:
+        pass
+
+    def _draw_polygon(self, points, colour) -> None:
+        pass
+
+    def _draw_dot(self, position, size, colour) -> None:
+        pass
+
+
+@dataclass
+class Benchmark:
+    """A function to time, with a setup function creating its arguments.
+
+    The setup function is called before every run and is not timed, so functions
+    that change their arguments can be run repeatedly.
+
+    Args:
+        name (str): name of the benchmark.
+        group (str): group the benchmark belongs to.
+        function (Callable): function to time.
+        setup (Callable[[], tuple]): function returning the arguments for function.
+        repeats (int): number of timed runs.
+
+    """
+
+    name: str
+    group: str
+    function: Callable[..., Any]
+    setup: Callable[[], tuple] = tuple
+    repeats: int = 5
+
+
+@dataclass
+class BenchmarkResult:
+    """Measurements from running a Benchmark.
+
+    retained_blocks is the number of memory blocks allocated during the memory run
+    that were still alive at its end, not the total number of allocations.
+    counters holds the instrumentation counters incremented during the memory run.
+
+    """
+
+    name: str
+    group: str
+    wall_times: list[float] = field(default_factory=list)
+    peak_memory: int = 0
+    retained_blocks: int = 0
+    gc_collections: int = 0
+    counters: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def wall_time_min(self) -> float:
+        return min(self.wall_times)
+
+    @property
+    def wall_time_mean(self) -> float:
+        return sum(self.wall_times) / len(self.wall_times)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Get results as a dict, including the min and mean wall time."""
+        return {
+            **asdict(self),
+            "wall_time_min": self.wall_time_min,
+            "wall_time_mean": self.wall_time_mean,
+        }
+
+
+def run_benchmark(benchmark: Benchmark, repeats: int | None = None) -> BenchmarkResult:
+    """Time benchmark then measure its memory use and counters in one more run.
+
+    Args:
+        benchmark (Benchmark): benchmark to run.
+        repeats (int | None): number of timed runs, overriding benchmark.repeats.
+
+    """
+    result = BenchmarkResult(name=benchmark.name, group=benchmark.group)
+
+    for _ in range(benchmark.repeats if repeats is None else repeats):
+        args = benchmark.setup()
+        gc.collect()
+
+        start = perf_counter()
+        benchmark.function(*args)
+        result.wall_times.append(perf_counter() - start)
+
+    args = benchmark.setup()
+    gc.collect()
+
+    collections_before = sum(stats["collections"] for stats in gc.get_stats())
+    reset_counters()
+
+    tracemalloc.start()
+    try:
+        benchmark.function(*args)
+        _, result.peak_memory = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    result.gc_collections = (
+        sum(stats["collections"] for stats in gc.get_stats()) - collections_before
+    )
+    result.retained_blocks = sum(
+        statistic.count for statistic in snapshot.statistics("filename")
+    )
+    result.counters = get_counters()
+
+    return result
+
+
+def _curved_kite() -> CurvedKite:
+    return CurvedKite.from_origin_and_dimensions(
+        origin=Vec2D(0, 0),
+        off_lines=(
+            OffsetFromLine(offset=50),
+            OffsetFromLine(offset=10),
+            OffsetFromLine(offset=15),
+            OffsetFromLine(offset=50),
+        ),
+        height=1200,
+        width=800,
+        diagonal_intersection_along_height=0.45,
+    )
+
+
+def _stripes_kite() -> ConvexKite:
+    return ConvexKite.from_origin_and_dimensions(
+        origin=Vec2D(0, 0), height=1200, width=2000
+    ).rotate(20, Vec2D(0, 0))
+
+
+def _get_quadratic_bezier_curves() -> None:
+    for i in range(1000):
+        get_points_on_quadratic_bezier_curve(
+            start=Vec2D(0, 0), end=Vec2D(100, 0), off_line_point=Vec2D(i, 50)
+        )
+
+
+def _create_curved_kites() -> None:
+    for _ in range(200):
+        _curved_kite()
+
+
+def _pine_cone_factory() -> RandomPineConeFactory:
+    return RandomPineConeFactory(
+        origin=Vec2D(0, 0), height_range=(300, 350), rotation_range=(0, 10), seed=0
+    )
+
+
+def _pine_cone_kites() -> tuple[NDArray, NDArray]:
+    scene = _pine_cone_factory().create().build()
+    return scene.inner_kite_vertices, scene.outer_kite_vertices
+
+
+def _create_pine_cones() -> None:
+    for _ in range(20):
+        _pine_cone_factory().create()
+
+
+def _draw_pine_cone(pine_cone: PineCone) -> None:
+    pine_cone.draw(NullTurtle())
+
+
+def _record_pine_cone(pine_cone: PineCone) -> DisplayList:
+    turtle = RecordingTurtle()
+    pine_cone.draw(turtle)
+    return turtle.get_display_list()
+
+
+def _draw_image(drawing: str) -> Callable[[], DisplayList]:
+    """Get function recording drawing, after seeding random."""
+
+    def draw_image() -> DisplayList:
+        random.seed(0)
+        turtle = RecordingTurtle()
+        MODULE_DRAW_FUNCTION_MAPPING[drawing](turtle=turtle)
+        return turtle.get_display_list()
+
+    return draw_image
+
+
+@cache
+def _recorded_image(drawing: str) -> DisplayList:
+    return _draw_image(drawing)()
+
+
+def _recorded_image_setup(drawing: str) -> Callable[[], tuple[DisplayList]]:
+    """Get setup function returning the recorded drawing, recording it only once."""
+
+    def setup() -> tuple[DisplayList]:
+        return (_recorded_image(drawing),)
+
+    return setup
+
+
+def _bounds(coordinates: NDArray) -> tuple[float, float, float, float]:
+    (left, bottom), (right, top) = coordinates.min(axis=0), coordinates.max(axis=0)
+    return float(left), float(bottom), float(right), float(top)
+
+
+def _export_png(display_list: DisplayList, scale: float = 0.25) -> bytes:
+    """Replay display list onto a raster covering the drawing and encode as png."""
+    left, bottom, right, top = _bounds(display_list.coordinates)
+    turtle = RasterTurtle(
+        width=int((right - left) * scale) + 1,
+        height=int((top - bottom) * scale) + 1,
+        left=left,
+        top=top,
+        scale=scale,
+    )
+    display_list.replay(turtle)
+
+    file = BytesIO()
+    turtle.get_image().save(file, format="png")
+    return file.getvalue()
+
+
+def _run_in_new_process(
+    code: str,
+    arguments: tuple[str, ...] = (),
+    disable_beartype: bool = False,
+    not_imported: tuple[str, ...] = (),
+) -> Callable[[], None]:
+    """Get function running code, with arguments, in a new python process.
+
+    The function raises an error if any of the not_imported modules were imported
+    by code.
+
+    """
+    environment = dict(os.environ)
+    environment.pop("DISABLE_BEARTYPE", None)
+    if disable_beartype:
+        environment["DISABLE_BEARTYPE"] = "1"
+
+    code = (
+        f"{code}\n"
+        "import sys\n"
+        f"imported = [name for name in {not_imported!r} if name in sys.modules]\n"
+        f"assert not imported, f'{{imported}} imported'"
+    )
+
+    def run_in_new_process() -> None:
+        subprocess.run(  # noqa: S603
+            [sys.executable, "-c", code, *arguments], check=True, env=environment
+        )
+
+    return run_in_new_process
+
+
+def _import_module(
+    module: str, disable_beartype: bool = False, not_imported: tuple[str, ...] = ()
+) -> Callable[[], None]:
+    """Get function importing module in a new python process, to time startup."""
+    return _run_in_new_process(
+        f"import {module}",
+        disable_beartype=disable_beartype,
+        not_imported=not_imported,
+    )
+
+
+def _parse_cli_arguments(
+    arguments: tuple[str, ...], not_imported: tuple[str, ...] = ()
+) -> Callable[[], None]:
+    """Get function parsing command line arguments in a new python process.
+
+    Beartype is disabled, as it is when timing the command line tool's startup.
+
+    """
+    return _run_in_new_process(
+        "from python_turtle_art.cli import parse_arguments\nparse_arguments()",
+        arguments=arguments,
+        disable_beartype=True,
+        not_imported=not_imported,
+    )
+
+
+def _export_svg(display_list: DisplayList) -> str:
+    """Replay display list onto an svg written to memory."""
+    left, bottom, right, top = _bounds(display_list.coordinates)
+    file = StringIO()
+    with SvgTurtle(
+        file=file, width=int(2 * max(-left, right)), height=int(2 * max(-bottom, top))
+    ) as turtle:
+        display_list.replay(turtle)
+    return file.getvalue()
+
+
+def get_benchmarks() -> list[Benchmark]:
+    """Get the benchmark suite."""
+    curved_kite = _curved_kite()
+    curved_kite_vertices = curved_kite.vertices
+    rotated_curved_kite_arrays = np.stack(
+        [curved_kite.rotate(1, Vec2D(0, 0)).vertices_array for _ in range(200)]
+    )
+
+    benchmarks = [
+        Benchmark(
+            name="is_convex",
+            group="geometry",
+            function=is_convex,
+            setup=lambda: (curved_kite_vertices,),
+        ),
+        Benchmark(
+            name="is_convex_many",
+            group="geometry",
+            function=is_convex_many,
+            setup=lambda: (rotated_curved_kite_arrays,),
+        ),
+        Benchmark(
+            name="get_points_on_quadratic_bezier_curve",
+            group="geometry",
+            function=_get_quadratic_bezier_curves,
+        ),
+        Benchmark(
+            name="offset_points_from_lines",
+            group="geometry",
+            function=offset_points_from_lines,
+            setup=lambda: (
+                rotated_curved_kite_arrays[:, 0],
+                rotated_curved_kite_arrays[:, 1],
+                0.5,
+                10,
+            ),
+        ),
+        Benchmark(
+            name="polygons_overlap_polygon",
+            group="geometry",
+            function=polygons_overlap_polygon,
+            setup=_pine_cone_kites,
+        ),
+        Benchmark(
+            name="clip_polygon",
+            group="geometry",
+            function=clip_polygon,
+            setup=lambda: (curved_kite, _stripes_kite()),
+        ),
+        Benchmark(
+            name="CurvedKite.from_origin_and_dimensions",
+            group="geometry",
+            function=_create_curved_kites,
+        ),
+        Benchmark(
+            name="get_filling_lines",
+            group="filling",
+            function=lambda polygon: [
+                get_filling_lines(origin=0, gap=6, polygon=polygon, axis=axis)
+                for axis in (0, 1)
+            ],
+            setup=lambda: (_stripes_kite(),),
+        ),
+        Benchmark(
+            name="get_filling_line_endpoints",
+            group="filling",
+            function=lambda polygon: [
+                get_filling_line_endpoints(origin=0, gap=6, polygon=polygon, axis=axis)
+                for axis in (0, 1)
+            ],
+            setup=lambda: (_stripes_kite(),),
+        ),
+        Benchmark(
+            name="get_filling_line_spans",
+            group="filling",
+            function=lambda polygon: [
+                get_filling_line_spans(origin=0, gap=6, polygon=polygon, axis=axis)
+                for axis in (0, 1)
+            ],
+            setup=lambda: (curved_kite,),
+        ),
+        Benchmark(
+            name="RandomPineConeFactory.create",
+            group="drawing",
+            function=_create_pine_cones,
+        ),
+        Benchmark(
+            name="PineCone.build",
+            group="drawing",
+            function=lambda pine_cone: pine_cone.build(),
+            setup=lambda: (_pine_cone_factory().create(),),
+        ),
+        Benchmark(
+            name="PineConeScene.render[null]",
+            group="drawing",
+            function=lambda scene: scene.render(NullTurtle()),
+            setup=lambda: (_pine_cone_factory().create().build(),),
+        ),
+        Benchmark(
+            name="PineCone.draw[null]",
+            group="drawing",
+            function=_draw_pine_cone,
+            setup=lambda: (_pine_cone_factory().create(),),
+        ),
+        Benchmark(
+            name="PineCone.draw[recording]",
+            group="drawing",
+            function=_record_pine_cone,
+            setup=lambda: (_pine_cone_factory().create(),),
+        ),
+    ]
+
+    for drawing in MODULE_DRAW_FUNCTION_MAPPING:
+        benchmarks.append(
+            Benchmark(
+                name=f"draw_image[{drawing}]",
+                group="drawing",
+                function=_draw_image(drawing),
+                repeats=1,
+            )
+        )
+
+    for drawing in MODULE_DRAW_FUNCTION_MAPPING:
+        benchmarks.extend(
+            [
+                Benchmark(
+                    name=f"export_png[{drawing}]",
+                    group="export",
+                    function=_export_png,
+                    setup=_recorded_image_setup(drawing),
+                    repeats=1,
+                ),
+                Benchmark(
+                    name=f"export_svg[{drawing}]",
+                    group="export",
+                    function=_export_svg,
+                    setup=_recorded_image_setup(drawing),
+                    repeats=1,
+                ),
+            ]
+        )
+
+    benchmarks.extend(
+        [
+            Benchmark(
+                name="import[python_turtle_art.cli]",
+                group="startup",
+                function=_import_module("python_turtle_art.cli"),
+            ),
+            Benchmark(
+                name="import[python_turtle_art.cli, DISABLE_BEARTYPE]",
+                group="startup",
+                function=_import_module(
+                    "python_turtle_art.cli", True, CLI_NOT_IMPORTED_MODULES
+                ),
+            ),
+            Benchmark(
+                name="parse_arguments[drawing, DISABLE_BEARTYPE]",
+                group="startup",
+                function=_parse_cli_arguments(
+                    ("--drawing", "stars_3bp"), CLI_NOT_IMPORTED_MODULES
+                ),
+            ),
+            Benchmark(
+                name="parse_arguments[batch, DISABLE_BEARTYPE]",
+                group="startup",
+                function=_parse_cli_arguments(
+                    ("batch", "-d", "stars_3bp", "--seeds", "0", "1", "-o", "out"),
+                    CLI_NOT_IMPORTED_MODULES,
+                ),
+            ),
+        ]
+    )
+
+    return benchmarks
+
+
+def compare_results(
+    results: list[dict[str, Any]], baseline: list[dict[str, Any]]
+) -> list[tuple[str, float, float, float]]:
+    """Get (name, baseline time, time, ratio) for benchmarks in both sets of results.
+
+    Times are the minimum wall time over the repeats, a ratio above 1 means the
+    benchmark is slower than the baseline.
+
+    """
+    baseline_times = {result["name"]: result["wall_time_min"] for result in baseline}
+
+    return [
+        (
+            result["name"],
+            baseline_times[result["name"]],
+            result["wall_time_min"],
+            result["wall_time_min"] / baseline_times[result["name"]],
+        )
+        for result in results
+        if result["name"] in baseline_times
+    ]
+
+
+class BenchmarkArguments(Namespace):
+    """Class to hold benchmark command line arguments."""
+
+    select: str | None
+    repeats: int | None
+    output: str | None
+    compare: str | None
+
+
+def parse_arguments(args: list[str] | None = None) -> BenchmarkArguments:
+    """Parse benchmark command line arguments."""
+
+    parser = ArgumentParser(description="Run the python_turtle_art benchmarks.")
+    parser.add_argument(
+        "-k",
+        "--select",
+        action="store",
+        type=str,
+        default=None,
+        help="Only run benchmarks with names matching this regular expression.",
+    )
+    parser.add_argument(
+        "-r",
+        "--repeats",
+        action="store",
+        type=int,
+        default=None,
+        help="Number of timed runs for every benchmark.",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        action="store",
+        type=str,
+        default=None,
+        help="JSON file to write results to. Defaults to a timestamped file.",
+    )
+    parser.add_argument(
+        "-c",
+        "--compare",
+        action="store",
+        type=str,
+        default=None,
+        help="JSON results file, from another commit, to compare timings against.",
+    )
+
+    return parser.parse_args(args, namespace=BenchmarkArguments())
+
+
+def run(args: list[str] | None = None) -> None:
+    """Run the benchmarks, print a summary and write the results to JSON."""
+
+    arguments = parse_arguments(args)
+
+    benchmarks = [
+        benchmark
+        for benchmark in get_benchmarks()
+        if arguments.select is None or re.search(arguments.select, benchmark.name)
+    ]
+
+    results = []
+    for benchmark in benchmarks:
+        result = run_benchmark(benchmark, repeats=arguments.repeats)
+        results.append(result.to_dict())
+        print(
+            f"{result.name:<45} {result.wall_time_min:>10.4f}s "
+            f"{result.peak_memory / 2**20:>9.1f}MiB "
+            f"{result.retained_blocks:>9} retained blocks"
+        )
+
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    output = arguments.output or f"benchmark {timestamp}.json"
+
+    with open(output, "w") as file:
+        json.dump(
+            {
+                "timestamp": timestamp,
+                "python_version": platform.python_version(),
+                "numpy_version": np.__version__,
+                "platform": platform.platform(),
+                "results": results,
+            },
+            file,
+            indent=2,
+        )
+
+    if arguments.compare is not None:
+        with open(arguments.compare) as file:
+            baseline = json.load(file)["results"]
+
+        print(f"\n{'benchmark':<45} {'baseline':>10} {'current':>10} {'ratio':>7}")
+        for name, baseline_time, time, ratio in compare_results(results, baseline):
+            print(f"{name:<45} {baseline_time:>9.4f}s {time:>9.4f}s {ratio:>7.2f}")
+
+
+if __name__ == "__main__":
+    run()
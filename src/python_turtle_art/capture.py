@@ -0,0 +1,8 @@
+"""Names of the methods for saving a Tk turtle screen to an image.
+
+Kept apart from write, which imports numpy, Pillow and tkinter, so the command line
+tool can offer the methods as choices without importing them.
+
+"""
+
+CAPTURE_METHODS = ("postscript", "canvas")
@@ -1,23 +1,40 @@
-import tkinter as tk
+"""Command line tool.
+
+Backends, batch, write, tkinter and turtle are imported in the functions that use
+them, and drawings are imported when they are drawn, so starting the tool only
+imports what the chosen command needs. Importing this module does not import
+numpy, tkinter or Pillow.
+
+With --profile, --pstats or --trace the drawing is run under an
+instrumentation.Profiler and its report, cProfile stats or Chrome trace are
+written when the drawing is finished.
+
+"""
+
+import os
 import warnings
 from argparse import ArgumentParser, Namespace
 from datetime import datetime
-from turtle import RawTurtle, ScrolledCanvas, TurtleScreen
+from typing import TYPE_CHECKING
 
-from .drawings import draw_image_pine_cones, draw_image_stars_3bp
-from .helpers.turtle import turn_off_turtle_animation, update_screen
-from .write import save_turtle_screen
+from .capture import CAPTURE_METHODS
+from .drawings import MODULE_DRAW_FUNCTION_MAPPING
+from .instrumentation import (
+    increment_counter,
+    instrument_screen,
+    instrument_turtle,
+    timed,
+)
 
-MODULE_DRAW_FUNCTION_MAPPING = {
-    "pine_cones": draw_image_pine_cones,
-    "stars_3bp": draw_image_stars_3bp,
-}
+if TYPE_CHECKING:
+    import tkinter
+    import turtle
 
 
 def setup_turtle_and_screen(
     window_dimensions: tuple[int, int],
     screen_dimensions: tuple[int, int] | None,
-) -> tuple[RawTurtle, TurtleScreen, tk.Tk]:
+) -> tuple["turtle.RawTurtle", "turtle.TurtleScreen", "tkinter.Tk"]:
     """Create Turtle and Screen objects.
 
     Also return the tk.Tk object passed into the canvas for the turtle screen. This
@@ -31,6 +48,9 @@ def setup_turtle_and_screen(
             are passed to the Screen.screensize() function.
 
     """
+    import tkinter as tk
+    from turtle import RawTurtle, ScrolledCanvas, TurtleScreen
+
     root = tk.Tk()
 
     if screen_dimensions is None:
@@ -75,9 +95,19 @@ class CommandLineArguments(Namespace):
     no_turtle: bool
     exit_on_click: bool
     save_image: bool
+    capture: str
     screen_height: int
     screen_width: int
     drawing: str
+    backend: str
+    command: str | None
+    seeds: tuple[int, int]
+    output_directory: str
+    processes: int | None
+    tile_size: int | None
+    profile: str | None
+    pstats: str | None
+    trace: str | None
 
 
 def parse_arguments():
@@ -103,7 +133,21 @@ def parse_arguments():
         "-s",
         "--save_image",
         action="store_true",
-        help="Save image to png. File will be timestamped.",
+        help=(
+            "Save image to png, or svg with the svg backend. File will be timestamped."
+        ),
+    )
+    parser.add_argument(
+        "-c",
+        "--capture",
+        action="store",
+        type=str,
+        choices=CAPTURE_METHODS,
+        default="postscript",
+        help=(
+            "How the Tk screen is saved with --save_image, rasterise its postscript "
+            "with ghostscript or draw the canvas items directly."
+        ),
     )
 
     parser.add_argument(
@@ -130,6 +174,135 @@ def parse_arguments():
         default="stars_3bp",
         help="The name of the drawing to produce.",
     )
+    parser.add_argument(
+        "-b",
+        "--backend",
+        action="store",
+        type=str,
+        choices=["tk", "raster", "svg"],
+        default="tk",
+        help=(
+            "Draw on a Tk screen, rasterise straight to an array or write straight to "
+            "svg, without opening a window."
+        ),
+    )
+
+    parser.add_argument(
+        "-t",
+        "--tile_size",
+        action="store",
+        type=int,
+        default=None,
+        help=(
+            "With the raster backend, record the drawing then rasterise it in tiles of "
+            "this size in parallel. Use for very large images."
+        ),
+    )
+    parser.add_argument(
+        "-p",
+        "--processes",
+        action="store",
+        type=int,
+        default=None,
+        help="Number of worker processes for tiles, defaults to the number of CPUs.",
+    )
+
+    parser.add_argument(
+        "--profile",
+        action="store",
+        type=str,
+        default=None,
+        metavar="FILE",
+        help=(
+            "Write a json report of the count and time of shape construction, "
+            "fills, turtle commands, canvas items, screen updates and export."
+        ),
+    )
+    parser.add_argument(
+        "--pstats",
+        action="store",
+        type=str,
+        default=None,
+        metavar="FILE",
+        help="Run cProfile while drawing and write the stats, to be read by pstats.",
+    )
+    parser.add_argument(
+        "--trace",
+        action="store",
+        type=str,
+        default=None,
+        metavar="FILE",
+        help="Write a Chrome trace, for chrome://tracing or Perfetto, of the drawing.",
+    )
+
+    subparsers = parser.add_subparsers(dest="command")
+
+    batch_parser = subparsers.add_parser(
+        "batch",
+        help=(
+            "Render a drawing for a range of seeds in parallel, with headless "
+            "backends, skipping outputs that already exist."
+        ),
+    )
+    batch_parser.add_argument(
+        "-d",
+        "--drawing",
+        action="store",
+        type=str,
+        required=True,
+        choices=list(MODULE_DRAW_FUNCTION_MAPPING),
+        help="The name of the drawing to produce.",
+    )
+    batch_parser.add_argument(
+        "--seeds",
+        action="store",
+        type=int,
+        nargs=2,
+        required=True,
+        metavar=("START", "STOP"),
+        help="Render seeds START to STOP - 1.",
+    )
+    batch_parser.add_argument(
+        "-o",
+        "--output_directory",
+        action="store",
+        type=str,
+        required=True,
+        help="Directory to write the images to.",
+    )
+    batch_parser.add_argument(
+        "-p",
+        "--processes",
+        action="store",
+        type=int,
+        default=None,
+        help="Number of worker processes, defaults to the number of CPUs.",
+    )
+    batch_parser.add_argument(
+        "-b",
+        "--backend",
+        action="store",
+        type=str,
+        choices=["raster", "svg"],
+        default="raster",
+        help="Write png images with the raster backend or svg images.",
+    )
+    batch_parser.add_argument(
+        "-he",
+        "--screen_height",
+        action="store",
+        type=int,
+        default=100,
+        help="The image height.",
+    )
+    batch_parser.add_argument(
+        "-w",
+        "--screen_width",
+        action="store",
+        type=int,
+        default=100,
+        help="The image width.",
+    )
 
     return parser.parse_args(namespace=CommandLineArguments)
 
@@ -139,10 +312,71 @@ def run():
 
     args = parse_arguments()
 
+    if args.command == "batch":
+        from .batch import run_batch
+
+        results = run_batch(
+            drawing=args.drawing,
+            seeds=range(*args.seeds),
+            output_directory=args.output_directory,
+            processes=args.processes,
+            backend=args.backend,
+            width=args.screen_width,
+            height=args.screen_height,
+        )
+        if any(result.error is not None for result in results):
+            raise SystemExit(1)
+        return
+
+    if args.profile is None and args.pstats is None and args.trace is None:
+        run_drawing(args)
+        return
+
+    from .instrumentation import Profiler
+
+    profiler = Profiler(trace=args.trace is not None, cprofile=args.pstats is not None)
+    with profiler:
+        run_drawing(args)
+
+    if args.profile is not None:
+        profiler.write_report(args.profile, drawing=args.drawing, backend=args.backend)
+    if args.pstats is not None:
+        profiler.write_pstats(args.pstats)
+    if args.trace is not None:
+        profiler.write_chrome_trace(args.trace)
+
+
+def run_drawing(args):
+    """Draw args.drawing with the backend chosen in args."""
+
+    if args.backend == "raster":
+        run_raster(
+            drawing=args.drawing,
+            width=args.screen_width,
+            height=args.screen_height,
+            save_image=args.save_image,
+            tile_size=args.tile_size,
+            processes=args.processes,
+        )
+        return
+
+    if args.backend == "svg":
+        run_svg(
+            drawing=args.drawing,
+            width=args.screen_width,
+            height=args.screen_height,
+            save_image=args.save_image,
+        )
+        return
+
+    from .helpers.turtle import turn_off_turtle_animation, update_screen
+
     turtle, screen, _ = setup_turtle_and_screen(
         window_dimensions=(args.screen_width, args.screen_height),
         screen_dimensions=None,
     )
+    instrument_turtle(turtle)
+    instrument_screen(screen)
 
     if args.no_turtle:
         turtle.hideturtle()
@@ -152,21 +386,107 @@ def run():
 
     drawing_function = MODULE_DRAW_FUNCTION_MAPPING[args.drawing]
 
-    drawing_function(turtle=turtle)
+    from .backends.state_tracking import StateTrackingTurtle
+    from .drawings.viewport import get_viewport
+
+    state_tracking_turtle = StateTrackingTurtle(turtle)
+    with timed("drawing", args.drawing):
+        drawing_function(
+            turtle=state_tracking_turtle,
+            viewport=get_viewport(args.screen_width, args.screen_height),
+        )
+        state_tracking_turtle.flush()
+
+    for name, count in state_tracking_turtle.elided_calls.items():
+        increment_counter(f"turtle_calls_elided[{name}]", count)
 
     if args.quick:
         update_screen(screen)
 
     if args.save_image:
+        from .write import save_turtle_screen
+
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-        save_turtle_screen(
-            screen=screen,
-            file=f"img {timestamp}.png",
-            height=args.screen_height,
-            width=args.screen_width,
-            page_width=True,
-        )
+        with timed("export", args.capture):
+            save_turtle_screen(
+                screen=screen,
+                file=f"img {timestamp}.png",
+                height=args.screen_height,
+                width=args.screen_width,
+                page_width=True,
+                method=args.capture,
+            )
 
     if args.exit_on_click:
         warnings.warn("exit_on_click not implemented", stacklevel=1)
+
+
+def run_raster(
+    drawing: str,
+    width: int,
+    height: int,
+    save_image: bool,
+    tile_size: int | None = None,
+    processes: int | None = None,
+):
+    """Draw with the headless raster backend, saving the image if requested.
+
+    If tile_size is given the drawing is recorded and then rasterised in tiles across
+    processes worker processes.
+
+    """
+    from .backends import RasterTurtle, RecordingTurtle, TiledRaster
+    from .drawings.viewport import get_viewport
+
+    drawing_function = MODULE_DRAW_FUNCTION_MAPPING[drawing]
+    viewport = get_viewport(width, height)
+
+    if tile_size is None:
+        turtle = RasterTurtle(width=width, height=height)
+        instrument_turtle(turtle)
+        with timed("drawing", drawing):
+            drawing_function(turtle=turtle, viewport=viewport)
+        image = turtle.get_image()
+    else:
+        recording_turtle = RecordingTurtle()
+        instrument_turtle(recording_turtle)
+        with timed("drawing", drawing):
+            drawing_function(turtle=recording_turtle, viewport=viewport)
+        with timed("export", "tiles"):
+            image = TiledRaster(
+                width=width, height=height, tile_size=tile_size
+            ).render_image(recording_turtle.get_display_list(), processes=processes)
+
+    if save_image:
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+        with timed("export", "png"):
+            image.save(f"img {timestamp}.png")
+
+
+def run_svg(drawing: str, width: int, height: int, save_image: bool):
+    """Draw with the svg backend, streaming the drawing to a timestamped svg file.
+
+    If save_image is False the svg is written to os.devnull instead, so the drawing
+    is still made but nothing is saved, as with the other backends.
+
+    """
+    from .backends import SvgTurtle
+    from .drawings.viewport import get_viewport
+
+    if save_image:
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        file_name = f"img {timestamp}.svg"
+    else:
+        file_name = os.devnull
+
+    with (
+        open(file_name, "w") as file,
+        SvgTurtle(file=file, width=width, height=height) as turtle,
+    ):
+        drawing_function = MODULE_DRAW_FUNCTION_MAPPING[drawing]
+
+        instrument_turtle(turtle)
+        with timed("drawing", drawing):
+            drawing_function(turtle=turtle, viewport=get_viewport(width, height))
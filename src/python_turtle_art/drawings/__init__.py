@@ -1,4 +1,60 @@
-from .pine_cones.main import draw_image as draw_image_pine_cones
-from .stars_3bp.main import draw_image as draw_image_stars_3bp
+from collections.abc import Callable, Iterator, Mapping
+from importlib import import_module
+from typing import Any
 
-__all__ = ["draw_image_pine_cones", "draw_image_stars_3bp"]
+
+class DrawingRegistry(Mapping[str, Callable[..., None]]):
+    """Mapping of drawing name to draw_image function, importing drawings on use.
+
+    Only the module names are held, each drawing module is imported the first time
+    its function is looked up. Listing or checking the names imports nothing, so
+    the command line tool can start without importing every drawing.
+
+    Drawing functions take turtle, seed and viewport arguments. Shapes outside
+    viewport, e.g. from viewport.get_viewport, may be skipped by the drawing.
+
+    Args:
+        modules (dict[str, str]): name of each drawing's module, relative to this
+            package, by drawing name. The module must define draw_image.
+
+    """
+
+    def __init__(self, modules: dict[str, str]):
+        self._modules = modules
+
+    def __getitem__(self, name: str) -> Callable[..., None]:
+        return import_module(self._modules[name], package=__name__).draw_image
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._modules)
+
+    def __len__(self) -> int:
+        return len(self._modules)
+
+
+MODULE_DRAW_FUNCTION_MAPPING = DrawingRegistry(
+    {
+        "pine_cones": ".pine_cones.main",
+        "stars_3bp": ".stars_3bp.main",
+    }
+)
+
+
+_DRAW_FUNCTION_ATTRIBUTES = {
+    "draw_image_pine_cones": "pine_cones",
+    "draw_image_stars_3bp": "stars_3bp",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _DRAW_FUNCTION_ATTRIBUTES:
+        return MODULE_DRAW_FUNCTION_MAPPING[_DRAW_FUNCTION_ATTRIBUTES[name]]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = [
+    "DrawingRegistry",
+    "MODULE_DRAW_FUNCTION_MAPPING",
+    "draw_image_pine_cones",
+    "draw_image_stars_3bp",
+]
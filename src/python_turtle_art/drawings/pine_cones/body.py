@@ -1,8 +1,15 @@
-from turtle import Turtle, Vec2D
+from turtle import RawTurtle, Vec2D
+
+import numpy as np
+from numpy.typing import NDArray
 
 from ...helpers.turtle import jump_to
-from ...lines.offset_from_line import OffsetFromLine
-from ...lines.quadratic_bezier_curve import QuadraticBezierCurve
+from ...lines.offset_from_line import OffsetFromLine, offset_points_from_lines
+from ...lines.quadratic_bezier_curve import (
+    QuadraticBezierCurve,
+    evaluate_quadratic_bezier_curves,
+)
+from ...vertices.vertices import BoundingBox
 from .face import CurvedMouth
 
 
@@ -29,27 +36,55 @@ class Arm(Limb):
         self.outline = outline
         self.n_wiggles = n_wiggles
 
-    def draw(self, turtle: Turtle):
-        jump_to(turtle, self.start)
+    def draw(self, turtle: RawTurtle):
+        """Draw the arm as n_wiggles curves, bending alternately either way.
 
-        wiggle_step_size = (1 / self.n_wiggles) * (self.end - self.start)
+        The curves for all the wiggles are calculated together.
 
-        multiplier = 1
+        """
+        if self.start == self.end:
+            raise ValueError("Can only create curve between two different points.")
 
-        for n in range(self.n_wiggles):
-            wiggle_offset = OffsetFromLine(
-                proportion_lenth=self.off_line.proportion_lenth,
-                offset=multiplier * self.off_line.offset,
-            )
+        jump_to(turtle, self.start)
+
+        curves = evaluate_quadratic_bezier_curves(self._get_control_points(), steps=10)
+        curves.flags.writeable = False
 
-            QuadraticBezierCurve.from_start_and_end(
-                start=self.start + n * wiggle_step_size,
-                end=self.start + (n + 1) * wiggle_step_size,
-                off_line=wiggle_offset,
-                steps=10,
-            ).draw(
+        for curve in curves:
+            QuadraticBezierCurve(vertices=curve).draw(
                 turtle=turtle,
                 size=self.size,  # type: ignore
             )
 
-            multiplier *= -1
+    def get_bounding_box(self) -> BoundingBox:
+        """Get the box around the start, end and control points of every wiggle."""
+        return BoundingBox.from_points(self._get_control_points())
+
+    def _get_control_points(self) -> NDArray[np.float64]:
+        """Get (n_wiggles, 3, 2) array of the control points of each wiggle's curve."""
+        wiggle_step_size = (1 / self.n_wiggles) * (self.end - self.start)
+
+        wiggle_points = np.array(self.start) + (
+            np.arange(self.n_wiggles + 1)[:, np.newaxis] * np.array(wiggle_step_size)
+        )
+
+        # the offset of each wiggle's curve alternates in sign
+        offsets = np.where(
+            np.arange(self.n_wiggles) % 2 == 0,
+            self.off_line.offset,
+            -self.off_line.offset,
+        )
+
+        return np.stack(
+            (
+                wiggle_points[:-1],
+                offset_points_from_lines(
+                    p0=wiggle_points[:-1],
+                    p1=wiggle_points[1:],
+                    proportion_lenths=self.off_line.proportion_lenth,
+                    offsets=offsets,
+                ),
+                wiggle_points[1:],
+            ),
+            axis=1,
+        )
@@ -1,8 +1,15 @@
 from abc import ABC, abstractmethod
-from turtle import Turtle
+from turtle import RawTurtle
+
+from ...vertices.vertices import BoundingBox
 
 
 class BodyPart(ABC):
     @abstractmethod
-    def draw(self, turtle: Turtle):
+    def draw(self, turtle: RawTurtle):
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_bounding_box(self) -> BoundingBox:
+        """Get a box containing everything drawn, except for line widths."""
         raise NotImplementedError
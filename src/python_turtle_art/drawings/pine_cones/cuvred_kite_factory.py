@@ -1,8 +1,14 @@
+from functools import lru_cache
 from turtle import Vec2D
 from typing import Optional, Union
 
+import numpy as np
+from numpy.typing import NDArray
+
+from ...helpers.rotation import rotate_array_about_point
 from ...lines.offset_from_line import OffsetFromLine
 from ...polygons.kites.curved_kite import CurvedKite
+from ...vertices.vertices import BoundingBox
 
 
 class CurvedKiteFactory:
@@ -14,6 +20,10 @@ class CurvedKiteFactory:
     The rotation argument must be specified. When the CurvedKite object is created with
     get_kite it will be rotated by rotation degrees about the origin point.
 
+    Kites with the same dimensions, off_lines and rotation only differ by their
+    origin, so the rotated kite is calculated and checked once at the origin (0, 0),
+    cached, and translated to the origin of each kite.
+
     """
 
     def __init__(
@@ -56,6 +66,67 @@ class CurvedKiteFactory:
             else:
                 origin = self.origin
 
+        template_vertices, corner_vertices_indices = self._get_template(
+            height=height,
+            width=width,
+            diagonal_intersection_along_height=diagonal_intersection_along_height,
+            off_lines=off_lines,
+        )
+
+        vertices = template_vertices + np.asarray(origin, dtype=np.float64)
+        vertices.flags.writeable = False
+
+        return CurvedKite.from_trusted_vertices(
+            vertices, corner_vertices_indices=corner_vertices_indices
+        )
+
+    def get_kites_vertices(
+        self, origins: NDArray
+    ) -> tuple[NDArray[np.float64], tuple[int, ...]]:
+        """Get the vertices of a kite at each of origins, in one operation.
+
+        The vertices of each kite are equal to the vertices_array of get_kite for
+        its origin, using the arguments specified during initialisation.
+
+        Args:
+            origins (NDArray): (k, 2) array of the origin of each kite.
+
+        Returns:
+            Read only (k, m, 2) array of the vertices of each kite and the indices of
+            the corner vertices, which are the same for every kite.
+
+        """
+        template_vertices, corner_vertices_indices = self._get_template()
+
+        vertices = (
+            template_vertices + np.asarray(origins, dtype=np.float64)[:, np.newaxis]
+        )
+        vertices.flags.writeable = False
+
+        return vertices, corner_vertices_indices
+
+    def get_kite_bounding_box(self) -> BoundingBox:
+        """Get the bounding box of a kite with origin (0, 0).
+
+        The box of a kite at any other origin is this box moved by the origin.
+
+        """
+        template_vertices, _ = self._get_template()
+
+        min_x, min_y = template_vertices.min(axis=0).tolist()
+        max_x, max_y = template_vertices.max(axis=0).tolist()
+
+        return BoundingBox(min_x=min_x, min_y=min_y, max_x=max_x, max_y=max_y)
+
+    def _get_template(
+        self,
+        height: Optional[Union[int, float]] = None,
+        width: Optional[Union[int, float]] = None,
+        diagonal_intersection_along_height: Optional[float] = None,
+        off_lines: Optional[tuple[OffsetFromLine, ...]] = None,
+    ) -> tuple[NDArray[np.float64], tuple[int, ...]]:
+        """Get the cached template, using the initialisation values for None args."""
+
         if height is None:
             if self.height is None:
                 raise ValueError("height not specified")
@@ -82,10 +153,52 @@ class CurvedKiteFactory:
             else:
                 off_lines = self.off_lines
 
-        return CurvedKite.from_origin_and_dimensions(
-            origin=origin,
+        return get_curved_kite_template(
+            rotation=self.rotation,
             height=height,
             width=width,
             diagonal_intersection_along_height=diagonal_intersection_along_height,
-            off_lines=off_lines,
-        ).rotate(angle=self.rotation, about_point=origin)
+            off_lines=tuple(
+                (off_line.proportion_lenth, off_line.offset) for off_line in off_lines
+            ),
+        )
+
+
+@lru_cache(maxsize=256)
+def get_curved_kite_template(
+    rotation: Union[int, float],
+    height: Union[int, float],
+    width: Union[int, float],
+    diagonal_intersection_along_height: float,
+    off_lines: tuple[tuple[float, Union[int, float]], ...],
+) -> tuple[NDArray[np.float64], tuple[int, ...]]:
+    """Get vertices of a CurvedKite with origin (0, 0), rotated about the origin.
+
+    off_lines is passed as (proportion_lenth, offset) tuples so the arguments can be
+    used as the cache key. The returned array is read only as it is shared between
+    all kites created from it.
+
+    The template is checked, by creating a CurvedKite, once when it is cached. Kites
+    are translated copies of it so get_kite creates them without checking again.
+
+    """
+    vertices, corner_vertices_indices = CurvedKite.get_curved_kite_vertices_array(
+        origin=Vec2D(0, 0),
+        height=height,
+        width=width,
+        diagonal_intersection_along_height=diagonal_intersection_along_height,
+        off_lines=tuple(
+            OffsetFromLine(proportion_lenth=proportion_lenth, offset=offset)
+            for proportion_lenth, offset in off_lines
+        ),
+    )
+
+    if (rotation % 360) != 0:
+        vertices = rotate_array_about_point(vertices, rotation, Vec2D(0, 0))
+        vertices.flags.writeable = False
+
+    template = CurvedKite(
+        vertices=vertices, corner_vertices_indices=corner_vertices_indices
+    )
+
+    return template.vertices_array, template.corner_vertices_indices
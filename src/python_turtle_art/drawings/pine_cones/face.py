@@ -1,11 +1,12 @@
 from abc import abstractmethod
-from turtle import Turtle, Vec2D
+from turtle import RawTurtle, Vec2D
 
 from ...filling.colour_fill import ColourFill
 from ...helpers.turtle import jump_to
 from ...lines.offset_from_line import OffsetFromLine
 from ...lines.quadratic_bezier_curve import QuadraticBezierCurve
 from ...polygons.polygon import Polygon
+from ...vertices.vertices import BoundingBox
 from .body_part import BodyPart
 
 
@@ -24,7 +25,7 @@ class Eyes(BodyPart):
         self.left_eye_size = left_eye_size
         self.right_eye_size = right_eye_size
 
-    def draw(self, turtle: Turtle):
+    def draw(self, turtle: RawTurtle):
         original_colour = turtle.pencolor()
 
         jump_to(turtle, self.left_eye)
@@ -43,10 +44,17 @@ class Eyes(BodyPart):
         turtle.pencolor(original_colour)
         turtle.dot(self.right_eye_size)
 
+    def get_bounding_box(self) -> BoundingBox:
+        left_eye_box = BoundingBox.from_points([self.left_eye])
+        right_eye_box = BoundingBox.from_points([self.right_eye])
+        return left_eye_box.expand((self.left_eye_size + 2) / 2).union(
+            right_eye_box.expand((self.right_eye_size + 2) / 2)
+        )
+
 
 class Mouth(BodyPart):
     @abstractmethod
-    def draw(self, turtle: Turtle):
+    def draw(self, turtle: RawTurtle):
         raise NotImplementedError
 
 
@@ -55,7 +63,7 @@ class RoundMouth(Mouth):
         self.location = location
         self.size = size
 
-    def draw(self, turtle: Turtle):
+    def draw(self, turtle: RawTurtle):
         original_colour = turtle.pencolor()
 
         jump_to(turtle, self.location)
@@ -66,6 +74,9 @@ class RoundMouth(Mouth):
         turtle.pencolor(original_colour)
         turtle.dot(self.size)
 
+    def get_bounding_box(self) -> BoundingBox:
+        return BoundingBox.from_points([self.location]).expand((self.size + 2) / 2)
+
 
 class CurvedMouth(Mouth):
     def __init__(
@@ -82,23 +93,30 @@ class CurvedMouth(Mouth):
         self.size = size
         self.outline = outline
 
-    def draw(self, turtle: Turtle):
+    def draw(self, turtle: RawTurtle):
         original_colour = turtle.pencolor()
 
-        if self.outline:
-            QuadraticBezierCurve.from_start_and_end(
-                start=self.start,
-                end=self.end,
-                off_line=self.off_line,
-                steps=10,
-            ).draw(turtle=turtle, colour="white", size=self.size + 2)  # type: ignore
-
-        QuadraticBezierCurve.from_start_and_end(
+        curve = QuadraticBezierCurve.from_start_and_end(
             start=self.start,
             end=self.end,
             off_line=self.off_line,
             steps=10,
-        ).draw(turtle=turtle, colour=original_colour, size=self.size)  # type: ignore
+        )
+
+        if self.outline:
+            curve.draw(turtle=turtle, colour="white", size=self.size + 2)  # type: ignore
+
+        curve.draw(turtle=turtle, colour=original_colour, size=self.size)  # type: ignore
+
+    def get_bounding_box(self) -> BoundingBox:
+        """Get the box around the curve's start, end and control point.
+
+        The curve is inside the triangle formed by these points.
+
+        """
+        return BoundingBox.from_points(
+            [self.start, self.end, self.off_line.to_point(self.start, self.end)]
+        )
 
 
 class CurvedTriangleMouth(Mouth):
@@ -106,7 +124,7 @@ class CurvedTriangleMouth(Mouth):
         self,
         start: Vec2D,
         end: Vec2D,
-        size: int,
+        size: int | float,
         off_line: OffsetFromLine | None = None,
         fill: bool = True,
         colour: str = "white",
@@ -118,15 +136,17 @@ class CurvedTriangleMouth(Mouth):
         self.fill = fill
         self.colour = colour
 
-    def draw(self, turtle: Turtle):
+    def draw(self, turtle: RawTurtle):
         original_colour = turtle.pencolor()
 
-        QuadraticBezierCurve.from_start_and_end(
+        curve = QuadraticBezierCurve.from_start_and_end(
             start=self.start,
             end=self.end,
             off_line=self.off_line,
             steps=10,
-        ).draw(turtle=turtle, colour="white", size=self.size + 2)
+        )
+
+        curve.draw(turtle=turtle, colour="white", size=self.size + 2)
 
         QuadraticBezierCurve.from_start_and_end(
             start=self.end,
@@ -136,13 +156,6 @@ class CurvedTriangleMouth(Mouth):
         ).draw(turtle=turtle, colour="white", size=self.size + 2)
         turtle.pencolor(original_colour)
 
-        curve = QuadraticBezierCurve.from_start_and_end(
-            start=self.start,
-            end=self.end,
-            off_line=self.off_line,
-            steps=10,
-        )
-
         mouth_polygon = Polygon(vertices=curve.vertices)
 
         if self.fill:
@@ -153,3 +166,13 @@ class CurvedTriangleMouth(Mouth):
             colour=original_colour,
             size=self.size,
         )
+
+    def get_bounding_box(self) -> BoundingBox:
+        """Get the box around the curve's start, end and control point.
+
+        The curve is inside the triangle formed by these points.
+
+        """
+        return BoundingBox.from_points(
+            [self.start, self.end, self.off_line.to_point(self.start, self.end)]
+        )
@@ -0,0 +1,137 @@
+"""Lattice of inner kite origins covering a pine cone's outer kite."""
+
+from math import cos, sin
+from turtle import Vec2D
+
+import numpy as np
+from numpy.typing import NDArray
+
+from ...helpers.angles import convert_degrees_to_radians
+from ...vertices.vertices import BoundingBox
+
+
+def get_inner_kite_origins(
+    first_vertex: Vec2D,
+    outer_kite_height: int | float,
+    outer_kite_width: int | float,
+    rotation: int | float,
+    inner_kite_height: int | float,
+    inner_kite_width: int | float,
+    inner_kite_diagonal_intersection_along_height: int | float,
+    horizontal_offset: int | float,
+    vertical_offset: int | float,
+) -> NDArray[np.float64]:
+    """Get the origins of the inner kites, in the order they are drawn.
+
+    Kites are laid out in rows along the outer kite's vertical bisector, starting at
+    its first vertex. Each row has a kite on the bisector then, to the right and
+    then to the left, pairs of a kite in the row and a kite half a row up, between
+    it and the previous kite. All origins are calculated together, with the same
+    operations as moving along the rows one kite at a time.
+
+    Args:
+        first_vertex (Vec2D): first vertex of the rotated outer kite.
+        outer_kite_height (int | float): height of the outer kite.
+        outer_kite_width (int | float): width of the outer kite.
+        rotation (int | float): rotation of the outer kite, in degrees.
+        inner_kite_height (int | float): height of the inner kites.
+        inner_kite_width (int | float): width of the inner kites.
+        inner_kite_diagonal_intersection_along_height (int | float): proportion of
+            the inner kite height where the diagonals meet.
+        horizontal_offset (int | float): gap between kites in a row.
+        vertical_offset (int | float): half the gap between rows.
+
+    Returns:
+        (k, 2) array of origins.
+
+    """
+    # number of inner kites either side of the vertical bisector
+    n_side_inner_kites = (
+        int((outer_kite_width / 2 - inner_kite_width / 2) // inner_kite_width) + 1
+    )
+
+    n_rows_inner_kites = int(outer_kite_height // inner_kite_height) + 1
+
+    inner_angle = convert_degrees_to_radians(rotation)
+
+    unit_vector_vertical_move = np.array(
+        [
+            outer_kite_height * sin(inner_angle) / outer_kite_height,
+            outer_kite_height * cos(inner_angle) / outer_kite_height,
+        ]
+    )
+
+    unit_vector_horizontal_move = np.array(
+        [
+            outer_kite_width * cos(inner_angle) / outer_kite_width,
+            -outer_kite_width * sin(inner_angle) / outer_kite_width,
+        ]
+    )
+
+    row_step = inner_kite_height + 2 * vertical_offset
+    column_step = inner_kite_width + horizontal_offset
+
+    center_origins = (
+        np.asarray(first_vertex, dtype=np.float64)
+        + (np.arange(n_rows_inner_kites)[:, np.newaxis] * row_step)
+        * unit_vector_vertical_move
+    )
+
+    center_origins_half_row_up = (
+        center_origins
+        + (
+            vertical_offset
+            + inner_kite_diagonal_intersection_along_height * inner_kite_height
+        )
+        * unit_vector_vertical_move
+    )
+
+    side_columns = np.arange(n_side_inner_kites)
+
+    # moves along the row from the center for the kites in the row and half a row up
+    row_moves = ((side_columns + 1) * column_step)[
+        :, np.newaxis
+    ] * unit_vector_horizontal_move
+    half_row_up_moves = (column_step / 2 + side_columns * column_step)[
+        :, np.newaxis
+    ] * unit_vector_horizontal_move
+
+    # (rows, 1 + 4 * n_side_inner_kites, 2) array of origins in drawing order
+    origins = np.empty((n_rows_inner_kites, 1 + 4 * n_side_inner_kites, 2))
+    origins[:, 0] = center_origins
+
+    right = origins[:, 1 : 1 + 2 * n_side_inner_kites]
+    right[:, 0::2] = center_origins[:, np.newaxis] + row_moves
+    right[:, 1::2] = center_origins_half_row_up[:, np.newaxis] + half_row_up_moves
+
+    left = origins[:, 1 + 2 * n_side_inner_kites :]
+    left[:, 0::2] = center_origins[:, np.newaxis] - row_moves
+    left[:, 1::2] = center_origins_half_row_up[:, np.newaxis] - half_row_up_moves
+
+    return origins.reshape(-1, 2)
+
+
+def get_origins_within(
+    origins: NDArray, kite_bounding_box: BoundingBox, bounding_box: BoundingBox
+) -> NDArray[np.bool_]:
+    """Find which kites overlap bounding_box, from their origins.
+
+    Args:
+        origins (NDArray): (k, 2) array of kite origins.
+        kite_bounding_box (BoundingBox): bounding box of a kite at the origin (0, 0).
+        bounding_box (BoundingBox): box the kites should overlap.
+
+    Returns:
+        (k,) boolean array, True for the kites whose bounding box overlaps, or
+        touches, bounding_box.
+
+    """
+    x = origins[:, 0]
+    y = origins[:, 1]
+
+    return (
+        (x + kite_bounding_box.min_x <= bounding_box.max_x)
+        & (bounding_box.min_x <= x + kite_bounding_box.max_x)
+        & (y + kite_bounding_box.min_y <= bounding_box.max_y)
+        & (bounding_box.min_y <= y + kite_bounding_box.max_y)
+    )
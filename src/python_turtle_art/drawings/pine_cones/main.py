@@ -1,22 +1,36 @@
 """Script containing functions to draw pine cones image."""
 
 import random
-from turtle import Turtle, Vec2D
+from turtle import RawTurtle, Vec2D
 from typing import Optional
 
 import numpy as np
 
 from ...helpers.rotation import rotate_about_point
+from ...instrumentation import increment_counter
 from ...lines.offset_from_line import OffsetFromLine
 from ...polygons.kites.curved_kite import CurvedKite
+from ...vertices.spatial_index import SpatialIndex
+from ...vertices.vertices import BoundingBox
 from .body import Limb
 from .cuvred_kite_factory import CurvedKiteFactory
 from .face import CurvedMouth, Eyes
 from .pine_cone import PineCone, RandomPineConeFactory
+from .scene import PineConeScene
 
 
-def draw_background_characters(turtle: Turtle, initial_seed: Optional[int] = None):
-    """Main drawing function."""
+def draw_background_characters(
+    turtle: RawTurtle,
+    initial_seed: Optional[int] = None,
+    viewport: Optional[BoundingBox] = None,
+):
+    """Draw background pine cones, inner kites outside viewport are skipped if given.
+
+    All the pine cones are built before any are drawn. If viewport is given the
+    scenes are put in a SpatialIndex and only those overlapping viewport are drawn,
+    the number skipped is added to the pine_cones_culled counter.
+
+    """
 
     random.seed(initial_seed)
 
@@ -47,6 +61,8 @@ def draw_background_characters(turtle: Turtle, initial_seed: Optional[int] = Non
         [],
     ]
 
+    scenes: list[PineConeScene] = []
+
     for row_number in reversed(range(n_rows)):
         y = -row_number * vertical_character_offset
 
@@ -76,11 +92,29 @@ def draw_background_characters(turtle: Turtle, initial_seed: Optional[int] = Non
                     verbose=False,
                 ).create()
 
-                random_pine_cone.draw(turtle)
+                scenes.append(random_pine_cone.build())
+
+    if viewport is not None:
+        index: SpatialIndex[PineConeScene] = SpatialIndex(
+            cell_size=horizontal_character_offset
+        )
+        for scene in scenes:
+            index.insert(scene, scene.get_bounding_box())
+
+        visible_scenes = index.query(viewport)
+        increment_counter("pine_cones_culled", len(scenes) - len(visible_scenes))
+        scenes = visible_scenes
+
+    for scene in scenes:
+        scene.render(turtle, viewport=viewport)
 
 
-def draw_main_character(turtle: Turtle):
-    """Draw specific character."""
+def draw_main_character(turtle: RawTurtle, viewport: Optional[BoundingBox] = None):
+    """Draw specific character, skipped if it is outside viewport, if given.
+
+    If it overlaps viewport inner kites outside viewport are skipped.
+
+    """
 
     s1 = Vec2D(1000, -1600)
 
@@ -167,13 +201,25 @@ def draw_main_character(turtle: Turtle):
         final_body_parts=(eyes, mouth, left_arm, right_arm),
     )
 
-    pine_cone.draw(turtle=turtle)
+    scene = pine_cone.build()
+
+    if viewport is not None and not scene.get_bounding_box().intersects(viewport):
+        increment_counter("pine_cones_culled")
+        return
+
+    scene.render(turtle=turtle, viewport=viewport)
+
 
+def draw_image(
+    turtle: RawTurtle, seed: int = 0, viewport: Optional[BoundingBox] = None
+):
+    """Draw pine cone image, seed sets the randomised background characters.
 
-def draw_image(turtle: Turtle):
-    """Draw pine cone image."""
+    If viewport is given, pine cones, and inner kites of the pine cones, that do not
+    overlap it are not drawn. Bounding boxes do not include line widths, so viewport
+    should have a margin for them, see drawings.viewport.get_viewport.
 
-    seed = 0
+    """
 
-    draw_main_character(turtle=turtle)
-    draw_background_characters(turtle=turtle, initial_seed=seed)
+    draw_main_character(turtle=turtle, viewport=viewport)
+    draw_background_characters(turtle=turtle, initial_seed=seed, viewport=viewport)
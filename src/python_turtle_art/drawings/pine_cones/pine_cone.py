@@ -1,19 +1,24 @@
 import random
-from math import cos, sin
-from turtle import Turtle, Vec2D
+from turtle import RawTurtle, Vec2D
 from typing import Optional, Union
 
+import numpy as np
+from numpy.typing import NDArray
+
 from ...filling.colour_fill import ColourFill
-from ...helpers.angles import convert_degrees_to_radians
 from ...helpers.rotation import rotate_about_point
-from ...helpers.turtle import jump_to
+from ...instrumentation import increment_counter
 from ...lines.offset_from_line import OffsetFromLine
 from ...polygons.kites.curved_kite import CurvedKite
+from ...polygons.point_in_polygon import polygons_overlap_polygon
 from ...polygons.polygon import BaseFill
+from ...vertices.vertices import BoundingBox
 from .body import Arm, Limb
 from .body_part import BodyPart
 from .cuvred_kite_factory import CurvedKiteFactory
 from .face import CurvedMouth, CurvedTriangleMouth, Eyes, Mouth, RoundMouth
+from .layout import get_inner_kite_origins, get_origins_within
+from .scene import PineConeScene
 
 
 class PineCone:
@@ -31,6 +36,7 @@ class PineCone:
         inner_kite_colour: str = "white",
         initial_body_parts: tuple[BodyPart, ...] = (),
         final_body_parts: tuple[BodyPart, ...] = (),
+        clip_inner_kites: bool = False,
     ):
         self.outer_kite = outer_kite
         self.outer_kite_rotation = outer_kite_rotation
@@ -46,189 +52,114 @@ class PineCone:
         self.inner_kite_colour = inner_kite_colour
         self.initial_body_parts = initial_body_parts
         self.final_body_parts = final_body_parts
+        self.clip_inner_kites = clip_inner_kites
+
+    def build(self) -> PineConeScene:
+        """Calculate the kites of the pine cone, without drawing anything.
+
+        The outer kite is rotated on a copy, so the pine cone is not changed and
+        building again gives the same scene.
+
+        If clip_inner_kites is True, inner kites completely outside the outer kite
+        are left out. Kites whose bounding box does not overlap the outer kite's are
+        left out before their vertices are calculated, the rest are checked against
+        the outer kite's vertices with polygons_overlap_polygon. The number left out
+        is added to the inner_kites_culled counter. The kites left out are white so
+        are only visible where they cover something drawn earlier, e.g. the legs or
+        a neighbouring pine cone, which is why they are kept by default.
+
+        """
+        outer_kite = CurvedKite.from_trusted_vertices(
+            self.outer_kite.vertices_array,
+            corner_vertices_indices=self.outer_kite.corner_vertices_indices,
+        ).rotate(self.outer_kite_rotation, self.outer_kite.vertices[0])
+
+        inner_kite_origins = self._get_inner_kite_origins(outer_kite)
+        n_inner_kites = len(inner_kite_origins)
+
+        if self.clip_inner_kites:
+            inner_kite_origins = inner_kite_origins[
+                get_origins_within(
+                    inner_kite_origins,
+                    kite_bounding_box=self.inner_kite_factory.get_kite_bounding_box(),
+                    bounding_box=outer_kite.bounding_box,
+                )
+            ]
+
+        inner_kite_vertices, inner_kite_corner_vertices_indices = (
+            self.inner_kite_factory.get_kites_vertices(inner_kite_origins)
+        )
+
+        if self.clip_inner_kites:
+            inner_kite_vertices = inner_kite_vertices[
+                polygons_overlap_polygon(inner_kite_vertices, outer_kite.vertices_array)
+            ]
+            increment_counter(
+                "inner_kites_culled", n_inner_kites - len(inner_kite_vertices)
+            )
+
+        return PineConeScene.from_kite_vertices(
+            outer_kite=outer_kite,
+            inner_kite_vertices=inner_kite_vertices,
+            inner_kite_corner_vertices_indices=inner_kite_corner_vertices_indices,
+            outer_kite_line_width=self.outer_kite_line_width,
+            inner_kite_colour=self.inner_kite_colour,
+            inner_kite_fill=self.inner_kite_fill,
+            initial_body_parts=self.initial_body_parts,
+            final_body_parts=self.final_body_parts,
+        )
+
+    def draw(self, turtle: RawTurtle, viewport: BoundingBox | None = None):
+        """Draw the pine cone, by building its scene and rendering it.
+
+        To draw the same pine cone more than once, build the scene once and render
+        it each time instead.
+
+        Args:
+            turtle (RawTurtle): turtle to draw with.
+            viewport (BoundingBox | None): if given, inner kites whose bounding box
+                does not overlap the viewport are not drawn. Bounding boxes do not
+                include line widths, so the viewport should have a margin for them.
+
+        """
+        self.build().render(turtle, viewport=viewport)
 
-    def draw(self, turtle: Turtle):
-        """Draw the pine cone."""
+    def _get_inner_kite_origins(self, outer_kite: CurvedKite) -> NDArray[np.float64]:
+        """Get the origins of the inner kites, in the order they are drawn.
 
-        self._draw_initial_body_parts(turtle)
+        Kites are laid out in rows along the outer kite's vertical bisector, starting
+        at its first vertex, so outer_kite should be the rotated outer kite.
 
-        jump_to(turtle, self.outer_kite.vertices[0])
-        self.outer_kite.rotate(
-            self.outer_kite_rotation, self.outer_kite.vertices[0]
-        ).draw(turtle=turtle, colour="black")
-        self.outer_kite.fill(turtle=turtle, filler=ColourFill())
+        """
 
         if self.inner_kite_factory.height is None:
             raise ValueError("inner_kite_factory.height not specified")
-        else:
-            inner_kite_factory_height = self.inner_kite_factory.height
 
         if self.inner_kite_factory.width is None:
             raise ValueError("inner_kite_factory.width not specified")
-        else:
-            inner_kite_factory_half_width = self.inner_kite_factory.width / 2
 
         if self.inner_kite_factory.diagonal_intersection_along_height is None:
             raise ValueError(
                 "inner_kite_factory.diagonal_intersection_along_height not specified"
             )
-        else:
-            inner_kite_factory_diagonal_intersection_along_height = (
-                self.inner_kite_factory.diagonal_intersection_along_height
-            )
 
         if self.inner_kite_factory.rotation is None:
             raise ValueError("inner_kite_factory.rotation is None")
 
-        # number of inner kites to be drawn either side of the vertical bisector
-        n_side_inner_kites = (
-            int(
-                (self.outer_kite.get_width() / 2 - inner_kite_factory_half_width)
-                // self.inner_kite_factory.width
-            )
-            + 1
-        )
-
-        n_rows_inner_kites = (
-            int(self.outer_kite.get_height() // inner_kite_factory_height) + 1
-        )
-
-        inner_angle = convert_degrees_to_radians(self.outer_kite_rotation)
-
-        vertical_y_component = self.outer_kite.get_height() * cos(inner_angle)
-        vertical_x_component = self.outer_kite.get_height() * sin(inner_angle)
-
-        horizontal_x_component = self.outer_kite.get_width() * cos(inner_angle)
-        horizontal_y_component = -self.outer_kite.get_width() * sin(inner_angle)
-
-        unit_vector_vertical_move = Vec2D(
-            x=vertical_x_component / self.outer_kite.get_height(),
-            y=vertical_y_component / self.outer_kite.get_height(),
-        )
-
-        unit_vector_horizontal_move = Vec2D(
-            x=horizontal_x_component / self.outer_kite.get_width(),
-            y=horizontal_y_component / self.outer_kite.get_width(),
-        )
-
-        for row_number in range(n_rows_inner_kites):
-            center_origin = (
-                self.outer_kite.vertices[0]
-                + row_number
-                * (self.inner_kite_factory.height + 2 * self.vertical_offset)
-                * unit_vector_vertical_move
-            )
-
-            inner_kite = self.inner_kite_factory.get_kite(origin=center_origin)
-            jump_to(turtle, inner_kite.vertices[0])
-            inner_kite.draw(turtle=turtle, colour=self.inner_kite_colour)
-            inner_kite.fill(turtle=turtle, filler=self.inner_kite_fill)
-
-            center_origin_half_row_up = (
-                center_origin
-                + (
-                    self.vertical_offset
-                    + inner_kite_factory_diagonal_intersection_along_height
-                    * inner_kite_factory_height
-                )
-                * unit_vector_vertical_move
-            )
-
-            half_row_up_half_horizontal_move = (
-                self.inner_kite_factory.width + self.horizontal_offset
-            ) / 2
-
-            half_row_up_half_negative_horizontal_move = (
-                self.inner_kite_factory.width + self.horizontal_offset
-            ) / 2
-
-            # fill out row right from the center
-            for i in range(n_side_inner_kites):
-                offset_origin = (
-                    center_origin
-                    + (i + 1)
-                    * (self.inner_kite_factory.width + self.horizontal_offset)
-                    * unit_vector_horizontal_move
-                )
-
-                inner_kite = self.inner_kite_factory.get_kite(origin=offset_origin)
-                jump_to(turtle, inner_kite.vertices[0])
-                inner_kite.draw(
-                    turtle=turtle,
-                    colour=self.inner_kite_colour,
-                )
-                inner_kite.fill(turtle=turtle, filler=self.inner_kite_fill)
-
-                offset_origin_half_row_up = (
-                    center_origin_half_row_up
-                    + (
-                        half_row_up_half_horizontal_move
-                        + i * (self.inner_kite_factory.width + self.horizontal_offset)
-                    )
-                    * unit_vector_horizontal_move
-                )
-
-                inner_kite = self.inner_kite_factory.get_kite(
-                    origin=offset_origin_half_row_up
-                )
-                jump_to(turtle, inner_kite.vertices[0])
-                inner_kite.draw(
-                    turtle=turtle,
-                    colour=self.inner_kite_colour,
-                )
-                inner_kite.fill(turtle=turtle, filler=self.inner_kite_fill)
-
-            # fill out row left from the center
-            for i in range(n_side_inner_kites):
-                offset_origin = (
-                    center_origin
-                    - (i + 1)
-                    * (self.inner_kite_factory.width + self.horizontal_offset)
-                    * unit_vector_horizontal_move
-                )
-
-                inner_kite = self.inner_kite_factory.get_kite(origin=offset_origin)
-                jump_to(turtle, inner_kite.vertices[0])
-                inner_kite.draw(
-                    turtle=turtle,
-                    colour=self.inner_kite_colour,
-                )
-                inner_kite.fill(turtle=turtle, filler=self.inner_kite_fill)
-
-                offset_origin_half_row_up = (
-                    center_origin_half_row_up
-                    - (
-                        half_row_up_half_negative_horizontal_move
-                        + i * (self.inner_kite_factory.width + self.horizontal_offset)
-                    )
-                    * unit_vector_horizontal_move
-                )
-
-                inner_kite = self.inner_kite_factory.get_kite(
-                    origin=offset_origin_half_row_up
-                )
-                jump_to(turtle, inner_kite.vertices[0])
-                inner_kite.draw(
-                    turtle=turtle,
-                    colour=self.inner_kite_colour,
-                )
-                inner_kite.fill(turtle=turtle, filler=self.inner_kite_fill)
-
-        jump_to(turtle, self.outer_kite.vertices[0])
-        self.outer_kite.draw(
-            turtle=turtle, colour="black", size=self.outer_kite_line_width
+        return get_inner_kite_origins(
+            first_vertex=outer_kite.vertices[0],
+            outer_kite_height=outer_kite.get_height(),
+            outer_kite_width=outer_kite.get_width(),
+            rotation=self.outer_kite_rotation,
+            inner_kite_height=self.inner_kite_factory.height,
+            inner_kite_width=self.inner_kite_factory.width,
+            inner_kite_diagonal_intersection_along_height=(
+                self.inner_kite_factory.diagonal_intersection_along_height
+            ),
+            horizontal_offset=self.horizontal_offset,
+            vertical_offset=self.vertical_offset,
         )
 
-        self._draw_final_body_parts(turtle)
-
-    def _draw_initial_body_parts(self, turtle: Turtle):
-        for body_part in self.initial_body_parts:
-            body_part.draw(turtle)
-
-    def _draw_final_body_parts(self, turtle: Turtle):
-        for body_part in self.final_body_parts:
-            body_part.draw(turtle)
-
 
 class RandomPineConeFactory:
     """Class that creates randomised PineCone objects."""
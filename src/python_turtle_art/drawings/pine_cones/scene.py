@@ -0,0 +1,238 @@
+from dataclasses import dataclass, fields
+from turtle import RawTurtle
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+from ...backends.recording import DisplayList, RecordingTurtle
+from ...filling.colour_fill import ColourFill
+from ...helpers.turtle import jump_to
+from ...polygons.kites.curved_kite import CurvedKite
+from ...polygons.polygon import BaseFill
+from ...vertices.vertices import BoundingBox
+from .body_part import BodyPart
+
+
+@dataclass(frozen=True, eq=False)
+class PineConeScene:
+    """Everything needed to draw a pine cone, calculated before drawing.
+
+    Created by PineCone.build. The kites are held as read only vertex arrays and
+    the body parts as display lists of read only arrays, recorded with a black pen,
+    so a scene does not change when it is rendered. It can be kept and rendered any
+    number of times, to any backend, or pickled and sent to worker processes.
+    Scenes are equal if they draw the same thing, see diff.
+
+    Attributes:
+        outer_kite_vertices (NDArray[np.float64]): (n, 2) array of the vertices of
+            the outer kite, after rotation.
+        outer_kite_corner_vertices_indices (tuple[int, ...]): indices of the outer
+            kite's corners in outer_kite_vertices.
+        inner_kite_vertices (NDArray[np.float64]): (k, m, 2) array of the vertices of
+            the k inner kites, in the order they are drawn.
+        inner_kite_corner_vertices_indices (tuple[int, ...]): indices of the corners
+            in the vertices of each inner kite.
+        inner_kite_bounding_boxes (NDArray[np.float64]): (k, 4) array of the min x,
+            min y, max x and max y of each inner kite, used to cull inner kites
+            outside a viewport.
+        outer_kite_line_width (int): pen size of the final outer kite outline.
+        inner_kite_colour (str): pen colour of the inner kite outlines.
+        inner_kite_fill (BaseFill): fill for the inner kites.
+        initial_body_parts (DisplayList): lines, fills and dots of the body parts
+            drawn before the kites.
+        final_body_parts (DisplayList): lines, fills and dots of the body parts
+            drawn after the kites.
+        body_parts_bounding_box (BoundingBox | None): box containing the body parts,
+            except for line widths, or None if there are no body parts.
+
+    """
+
+    outer_kite_vertices: NDArray[np.float64]
+    outer_kite_corner_vertices_indices: tuple[int, ...]
+    inner_kite_vertices: NDArray[np.float64]
+    inner_kite_corner_vertices_indices: tuple[int, ...]
+    inner_kite_bounding_boxes: NDArray[np.float64]
+    outer_kite_line_width: int
+    inner_kite_colour: str
+    inner_kite_fill: BaseFill
+    initial_body_parts: DisplayList
+    final_body_parts: DisplayList
+    body_parts_bounding_box: BoundingBox | None
+
+    @classmethod
+    def from_kite_vertices(
+        cls,
+        outer_kite: CurvedKite,
+        inner_kite_vertices: NDArray[np.float64],
+        inner_kite_corner_vertices_indices: tuple[int, ...],
+        initial_body_parts: tuple[BodyPart, ...] = (),
+        final_body_parts: tuple[BodyPart, ...] = (),
+        **styles: Any,
+    ) -> "PineConeScene":
+        """Create scene from the rotated outer kite, inner kite vertices and body parts.
+
+        The bounding boxes of the inner kites are calculated from their vertices and
+        the body parts are recorded into display lists. The remaining fields of the
+        scene are passed as keyword arguments.
+
+        """
+        if inner_kite_vertices.ndim != 3 or inner_kite_vertices.shape[2] != 2:
+            raise ValueError("inner_kite_vertices must have shape (k, m, 2).")
+
+        if inner_kite_vertices.flags.writeable:
+            inner_kite_vertices = inner_kite_vertices.copy()
+            inner_kite_vertices.flags.writeable = False
+
+        inner_kite_bounding_boxes = np.concatenate(
+            (inner_kite_vertices.min(axis=1), inner_kite_vertices.max(axis=1)), axis=1
+        )
+        inner_kite_bounding_boxes.flags.writeable = False
+
+        body_parts_bounding_box = None
+        for body_part in initial_body_parts + final_body_parts:
+            body_part_bounding_box = body_part.get_bounding_box()
+            body_parts_bounding_box = (
+                body_part_bounding_box
+                if body_parts_bounding_box is None
+                else body_parts_bounding_box.union(body_part_bounding_box)
+            )
+
+        return cls(
+            outer_kite_vertices=outer_kite.vertices_array,
+            outer_kite_corner_vertices_indices=outer_kite.corner_vertices_indices,
+            inner_kite_vertices=inner_kite_vertices,
+            inner_kite_corner_vertices_indices=inner_kite_corner_vertices_indices,
+            inner_kite_bounding_boxes=inner_kite_bounding_boxes,
+            initial_body_parts=_record_body_parts(initial_body_parts),
+            final_body_parts=_record_body_parts(final_body_parts),
+            body_parts_bounding_box=body_parts_bounding_box,
+            **styles,
+        )
+
+    def __eq__(self, other: Any) -> bool:
+        """Check if scenes draw the same thing, see diff."""
+        if not isinstance(other, PineConeScene):
+            return False
+        return not self.diff(other)
+
+    def diff(self, other: "PineConeScene") -> list[str]:
+        """Get the names of the fields that differ between the scenes.
+
+        Arrays are compared with np.array_equal, display lists by their arrays and
+        styles and the inner kite fills by their class and attributes, so scenes
+        built from the same pine cone, or seed, have no differences.
+
+        """
+        return [
+            field.name
+            for field in fields(self)
+            if not _values_equal(getattr(self, field.name), getattr(other, field.name))
+        ]
+
+    def get_outer_kite(self) -> CurvedKite:
+        """Get the rotated outer kite as a CurvedKite."""
+        return CurvedKite.from_trusted_vertices(
+            self.outer_kite_vertices,
+            corner_vertices_indices=self.outer_kite_corner_vertices_indices,
+        )
+
+    def get_bounding_box(self) -> BoundingBox:
+        """Get a box containing the whole pine cone, except for line widths.
+
+        The box includes the outer kite, the inner kites and the body parts, so a
+        pine cone whose box does not overlap a viewport can be skipped entirely.
+
+        """
+        bounding_box = BoundingBox.from_points(self.outer_kite_vertices)
+
+        if len(self.inner_kite_bounding_boxes) > 0:
+            min_x, min_y = self.inner_kite_bounding_boxes[:, :2].min(axis=0).tolist()
+            max_x, max_y = self.inner_kite_bounding_boxes[:, 2:].max(axis=0).tolist()
+            bounding_box = bounding_box.union(BoundingBox(min_x, min_y, max_x, max_y))
+
+        if self.body_parts_bounding_box is not None:
+            bounding_box = bounding_box.union(self.body_parts_bounding_box)
+
+        return bounding_box
+
+    def get_inner_kites(self, viewport: BoundingBox | None = None) -> list[CurvedKite]:
+        """Get the inner kites, in the order they are drawn, as CurvedKites.
+
+        If viewport is given only the kites whose bounding box overlaps it, or
+        touches it, are returned.
+
+        """
+        if viewport is None:
+            indices = np.arange(len(self.inner_kite_vertices))
+        else:
+            min_x, min_y, max_x, max_y = self.inner_kite_bounding_boxes.T
+            indices = np.flatnonzero(
+                (min_x <= viewport.max_x)
+                & (viewport.min_x <= max_x)
+                & (min_y <= viewport.max_y)
+                & (viewport.min_y <= max_y)
+            )
+
+        return [
+            CurvedKite.from_trusted_vertices(
+                self.inner_kite_vertices[index],
+                corner_vertices_indices=self.inner_kite_corner_vertices_indices,
+            )
+            for index in indices
+        ]
+
+    def render(self, turtle: RawTurtle, viewport: BoundingBox | None = None):
+        """Draw the pine cone.
+
+        Args:
+            turtle (RawTurtle): turtle to draw with.
+            viewport (BoundingBox | None): if given, inner kites whose bounding box
+                does not overlap the viewport are not drawn. Bounding boxes do not
+                include line widths, so the viewport should have a margin for them.
+
+        """
+        self.initial_body_parts.replay(turtle)
+
+        outer_kite = self.get_outer_kite()
+
+        jump_to(turtle, outer_kite.vertices[0])
+        outer_kite.draw(turtle=turtle, colour="black")
+        outer_kite.fill(turtle=turtle, filler=ColourFill())
+
+        for inner_kite in self.get_inner_kites(viewport):
+            jump_to(turtle, inner_kite.vertices[0])
+            inner_kite.draw(turtle=turtle, colour=self.inner_kite_colour)
+            inner_kite.fill(turtle=turtle, filler=self.inner_kite_fill)
+
+        jump_to(turtle, outer_kite.vertices[0])
+        outer_kite.draw(turtle=turtle, colour="black", size=self.outer_kite_line_width)
+
+        self.final_body_parts.replay(turtle)
+
+
+def _record_body_parts(body_parts: tuple[BodyPart, ...]) -> DisplayList:
+    """Draw body parts onto a RecordingTurtle and get the read only display list."""
+    recording_turtle = RecordingTurtle()
+    for body_part in body_parts:
+        body_part.draw(recording_turtle)
+
+    display_list = recording_turtle.get_display_list()
+    for array in (
+        display_list.opcodes,
+        display_list.offsets,
+        display_list.coordinates,
+        display_list.style_indices,
+    ):
+        array.flags.writeable = False
+
+    return display_list
+
+
+def _values_equal(value: Any, other_value: Any) -> bool:
+    """Check if two values of a scene field are equal, see PineConeScene.diff."""
+    if isinstance(value, np.ndarray):
+        return np.array_equal(value, other_value)
+    if isinstance(value, BaseFill):
+        return type(value) is type(other_value) and vars(value) == vars(other_value)
+    return value == other_value
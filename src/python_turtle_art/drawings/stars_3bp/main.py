@@ -1,10 +1,12 @@
 from turtle import RawTurtle, Vec2D
+from typing import Optional
 
 from ...filling import ColourFill, HashFill
 from ...helpers.turtle import jump_to
 from ...lines.offset_from_line import OffsetFromLine
 from ...polygons.kites.convex_curved_kite import ConvexCurvedKite
 from ...polygons.kites.convex_kite import ConvexKite
+from ...vertices.vertices import BoundingBox
 
 
 def draw_background(turtle: RawTurtle) -> None:
@@ -36,7 +38,16 @@ def draw_circle_in_kite_centre(
     turtle.end_fill()
 
 
-def draw_image(turtle: RawTurtle):
+def draw_image(
+    turtle: RawTurtle, seed: int = 0, viewport: Optional[BoundingBox] = None
+):
+    """Draw stars image.
+
+    The image is not random so seed is not used. It is made of a few large shapes so
+    nothing is culled and viewport is not used either.
+
+    """
+
     draw_background(turtle)
 
     kite = ConvexKite.from_origin_and_dimensions(
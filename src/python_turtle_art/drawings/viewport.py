@@ -0,0 +1,15 @@
+from ..vertices.vertices import BoundingBox
+
+# added to every side of the viewport passed to drawings, to cover line widths as
+# bounding boxes of shapes do not include them
+VIEWPORT_MARGIN = 50
+
+
+def get_viewport(width: int | float, height: int | float) -> BoundingBox:
+    """Get the viewport to pass to drawings shown on a screen or image of this size.
+
+    The screen, or image, is centred on the turtle origin. VIEWPORT_MARGIN is added
+    on every side.
+
+    """
+    return BoundingBox.from_dimensions(width, height).expand(VIEWPORT_MARGIN)
@@ -1,11 +1,16 @@
 from turtle import RawTurtle
 
-from ...polygons.convex_polygon import BaseConvexFill, ConvexPolygon
-from .stripes_calculation import get_filling_lines
+from ...helpers.turtle import draw_polyline
+from ...polygons.convex_polygon import ConvexPolygon
+from ...polygons.polygon import BaseFill, Polygon
+from .stripes_calculation import get_filling_line_endpoints, get_filling_line_spans
 
 
-class HashFill(BaseConvexFill):
-    """Fill a convex polygon with crossed horizontal and vertical stripes.
+class HashFill(BaseFill):
+    """Fill a polygon with crossed horizontal and vertical stripes.
+
+    Convex polygons are filled with one stripe between two edges per stripe value,
+    other polygons with the spans from get_filling_line_spans.
 
     Args:
         gap (int): distance between each stripe.
@@ -22,23 +27,35 @@ class HashFill(BaseConvexFill):
         self.size = size
         self.colour = colour
 
-    def fill(self, turtle: RawTurtle, polygon: ConvexPolygon):
-        """Fill a convex polygon with crossed horizontal and vertical stripes.
+    def fill(self, turtle: RawTurtle, polygon: Polygon | ConvexPolygon):
+        """Fill a polygon with crossed horizontal and vertical stripes.
 
         Args:
             turtle (Turtle): turtle graphics object.
-            polygon (ConvexPolygon): convex polygon to fill.
+            polygon (Polygon | ConvexPolygon): polygon to fill.
 
         """
-        vertical_stripes = get_filling_lines(
-            origin=self.origin, gap=self.gap, polygon=polygon, axis=0
-        )
-        horizontal_stripes = get_filling_lines(
-            origin=self.origin, gap=self.gap, polygon=polygon, axis=1
-        )
+        if isinstance(polygon, ConvexPolygon):
+            vertical_stripes = get_filling_line_endpoints(
+                origin=self.origin, gap=self.gap, polygon=polygon, axis=0
+            )
+            horizontal_stripes = get_filling_line_endpoints(
+                origin=self.origin, gap=self.gap, polygon=polygon, axis=1
+            )
+        else:
+            vertical_stripes = get_filling_line_spans(
+                origin=self.origin, gap=self.gap, polygon=polygon, axis=0
+            )
+            horizontal_stripes = get_filling_line_spans(
+                origin=self.origin, gap=self.gap, polygon=polygon, axis=1
+            )
 
         for stripe in vertical_stripes:
-            stripe.draw(turtle=turtle, colour=self.colour, size=self.size)
+            draw_polyline(
+                turtle=turtle, points=stripe, colour=self.colour, size=self.size
+            )
 
         for stripe in horizontal_stripes:
-            stripe.draw(turtle=turtle, colour=self.colour, size=self.size)
+            draw_polyline(
+                turtle=turtle, points=stripe, colour=self.colour, size=self.size
+            )
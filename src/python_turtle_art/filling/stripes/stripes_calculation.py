@@ -1,14 +1,13 @@
 from collections import namedtuple
 from collections.abc import Sequence
-from turtle import Vec2D
 from warnings import warn
 
+import numpy as np
+from numpy.typing import NDArray
+
 from ...lines.line import Line
-from ...lines.line_intersection import (
-    get_horizontal_intersection_of_line,
-    get_vertical_intersection_of_line,
-)
 from ...polygons.convex_polygon import ConvexPolygon
+from ...polygons.polygon import Polygon
 from ...vertices.vertices import Axis
 
 StepsBetweenIndices = namedtuple("StepsBetweenIndices", ["a_to_b", "b_to_a"])
@@ -77,17 +76,29 @@ def get_incremenets_from_origin_within_range(
     return increments_in_range
 
 
-def get_filling_lines(
+def get_filling_line_endpoints(
     origin: int, gap: int, polygon: ConvexPolygon, axis: int = 0
-) -> list[Line]:
-    """Get the horizontal or vertical stripes to fill a convex polygon."""
+) -> NDArray[np.float64]:
+    """Get the end points of the horizontal or vertical stripes to fill a polygon.
 
-    axis_enum = Axis(axis)
+    The polygon's edges are split into two chains, from the vertex with the minimum
+    value on axis to the vertex with the maximum value and back again. Each stripe
+    crosses one edge of each chain. The crossed edges are found by comparing every
+    edge with every stripe value and all the intersections are calculated at once.
 
-    if axis_enum == Axis.x:
-        intersection_function = get_vertical_intersection_of_line
-    else:
-        intersection_function = get_horizontal_intersection_of_line
+    Args:
+        origin (int): the origin stripes are drawn relative to.
+        gap (int): distance between each stripe.
+        polygon (ConvexPolygon): convex polygon to fill.
+        axis (int): 0 for vertical stripes, 1 for horizontal stripes.
+
+    Returns:
+        NDArray[np.float64]: read only (K, 2, 2) array, stripe k runs from
+            [k, 0] on the first chain to [k, 1] on the second chain.
+
+    """
+    axis_enum = Axis(axis)
+    axis = axis_enum.value
 
     extreme_indices = polygon.get_vertices_indices_with_min_and_max_values_on_axis(
         axis=axis
@@ -98,89 +109,188 @@ def get_filling_lines(
     if min_index == max_index:
         raise ValueError("Polygon has no area to fill.")
 
-    min_ = polygon.vertices[min_index][axis]
-    max_ = polygon.vertices[max_index][axis]
+    vertices = polygon.vertices_array
 
-    stripe_values_on_axis = get_incremenets_from_origin_within_range(
-        origin=origin, increment=gap, min_=min_, max_=max_
+    stripe_values_on_axis = np.array(
+        get_incremenets_from_origin_within_range(
+            origin=origin,
+            increment=gap,
+            min_=vertices[min_index, axis],
+            max_=vertices[max_index, axis],
+        ),
+        dtype=np.float64,
     )
 
     number_steps = get_number_of_steps_between_indices(
-        index_a=min_index, index_b=max_index, sequence=polygon.vertices
+        index_a=min_index, index_b=max_index, sequence=range(len(vertices))
     )
-    number_steps_min_to_max = number_steps.a_to_b
-    number_steps_max_to_min = number_steps.b_to_a
-
-    stipe_counter = 0
-
-    stripe_points_at_each_value: dict[int, list[Vec2D]] = {
-        i: [] for i in range(len(stripe_values_on_axis))
-    }
-
-    for upward_step in range(number_steps_min_to_max):
-        index = (upward_step + min_index) % len(polygon.vertices)
-        next_index = (upward_step + min_index + 1) % len(polygon.vertices)
-
-        current_vertex = polygon.vertices[index]
-        next_vertex = polygon.vertices[next_index]
-
-        while (stipe_counter < len(stripe_values_on_axis)) and (
-            current_vertex[axis]
-            < stripe_values_on_axis[stipe_counter]
-            <= next_vertex[axis]
-        ):
-            intersection_point = intersection_function(
-                p0=current_vertex,
-                p1=next_vertex,
-                constant=stripe_values_on_axis[stipe_counter],
-            )
-
-            stripe_points_at_each_value[stipe_counter].append(intersection_point)
-
-            stipe_counter += 1
-
-    for stripe_index, stripe_points in stripe_points_at_each_value.items():
-        if len(stripe_points) != 1:
-            raise ValueError(
-                f"Horizontal stripe {stripe_index} does not have one vertex."
-            )
-
-    if stipe_counter != len(stripe_values_on_axis):
-        raise ValueError("Did not find all horizontal stripes.")
-
-    stipe_counter -= 1
-
-    for downward_step in range(number_steps_max_to_min):
-        index = (downward_step + max_index) % len(polygon.vertices)
-        next_index = (downward_step + max_index + 1) % len(polygon.vertices)
-
-        current_vertex = polygon.vertices[index]
-        next_vertex = polygon.vertices[next_index]
-
-        while (stipe_counter >= 0) and (
-            next_vertex[axis]
-            < stripe_values_on_axis[stipe_counter]
-            <= current_vertex[axis]
-        ):
-            intersection_point = intersection_function(
-                p0=current_vertex,
-                p1=next_vertex,
-                constant=stripe_values_on_axis[stipe_counter],
-            )
-
-            stripe_points_at_each_value[stipe_counter].append(intersection_point)
-
-            stipe_counter -= 1
-
-    for stripe_index, stripe_points in stripe_points_at_each_value.items():
-        if len(stripe_points) != 2:
-            raise ValueError(
-                f"Horizontal stripe {stripe_index} does not have two vertices."
-            )
-
-    stripe_lines = [
-        Line(vertices=tuple(stripe_points))
-        for stripe_points in stripe_points_at_each_value.values()
+
+    upward_chain = vertices[
+        (min_index + np.arange(number_steps.a_to_b + 1)) % len(vertices)
     ]
+    downward_chain = vertices[
+        (max_index + np.arange(number_steps.b_to_a + 1)) % len(vertices)
+    ]
+
+    endpoints = np.empty((len(stripe_values_on_axis), 2, 2), dtype=np.float64)
+
+    endpoints[:, 0] = _get_chain_intersections(
+        chain_starts=upward_chain[:-1],
+        chain_ends=upward_chain[1:],
+        lower=upward_chain[:-1, axis],
+        upper=upward_chain[1:, axis],
+        stripe_values=stripe_values_on_axis,
+        axis=axis,
+    )
+    endpoints[:, 1] = _get_chain_intersections(
+        chain_starts=downward_chain[:-1],
+        chain_ends=downward_chain[1:],
+        lower=downward_chain[1:, axis],
+        upper=downward_chain[:-1, axis],
+        stripe_values=stripe_values_on_axis,
+        axis=axis,
+    )
+
+    endpoints.flags.writeable = False
+
+    return endpoints
+
+
+def _get_chain_intersections(
+    chain_starts: NDArray,
+    chain_ends: NDArray,
+    lower: NDArray,
+    upper: NDArray,
+    stripe_values: NDArray,
+    axis: int,
+) -> NDArray:
+    """Get the point each stripe crosses a chain of edges.
+
+    Each stripe is matched to the first edge, in chain order, with
+    lower < stripe value <= upper.
+
+    """
+    crosses = (lower[:, None] < stripe_values[None, :]) & (
+        stripe_values[None, :] <= upper[:, None]
+    )
+
+    if not crosses.any(axis=0).all():
+        raise ValueError("Did not find all stripes.")
+
+    edge_indices = crosses.argmax(axis=0)
+
+    starts = chain_starts[edge_indices]
+    starts_to_ends = chain_ends[edge_indices] - starts
+
+    t = (stripe_values - starts[:, axis]) / starts_to_ends[:, axis]
+
+    return starts + starts_to_ends * t[:, None]
+
+
+def get_filling_line_spans(
+    origin: int, gap: int, polygon: Polygon | ConvexPolygon, axis: int = 0
+) -> NDArray[np.float64]:
+    """Get the spans of the horizontal or vertical stripes to fill any polygon.
+
+    Unlike get_filling_line_endpoints the polygon does not need to be convex, so a
+    stripe can cross the polygon's edges more than twice and be split into several
+    spans. The stripes are swept in order with an active edge table; the edges
+    are sorted by their minimum value on axis, an edge is added to the table for
+    the first stripe past its minimum and removed once the stripes pass its
+    maximum. The active edges crossing each stripe are intersected together
+    and sorted along the stripe, then paired up into spans, so the polygon is
+    filled with the even-odd rule. The table is filtered and its crossings sorted
+    for every stripe, so for E edges, S stripes and at most A edges active on a
+    stripe the cost is O(E log E + S A log A).
+
+    Edges are crossed by stripes with lower < stripe value <= upper, as in
+    get_filling_line_endpoints, so a stripe through a vertex is counted once for
+    the two edges meeting there. Spans with no length, e.g. where a stripe only
+    touches a vertex, are left out.
+
+    Args:
+        origin (int): the origin stripes are drawn relative to.
+        gap (int): distance between each stripe.
+        polygon (Polygon | ConvexPolygon): polygon to fill.
+        axis (int): 0 for vertical stripes, 1 for horizontal stripes.
+
+    Returns:
+        NDArray[np.float64]: read only (K, 2, 2) array, span k runs from [k, 0] to
+            [k, 1]. Spans are ordered by stripe, then along the stripe.
+
+    """
+    axis = Axis(axis).value
+    along_axis = 1 - axis
+
+    starts = polygon.vertices_array
+    ends = np.roll(starts, -1, axis=0)
+
+    lower = np.minimum(starts[:, axis], ends[:, axis])
+    upper = np.maximum(starts[:, axis], ends[:, axis])
+
+    if lower.min() == upper.max():
+        raise ValueError("Polygon has no area to fill.")
+
+    stripe_values_on_axis = get_incremenets_from_origin_within_range(
+        origin=origin, increment=gap, min_=lower.min(), max_=upper.max()
+    )
+
+    # edges along the stripes are never crossed, so are not added to the table
+    crossable_edges = np.flatnonzero(lower < upper)
+    edge_order = crossable_edges[np.argsort(lower[crossable_edges], kind="stable")]
+
+    # number of edges, in edge_order, with lower < each stripe value
+    n_started_edges = np.searchsorted(
+        lower[edge_order], stripe_values_on_axis, side="left"
+    )
+
+    active_edges = np.empty(0, dtype=np.intp)
+    n_added_edges = 0
+    spans = [np.empty((0, 2, 2))]
+
+    for stripe_value, n_started in zip(
+        stripe_values_on_axis, n_started_edges, strict=True
+    ):
+        active_edges = np.concatenate(
+            (active_edges, edge_order[n_added_edges:n_started])
+        )
+        n_added_edges = n_started
+        active_edges = active_edges[upper[active_edges] >= stripe_value]
+
+        edge_starts = starts[active_edges]
+        edge_starts_to_ends = ends[active_edges] - edge_starts
+
+        t = (stripe_value - edge_starts[:, axis]) / edge_starts_to_ends[:, axis]
+
+        crossings = edge_starts + edge_starts_to_ends * t[:, None]
+        crossings = crossings[np.argsort(crossings[:, along_axis], kind="stable")]
+
+        # the stripe is inside the polygon between each pair of crossings
+        stripe_spans = crossings.reshape(-1, 2, 2)
+        spans.append(
+            stripe_spans[
+                stripe_spans[:, 0, along_axis] < stripe_spans[:, 1, along_axis]
+            ]
+        )
+
+    endpoints = np.concatenate(spans)
+
+    endpoints.flags.writeable = False
+
+    return endpoints
+
+
+def get_filling_lines(
+    origin: int, gap: int, polygon: ConvexPolygon, axis: int = 0
+) -> list[Line]:
+    """Get the horizontal or vertical stripes to fill a convex polygon.
+
+    The stripes are calculated with get_filling_line_endpoints, Line objects are only
+    created here for callers that need them.
+
+    """
+    endpoints = get_filling_line_endpoints(
+        origin=origin, gap=gap, polygon=polygon, axis=axis
+    )
 
-    return stripe_lines
+    return [Line(vertices=stripe) for stripe in endpoints]
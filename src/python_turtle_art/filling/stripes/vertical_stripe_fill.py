@@ -1,11 +1,16 @@
 from turtle import RawTurtle
 
-from ...polygons.convex_polygon import BaseConvexFill, ConvexPolygon
-from .stripes_calculation import get_filling_lines
+from ...helpers.turtle import draw_polyline
+from ...polygons.convex_polygon import ConvexPolygon
+from ...polygons.polygon import BaseFill, Polygon
+from .stripes_calculation import get_filling_line_endpoints, get_filling_line_spans
 
 
-class VerticalStripeFill(BaseConvexFill):
-    """Fill a convex polygon with vertical stripes.
+class VerticalStripeFill(BaseFill):
+    """Fill a polygon with vertical stripes.
+
+    Convex polygons are filled with one stripe between two edges per stripe value,
+    other polygons with the spans from get_filling_line_spans.
 
     Args:
         gap (int): distance between each stripe.
@@ -24,17 +29,24 @@ class VerticalStripeFill(BaseConvexFill):
         self.size = size
         self.colour = colour
 
-    def fill(self, turtle: RawTurtle, polygon: ConvexPolygon):
-        """Fill a convex polygon with horizontal stipes.
+    def fill(self, turtle: RawTurtle, polygon: Polygon | ConvexPolygon):
+        """Fill a polygon with vertical stripes.
 
         Args:
             turtle (Turtle): turtle graphics object.
-            polygon (ConvexPolygon): convex polygon to fill.
+            polygon (Polygon | ConvexPolygon): polygon to fill.
 
         """
-        stripes = get_filling_lines(
-            origin=self.origin, gap=self.gap, polygon=polygon, axis=self.axis
-        )
+        if isinstance(polygon, ConvexPolygon):
+            stripes = get_filling_line_endpoints(
+                origin=self.origin, gap=self.gap, polygon=polygon, axis=self.axis
+            )
+        else:
+            stripes = get_filling_line_spans(
+                origin=self.origin, gap=self.gap, polygon=polygon, axis=self.axis
+            )
 
         for stripe in stripes:
-            stripe.draw(turtle=turtle, size=self.size, colour=self.colour)
+            draw_polyline(
+                turtle=turtle, points=stripe, colour=self.colour, size=self.size
+            )
@@ -2,6 +2,9 @@ from math import cos, sin
 from turtle import Vec2D
 from typing import Union
 
+import numpy as np
+from numpy.typing import NDArray
+
 from .angles import (
     convert_clockwise_angle_to_counter_clockwise,
     convert_degrees_to_radians,
@@ -28,22 +31,77 @@ def rotate_about_point(
         return point
 
     else:
-        angle_reversed = convert_clockwise_angle_to_counter_clockwise(angle)
-        angle_radians = convert_degrees_to_radians(angle_reversed)
+        cos_angle, sin_angle = get_rotation_cos_and_sin(angle)
 
         x_minus_alpha = point[0] - rotate_about_point_[0]
         y_minus_beta = point[1] - rotate_about_point_[1]
 
         rotated_x = (
             rotate_about_point_[0]
-            + x_minus_alpha * cos(angle_radians)
-            - y_minus_beta * sin(angle_radians)
+            + x_minus_alpha * cos_angle
+            - y_minus_beta * sin_angle
         )
 
         rotated_y = (
             rotate_about_point_[1]
-            + x_minus_alpha * sin(angle_radians)
-            + y_minus_beta * cos(angle_radians)
+            + x_minus_alpha * sin_angle
+            + y_minus_beta * cos_angle
         )
 
         return Vec2D(rotated_x, rotated_y)
+
+
+def get_rotation_cos_and_sin(angle: Union[int, float]) -> tuple[float, float]:
+    """Get cos and sin of the clockwise rotation angle (in degrees)."""
+    angle_reversed = convert_clockwise_angle_to_counter_clockwise(angle)
+    angle_radians = convert_degrees_to_radians(angle_reversed)
+
+    return cos(angle_radians), sin(angle_radians)
+
+
+def rotate_array_about_point(
+    points: NDArray,
+    angle: Union[int, float],
+    rotate_about_point: Vec2D | NDArray | None = None,
+) -> NDArray[np.float64]:
+    """Rotate (n, 2) array of points through angle (in degrees) about another point.
+
+    The same calculation as rotate_about_point is applied to all points at once, with
+    cos and sin of the angle only calculated once.
+
+    """
+    cos_angle, sin_angle = get_rotation_cos_and_sin(angle)
+
+    return rotate_array_with_cos_and_sin(
+        points,
+        cos_angle,
+        sin_angle,
+        np.zeros(2) if rotate_about_point is None else rotate_about_point,
+    )
+
+
+def rotate_array_with_cos_and_sin(
+    points: NDArray,
+    cos_angle: float | NDArray,
+    sin_angle: float | NDArray,
+    rotate_about_point: Vec2D | NDArray,
+) -> NDArray[np.float64]:
+    """Rotate (n, 2) array of points given cos and sin of the rotation angle.
+
+    cos_angle and sin_angle can be scalars or arrays of length n, and
+    rotate_about_point a single point or an (n, 2) array, to rotate each point by a
+    different angle or about a different point.
+
+    """
+    rotate_about = np.asarray(rotate_about_point, dtype=np.float64)
+    alpha = rotate_about[..., 0]
+    beta = rotate_about[..., 1]
+
+    x_minus_alpha = points[:, 0] - alpha
+    y_minus_beta = points[:, 1] - beta
+
+    rotated = np.empty(points.shape, dtype=np.float64)
+    rotated[:, 0] = alpha + x_minus_alpha * cos_angle - y_minus_beta * sin_angle
+    rotated[:, 1] = beta + x_minus_alpha * sin_angle + y_minus_beta * cos_angle
+
+    return rotated
@@ -1,4 +1,9 @@
+from collections.abc import Sequence
 from turtle import RawTurtle, TurtleScreen, Vec2D
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import numpy.typing
 
 
 def jump_to(turtle: RawTurtle, position: Vec2D) -> None:
@@ -8,6 +13,57 @@ def jump_to(turtle: RawTurtle, position: Vec2D) -> None:
     turtle.pendown()
 
 
+def draw_polyline(
+    turtle: RawTurtle,
+    points: "Sequence[Vec2D] | numpy.typing.NDArray",
+    colour: Any,
+    size: int | float | None = None,
+) -> None:
+    """Draw a line through points as one canvas item instead of one goto per point.
+
+    The turtle is left at the last point with the pen down and its pen colour and
+    size unchanged, the same state as after jumping to the first point and moving
+    to each of the others. If the turtle is filling the points are added to the
+    fill path. On a Tk screen the line is not animated and is not added to the undo
+    buffer.
+
+    Args:
+        turtle (RawTurtle): turtle to draw with.
+        points (Sequence[Vec2D] | NDArray): points to draw the line through.
+        colour (Any): pen colour for the line.
+        size (int | float | None): pen size for the line, defaults to the current
+            pen size.
+
+    """
+    from ..backends.headless import HeadlessTurtle
+    from ..backends.state_tracking import StateTrackingTurtle
+
+    if size is None:
+        size = turtle.pensize()
+
+    if isinstance(turtle, HeadlessTurtle | StateTrackingTurtle):
+        turtle.polyline(points, colour, size)
+        return
+
+    if isinstance(colour, tuple):
+        colour = turtle._colorstr((colour,))  # type: ignore
+
+    positions = [Vec2D(x, y) for x, y in points]
+    screen = turtle.screen
+
+    turtle.penup()
+
+    line_item = screen._createline()  # type: ignore
+    screen._drawline(line_item, positions, colour, size)  # type: ignore
+    turtle.items.append(line_item)  # type: ignore
+
+    if turtle.filling():
+        turtle._fillpath.extend(positions)  # type: ignore
+
+    turtle._position = positions[-1]  # type: ignore
+    turtle.pendown()
+
+
 def turn_off_turtle_animation(screen: TurtleScreen):
     """Turn off turtle animation."""
     screen.tracer(0, 0)
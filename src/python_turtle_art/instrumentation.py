@@ -0,0 +1,396 @@
+"""Counters and profiling recording how often work is done, or avoided, and its cost.
+
+Counters are always on and are cheap enough to increment in hot code. A Profiler
+is only active when requested, e.g. from the command line. While active it times
+the construction of every shape class under polygons and lines, every fill, the
+commands issued to instrumented turtles and the canvas items created and screen
+updates of instrumented screens, so nothing is added to drawing when not profiling.
+Modules only needed by a Profiler are imported when it is used, so importing the
+counters does not import them.
+
+"""
+
+import os
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from importlib import import_module
+from typing import Any
+
+_counters: Counter[str] = Counter()
+
+
+def increment_counter(name: str, count: int = 1) -> None:
+    """Add count to the counter called name."""
+    _counters[name] += count
+
+
+def get_counters() -> dict[str, int]:
+    """Get a copy of the current value of every counter."""
+    return dict(_counters)
+
+
+def reset_counters() -> None:
+    """Set all counters back to zero."""
+    _counters.clear()
+
+
+# packages whose classes are timed as shapes
+SHAPE_PACKAGES = ("python_turtle_art.polygons", "python_turtle_art.lines")
+
+# turtle methods counted as turtle commands, if the turtle has them
+TURTLE_COMMANDS = (
+    "goto",
+    "setpos",
+    "setposition",
+    "forward",
+    "fd",
+    "left",
+    "lt",
+    "right",
+    "rt",
+    "setheading",
+    "seth",
+    "penup",
+    "pu",
+    "up",
+    "pendown",
+    "pd",
+    "down",
+    "pencolor",
+    "pensize",
+    "width",
+    "fillcolor",
+    "begin_fill",
+    "end_fill",
+    "dot",
+    "circle",
+    "polyline",
+    "hideturtle",
+    "showturtle",
+)
+
+# screen methods creating canvas items, by the type of item created
+SCREEN_ITEM_METHODS = {
+    "line": "_createline",
+    "polygon": "_createpoly",
+    "image": "_createimage",
+}
+
+_active_profiler: "Profiler | None" = None
+
+
+class Profiler:
+    """Context manager recording the count and cumulative time of drawing work.
+
+    Timings are grouped by category:
+
+    - shapes, construction of each class under polygons and lines, by class name,
+      including shapes created with from_trusted_vertices
+    - fills, calls to fill of each BaseConvexFill subclass, by class name
+    - turtle_commands, calls to turtles passed to instrument_turtle, by method
+    - canvas_items, canvas items created on screens passed to instrument_screen
+    - screen, update and _update calls on screens passed to instrument_screen
+    - any other category passed to timed, e.g. export
+
+    Times are inclusive, so a fill creating shapes includes the time to create them.
+    Shape and fill classes are patched on entering and restored on exit. Only one
+    profiler can be active at a time.
+
+    Args:
+        trace (bool): keep every timed call as a Chrome trace event, for
+            write_chrome_trace.
+        cprofile (bool): also run cProfile while active, for write_pstats.
+
+    """
+
+    def __init__(self, trace: bool = False, cprofile: bool = False):
+        import cProfile
+
+        self.trace = trace
+        self.timings: dict[str, dict[str, list[int | float]]] = {}
+        self.trace_events: list[dict[str, Any]] = []
+        self.cprofile = cProfile.Profile() if cprofile else None
+        self.total_seconds = 0.0
+        self.counters: dict[str, int] = {}
+
+        self._active = False
+        self._start = 0.0
+        self._start_counters: dict[str, int] = {}
+        self._restore: list[tuple[type, str, Any]] = []
+
+    def __enter__(self) -> "Profiler":
+        global _active_profiler
+
+        if _active_profiler is not None:
+            raise ValueError("another Profiler is already active.")
+
+        self._patch_shapes()
+        self._patch_fills()
+
+        _active_profiler = self
+        self._active = True
+        self._start_counters = get_counters()
+        self._start = time.perf_counter()
+
+        if self.cprofile is not None:
+            self.cprofile.enable()
+
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        global _active_profiler
+
+        if self.cprofile is not None:
+            self.cprofile.disable()
+
+        self.total_seconds += time.perf_counter() - self._start
+        self._active = False
+        _active_profiler = None
+
+        for owner, name, original in reversed(self._restore):
+            if original is None:
+                delattr(owner, name)
+            else:
+                setattr(owner, name, original)
+        self._restore = []
+
+        for name, count in get_counters().items():
+            change = count - self._start_counters.get(name, 0)
+            if change != 0:
+                self.counters[name] = self.counters.get(name, 0) + change
+
+    def record(self, category: str, name: str, start: float, end: float) -> None:
+        """Add a call of name, in category, that ran from start to end."""
+        if not self._active:
+            return
+
+        timing = self.timings.setdefault(category, {}).setdefault(name, [0, 0.0])
+        timing[0] += 1
+        timing[1] += end - start
+
+        if self.trace:
+            self.trace_events.append(
+                {
+                    "name": name,
+                    "cat": category,
+                    "ph": "X",
+                    "ts": (start - self._start) * 1e6,
+                    "dur": (end - start) * 1e6,
+                    "pid": os.getpid(),
+                    "tid": threading.get_ident(),
+                }
+            )
+
+    def wrap(self, category: str, name: str, function: Callable) -> Callable:
+        """Get function wrapped to record each call of it as name in category."""
+
+        def timed_function(*args: Any, **kwargs: Any) -> Any:
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self.record(category, name, start, time.perf_counter())
+
+        return timed_function
+
+    def _patch(self, owner: type, name: str, replacement: Any) -> None:
+        """Set attribute name of class owner, keeping what to restore on exit."""
+        self._restore.append((owner, name, vars(owner).get(name)))
+        setattr(owner, name, replacement)
+
+    def _patch_outermost(self, cls: type, method: str, category: str) -> None:
+        """Time calls of cls.method only for instances of exactly cls.
+
+        Calls from subclass methods, through super(), are not recorded again as they
+        are already recorded under the subclass. If cls does not define method itself
+        the call is passed on to the next class in the instance's method resolution
+        order, as it would have been without the patch.
+
+        """
+        defined = vars(cls).get(method)
+
+        def call_original(instance: Any, *args: Any, **kwargs: Any) -> Any:
+            if defined is not None:
+                return defined(instance, *args, **kwargs)
+            return getattr(super(cls, instance), method)(*args, **kwargs)
+
+        timed_method = self.wrap(category, cls.__name__, call_original)
+
+        def method_for_cls(instance: Any, *args: Any, **kwargs: Any) -> Any:
+            if type(instance) is cls:
+                return timed_method(instance, *args, **kwargs)
+            return call_original(instance, *args, **kwargs)
+
+        self._patch(cls, method, method_for_cls)
+
+    def _patch_shapes(self) -> None:
+        from .vertices.vertices import VerticesMixin
+
+        fill_base = _get_fill_base()
+        shape_classes = [
+            cls
+            for cls in _get_package_classes(SHAPE_PACKAGES)
+            if not issubclass(cls, fill_base)
+        ]
+
+        for cls in shape_classes:
+            self._patch_outermost(cls, "__init__", "shapes")
+
+        from_trusted_vertices = vars(VerticesMixin)["from_trusted_vertices"].__func__
+
+        def timed_from_trusted_vertices(cls: type, *args: Any, **kwargs: Any) -> Any:
+            start = time.perf_counter()
+            try:
+                return from_trusted_vertices(cls, *args, **kwargs)
+            finally:
+                self.record("shapes", cls.__name__, start, time.perf_counter())
+
+        self._patch(
+            VerticesMixin,
+            "from_trusted_vertices",
+            classmethod(timed_from_trusted_vertices),
+        )
+
+    def _patch_fills(self) -> None:
+        import inspect
+
+        import_module("python_turtle_art.filling")
+
+        for cls in _get_subclasses(_get_fill_base()):
+            if not inspect.isabstract(cls):
+                self._patch_outermost(cls, "fill", "fills")
+
+    def instrument_turtle(self, turtle: Any) -> None:
+        """Record the commands called on turtle, by patching the turtle object."""
+        for command in TURTLE_COMMANDS:
+            if hasattr(turtle, command):
+                setattr(
+                    turtle,
+                    command,
+                    self.wrap("turtle_commands", command, getattr(turtle, command)),
+                )
+
+    def instrument_screen(self, screen: Any) -> None:
+        """Record canvas items created on, and updates of, a Tk turtle screen."""
+        for item, method in SCREEN_ITEM_METHODS.items():
+            setattr(
+                screen, method, self.wrap("canvas_items", item, getattr(screen, method))
+            )
+        for method in ("update", "_update"):
+            setattr(
+                screen, method, self.wrap("screen", method, getattr(screen, method))
+            )
+
+    def get_report(self) -> dict[str, Any]:
+        """Get the count and cumulative seconds of everything recorded, by category.
+
+        The change in each counter while the profiler was active is also included.
+
+        """
+        return {
+            "total_seconds": self.total_seconds,
+            "timings": {
+                category: {
+                    name: {"count": count, "seconds": seconds}
+                    for name, (count, seconds) in sorted(timings.items())
+                }
+                for category, timings in self.timings.items()
+            },
+            "counters": self.counters,
+        }
+
+    def write_report(self, file: str | os.PathLike, **metadata: Any) -> None:
+        """Write get_report, with metadata e.g. the drawing name, to a json file."""
+        import json
+
+        with open(file, "w") as f:
+            json.dump({**metadata, **self.get_report()}, f, indent=2)
+
+    def write_chrome_trace(self, file: str | os.PathLike) -> None:
+        """Write the trace events to a json file for chrome://tracing or Perfetto."""
+        if not self.trace:
+            raise ValueError("Profiler was not created with trace=True.")
+
+        import json
+
+        with open(file, "w") as f:
+            json.dump({"traceEvents": self.trace_events, "displayTimeUnit": "ms"}, f)
+
+    def write_pstats(self, file: str | os.PathLike) -> None:
+        """Write the cProfile stats to file, to be read with pstats."""
+        if self.cprofile is None:
+            raise ValueError("Profiler was not created with cprofile=True.")
+
+        self.cprofile.dump_stats(file)
+
+
+def _get_fill_base() -> type:
+    from .polygons.convex_polygon import BaseConvexFill
+
+    return BaseConvexFill
+
+
+def _get_package_classes(packages: tuple[str, ...]) -> list[type]:
+    """Get the classes defined in every module of packages."""
+    import inspect
+    import pkgutil
+
+    classes: list[type] = []
+    for package_name in packages:
+        package = import_module(package_name)
+        modules = [package] + [
+            import_module(module.name)
+            for module in pkgutil.walk_packages(package.__path__, f"{package_name}.")
+        ]
+        for module in modules:
+            classes.extend(
+                cls
+                for _, cls in inspect.getmembers(module, inspect.isclass)
+                if cls.__module__ == module.__name__
+            )
+    return classes
+
+
+def _get_subclasses(cls: type) -> list[type]:
+    """Get all subclasses of cls, direct or not."""
+    subclasses: list[type] = []
+    subclass: type
+    for subclass in cls.__subclasses__():
+        subclasses.append(subclass)
+        subclasses.extend(_get_subclasses(subclass))
+    return list(dict.fromkeys(subclasses))
+
+
+def get_active_profiler() -> Profiler | None:
+    """Get the active Profiler, if any."""
+    return _active_profiler
+
+
+@contextmanager
+def timed(category: str, name: str) -> Iterator[None]:
+    """Record the time taken by the block with the active Profiler, if any."""
+    if _active_profiler is None:
+        yield
+        return
+
+    profiler = _active_profiler
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        profiler.record(category, name, start, time.perf_counter())
+
+
+def instrument_turtle(turtle: Any) -> None:
+    """Record the commands called on turtle with the active Profiler, if any."""
+    if _active_profiler is not None:
+        _active_profiler.instrument_turtle(turtle)
+
+
+def instrument_screen(screen: Any) -> None:
+    """Record canvas items and updates of screen with the active Profiler, if any."""
+    if _active_profiler is not None:
+        _active_profiler.instrument_screen(screen)
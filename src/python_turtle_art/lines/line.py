@@ -1,5 +1,7 @@
 from turtle import Vec2D
 
+from numpy.typing import NDArray
+
 from ..vertices.vertices import DrawMixin, EqMixin, RotateMixin
 
 
@@ -8,19 +10,19 @@ class Line(DrawMixin, RotateMixin, EqMixin):
 
     _jump_to_vertex_index: int = 0
 
-    def __init__(self, vertices: tuple[Vec2D, ...]):
-        self.vertices = vertices
+    def __init__(self, vertices: tuple[Vec2D, ...] | NDArray):
+        self.vertices = vertices  # type: ignore
 
     @property
     def vertices(self) -> tuple[Vec2D, ...]:
-        return self._vertices
+        return self._get_vertices()
 
     @vertices.setter
-    def vertices(self, vertices: tuple[Vec2D, ...]) -> None:
+    def vertices(self, vertices: tuple[Vec2D, ...] | NDArray) -> None:
         """Set vertices attribute and check there are at least 2 points."""
         if len(vertices) < 2:
             raise ValueError("vertices must contain at least 2 points.")
-        self._vertices = vertices
+        self._set_vertices(vertices)
 
     def __repr__(self) -> str:
         return f"Line{self.vertices}"
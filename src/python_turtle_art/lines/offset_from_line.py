@@ -1,35 +1,64 @@
 from dataclasses import dataclass
+from functools import lru_cache
 from math import sqrt
 from turtle import Vec2D
 
+import numpy as np
+from numpy.typing import NDArray
+
+# number of offset points kept by OffsetFromLine.to_point
+OFFSET_POINT_CACHE_SIZE = 4096
+
 
 @dataclass
 class OffsetFromLine:
     """Class to create a point that is offset from a line.
 
     Attributes:
-        proportion_lenth (float): proportion of the length along the line
+        proportion_lenth (int | float): proportion of the length along the line
             the new point should be placed.
-        offset (int): perpendicular distance from line point should be placed.
+        offset (int | float): perpendicular distance from line point should be placed.
 
     """
 
-    proportion_lenth: float = 0.5
+    proportion_lenth: int | float = 0.5
     offset: int | float = 10
 
     def to_point(self, p0: Vec2D, p1: Vec2D) -> Vec2D:
         """Get point that is offset distance from p1 in direction that is
-        perpendicular to line p0 -> p1."""
+        perpendicular to line p0 -> p1.
 
-        delta = p1 - p0
+        Points are memoised by p0, p1, proportion_lenth and offset, as the same
+        control points are used repeatedly, e.g. when a curve is drawn twice. Use
+        offset_points_from_lines for many lines at once.
 
-        point_along_line = p0 + self.proportion_lenth * delta
-
-        return point_perpendicular_distance_from_line(
-            p0=p0, p1=point_along_line, distance=self.offset
+        """
+        return _offset_point(
+            p0[0], p0[1], p1[0], p1[1], self.proportion_lenth, self.offset
         )
 
 
+@lru_cache(maxsize=OFFSET_POINT_CACHE_SIZE)
+def _offset_point(
+    x0: int | float,
+    y0: int | float,
+    x1: int | float,
+    y1: int | float,
+    proportion_lenth: int | float,
+    offset: int | float,
+) -> Vec2D:
+    p0 = Vec2D(x0, y0)
+    p1 = Vec2D(x1, y1)
+
+    delta = p1 - p0
+
+    point_along_line = p0 + proportion_lenth * delta
+
+    return point_perpendicular_distance_from_line(
+        p0=p0, p1=point_along_line, distance=offset
+    )
+
+
 def point_perpendicular_distance_from_line(
     p0: Vec2D, p1: Vec2D, distance: int | float
 ) -> Vec2D:
@@ -44,3 +73,77 @@ def point_perpendicular_distance_from_line(
     y3 = p1[1] - distance * dx
 
     return Vec2D(x3, y3)
+
+
+def points_perpendicular_distance_from_lines(
+    p0: NDArray, p1: NDArray, distances: NDArray | int | float
+) -> NDArray[np.float64]:
+    """Find point_perpendicular_distance_from_line for many lines at once.
+
+    The same operations are done in the same order as the scalar function, so the
+    points are identical.
+
+    Args:
+        p0 (NDArray): (n, 2) array of the first point of each line.
+        p1 (NDArray): (n, 2) array of the second point of each line, the points are
+            found a distance from these.
+        distances (NDArray | int | float): distance for every line, or (n,) array of
+            the distance for each line.
+
+    Returns:
+        (n, 2) array of points.
+
+    """
+    p0, p1 = _check_lines(p0, p1)
+    distances = np.asarray(distances, dtype=np.float64).reshape(-1)
+
+    d = p0 - p1
+    dist = np.sqrt(d[:, 0] * d[:, 0] + d[:, 1] * d[:, 1])
+    dx = d[:, 0] / dist
+    dy = d[:, 1] / dist
+
+    return np.stack((p1[:, 0] + distances * dy, p1[:, 1] - distances * dx), axis=1)
+
+
+def offset_points_from_lines(
+    p0: NDArray,
+    p1: NDArray,
+    proportion_lenths: NDArray | int | float,
+    offsets: NDArray | int | float,
+) -> NDArray[np.float64]:
+    """Find OffsetFromLine.to_point for many lines at once.
+
+    The points are identical to calling to_point for each line.
+
+    Args:
+        p0 (NDArray): (n, 2) array of the start point of each line.
+        p1 (NDArray): (n, 2) array of the end point of each line.
+        proportion_lenths (NDArray | int | float): proportion of the length along
+            every line, or (n,) array of the proportion for each line.
+        offsets (NDArray | int | float): perpendicular distance from every line, or
+            (n,) array of the distance for each line.
+
+    Returns:
+        (n, 2) array of points.
+
+    """
+    p0, p1 = _check_lines(p0, p1)
+    proportion_lenths = np.asarray(proportion_lenths, dtype=np.float64).reshape(-1, 1)
+
+    points_along_lines = p0 + proportion_lenths * (p1 - p0)
+
+    return points_perpendicular_distance_from_lines(
+        p0=p0, p1=points_along_lines, distances=offsets
+    )
+
+
+def _check_lines(
+    p0: NDArray, p1: NDArray
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    p0 = np.asarray(p0, dtype=np.float64)
+    p1 = np.asarray(p1, dtype=np.float64)
+
+    if p0.ndim != 2 or p0.shape[1] != 2 or p0.shape != p1.shape:
+        raise ValueError("p0 and p1 must have the same shape (n, 2).")
+
+    return p0, p1
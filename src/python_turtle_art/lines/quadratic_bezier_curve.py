@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from turtle import Vec2D
 
 import numpy as np
+from numpy.typing import NDArray
 
 from .line import Line
 from .offset_from_line import OffsetFromLine
@@ -14,6 +16,52 @@ def quadratic_bezier_curve(t: float, p0: Vec2D, p1: Vec2D, p2: Vec2D):
     return p1 + (1 - t) ** 2 * (p0 - p1) + t**2 * (p2 - p1)
 
 
+@lru_cache(maxsize=64)
+def get_quadratic_bernstein_basis(steps: int) -> NDArray[np.float64]:
+    """Get (steps, 3) matrix of quadratic Bernstein polynomials at steps values of t.
+
+    Row i holds the weights of the start, control and end points for the i-th of
+    steps evenly spaced values of t from 0 to 1. The returned array is read only as
+    it is shared between callers.
+
+    """
+    t = np.linspace(0, 1, steps)
+
+    basis = np.stack([(1 - t) ** 2, 2 * t * (1 - t), t**2], axis=1)
+    basis.flags.writeable = False
+
+    return basis
+
+
+def evaluate_quadratic_bezier_curves(
+    control_points: NDArray, steps: int = 10
+) -> NDArray[np.float64]:
+    """Get points on many quadratic bezier curves at once.
+
+    Args:
+        control_points (NDArray): (M, 3, 2) array of the start, control and end points
+            of M curves.
+        steps (int): number of points to calculate on each curve.
+
+    Returns:
+        (M, steps, 2) array of points.
+
+    """
+    return get_quadratic_bernstein_basis(steps) @ control_points
+
+
+def get_points_array_on_quadratic_bezier_curve(
+    start: Vec2D,
+    end: Vec2D,
+    off_line_point: Vec2D,
+    steps: int = 10,
+) -> NDArray[np.float64]:
+    """Get (steps, 2) array of points on a quadratic bezier curve."""
+    control_points = np.array([start, off_line_point, end], dtype=np.float64)
+
+    return get_quadratic_bernstein_basis(steps) @ control_points
+
+
 def get_points_on_quadratic_bezier_curve(
     start: Vec2D,
     end: Vec2D,
@@ -29,17 +77,16 @@ def get_points_on_quadratic_bezier_curve(
         steps (int): number of steps to take in line.
 
     """
-    increments = np.linspace(0, 1, steps)
-
-    return tuple(
-        quadratic_bezier_curve(increment, start, off_line_point, end)
-        for increment in increments
+    points = get_points_array_on_quadratic_bezier_curve(
+        start, end, off_line_point, steps
     )
 
+    return tuple(Vec2D(x, y) for x, y in points.tolist())
+
 
 class QuadraticBezierCurve(Line):
-    def __init__(self, vertices: tuple[Vec2D, ...]):
-        self.vertices = vertices
+    def __init__(self, vertices: tuple[Vec2D, ...] | NDArray):
+        self.vertices = vertices  # type: ignore
 
     @classmethod
     def from_start_and_end(
@@ -58,8 +105,9 @@ class QuadraticBezierCurve(Line):
             diff = end - start
             off_line_point = Vec2D(start[0] + diff[0] / 2, start[1] + diff[1] / 2)
 
-        vertices = get_points_on_quadratic_bezier_curve(
+        vertices = get_points_array_on_quadratic_bezier_curve(
             start, end, off_line_point, steps
         )
+        vertices.flags.writeable = False
 
         return QuadraticBezierCurve(vertices=vertices)
@@ -0,0 +1,130 @@
+from turtle import Vec2D
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .convex_polygon import ConvexPolygon
+from .is_convex import is_convex
+from .polygon import Polygon
+
+
+def clip_polygon(
+    polygon: Polygon | ConvexPolygon, convex_polygon: ConvexPolygon
+) -> NDArray[np.float64]:
+    """Get the vertices of the part of polygon inside convex_polygon.
+
+    See clip_vertices. convex_polygon is already known to be convex so it is not
+    checked again.
+
+    Args:
+        polygon (Polygon | ConvexPolygon): polygon to clip.
+        convex_polygon (ConvexPolygon): polygon to clip to.
+
+    Returns:
+        NDArray[np.float64]: array of shape (p, 2) of the vertices of the clipped
+            polygon, with p = 0 if the polygons do not overlap.
+
+    """
+    return _clip(polygon.vertices_array, convex_polygon.vertices_array)
+
+
+def clip_vertices(
+    vertices: tuple[Vec2D, ...] | NDArray, convex_vertices: tuple[Vec2D, ...] | NDArray
+) -> NDArray[np.float64]:
+    """Get the vertices of the part of a polygon inside a convex clip polygon.
+
+    Uses the Sutherland–Hodgman algorithm;
+    https://en.wikipedia.org/wiki/Sutherland%E2%80%93Hodgman_algorithm. The polygon
+    is clipped to the inside of each edge of the clip polygon in turn. For each
+    clip edge every vertex of the polygon is tested, and the edges crossing the
+    clip edge intersected with it, in one operation.
+
+    The polygon does not need to be convex, the clip polygon does and can go
+    clockwise or anticlockwise. Points on the clip polygon's edges are inside. If
+    clipping splits a non convex polygon in to separate parts they are joined by
+    edges along the clip polygon's boundary. Repeated consecutive vertices are
+    removed from the result.
+
+    Args:
+        vertices (tuple[Vec2D, ...] | NDArray): vertices of the polygon to clip.
+        convex_vertices (tuple[Vec2D, ...] | NDArray): vertices of the convex
+            polygon to clip to.
+
+    Returns:
+        NDArray[np.float64]: array of shape (p, 2) of the vertices of the clipped
+            polygon, with p = 0 if the polygons do not overlap.
+
+    """
+    vertices = _check_vertices(vertices, "vertices")
+    convex_vertices = _check_vertices(convex_vertices, "convex_vertices")
+
+    if not is_convex(convex_vertices):
+        raise ValueError("convex_vertices must form a convex polygon.")
+
+    return _clip(vertices, convex_vertices)
+
+
+def _check_vertices(
+    vertices: tuple[Vec2D, ...] | NDArray, name: str
+) -> NDArray[np.float64]:
+    vertices = np.asarray(vertices, dtype=np.float64)
+
+    if vertices.ndim != 2 or vertices.shape[1] != 2 or len(vertices) < 3:
+        raise ValueError(f"{name} must have shape (n, 2) with n at least 3.")
+
+    return vertices
+
+
+def _clip(
+    vertices: NDArray[np.float64], convex_vertices: NDArray[np.float64]
+) -> NDArray[np.float64]:
+    """Clip vertices to the polygon convex_vertices, see clip_vertices."""
+    # twice the signed area of the clip polygon, positive if it goes anticlockwise
+    x, y = convex_vertices.T
+    signed_area = np.sum(x * np.roll(y, -1) - np.roll(x, -1) * y)
+
+    if signed_area == 0:
+        raise ValueError("clip polygon has zero area.")
+
+    orientation = np.sign(signed_area)
+
+    for start, end in zip(
+        convex_vertices, np.roll(convex_vertices, -1, axis=0), strict=True
+    ):
+        if len(vertices) == 0:
+            break
+
+        # perp dot product of the clip edge and start to each vertex, positive if
+        # the vertex is on the inside of the clip edge
+        edge = end - start
+        sides = orientation * (
+            edge[0] * (vertices[:, 1] - start[1])
+            - edge[1] * (vertices[:, 0] - start[0])
+        )
+        inside = sides >= 0
+
+        previous_vertices = np.roll(vertices, 1, axis=0)
+        previous_sides = np.roll(sides, 1)
+        crosses = inside != np.roll(inside, 1)
+
+        # where the edge from the previous vertex to each vertex crosses the clip
+        # edge, sides differ in sign for edges that cross so the division by zero
+        # for other edges does not affect the result
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t = previous_sides / (previous_sides - sides)
+            intersections = previous_vertices + t[:, np.newaxis] * (
+                vertices - previous_vertices
+            )
+
+        # for each edge; the intersection if it crosses, then the vertex if inside
+        vertices = np.stack((intersections, vertices), axis=1)[
+            np.stack((crosses, inside), axis=1)
+        ]
+
+    if len(vertices) > 0:
+        vertices = vertices[(vertices != np.roll(vertices, 1, axis=0)).any(axis=1)]
+
+    if len(vertices) < 3:
+        return np.empty((0, 2))
+
+    return vertices
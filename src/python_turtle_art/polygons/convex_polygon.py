@@ -3,6 +3,8 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from turtle import RawTurtle, Vec2D
 
+from numpy.typing import NDArray
+
 from ..vertices.vertices import DrawMixin, EqMixin, GetExtremeVerticesMixin, RotateMixin
 from .is_convex import is_convex
 
@@ -25,10 +27,10 @@ class ConvexPolygon(DrawMixin, RotateMixin, GetExtremeVerticesMixin, EqMixin):
 
     @property
     def vertices(self) -> tuple[Vec2D, ...]:
-        return self._vertices
+        return self._get_vertices()
 
     @vertices.setter
-    def vertices(self, vertices: tuple[Vec2D, ...]) -> None:
+    def vertices(self, vertices: tuple[Vec2D, ...] | NDArray) -> None:
         """Perform checks on vertices and set attributes.
 
         Check at least 3 vertices are passed and the vertices form a convex polygon are
@@ -39,7 +41,7 @@ class ConvexPolygon(DrawMixin, RotateMixin, GetExtremeVerticesMixin, EqMixin):
             raise ValueError("vertices must contain at least 3 points.")
         if not is_convex(vertices):
             raise ValueError("Polygon defined by supplied vertices are not convex.")
-        self._vertices = vertices
+        self._set_vertices(vertices)
 
     def fill(self, turtle: RawTurtle, filler: BaseConvexFill):
         """Fill the polygon."""
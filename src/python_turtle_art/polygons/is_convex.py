@@ -1,7 +1,13 @@
 from turtle import Vec2D
 
+import numpy as np
+from numpy.typing import NDArray
 
-def is_convex(vertices: tuple[Vec2D, ...]) -> bool:
+# minimum number of vertices for is_convex to use numpy rather than a python loop
+VECTORISED_MIN_VERTICES = 200
+
+
+def is_convex(vertices: tuple[Vec2D, ...] | NDArray) -> bool:
     """Does a set of vertices form a convex polygon?
 
     For a polygon to be convex there must be exactly 2 flips in the direction of x
@@ -29,7 +35,22 @@ def is_convex(vertices: tuple[Vec2D, ...]) -> bool:
     are pointing out from the same point rather than the first vector pointing to
     the start of the second vector.
 
+    Arrays with at least VECTORISED_MIN_VERTICES vertices are checked with numpy,
+    see is_convex_many, otherwise the vertices are looped over as numpy's overhead
+    outweighs the saving for few vertices. Both give the same result.
+
     """
+    if isinstance(vertices, np.ndarray) and len(vertices) >= VECTORISED_MIN_VERTICES:
+        return bool(is_convex_many(vertices[np.newaxis])[0])
+
+    return _is_convex_loop(vertices)
+
+
+def _is_convex_loop(vertices: tuple[Vec2D, ...] | NDArray) -> bool:
+    """Check convexity one vertex at a time, see is_convex."""
+
+    if isinstance(vertices, np.ndarray):
+        vertices = vertices.tolist()
 
     w_sign = 0.0  # First nonzero orientation (positive or negative)
 
@@ -107,3 +128,68 @@ def is_convex(vertices: tuple[Vec2D, ...]) -> bool:
 
     # Convex polygons have two sign flips along each axis.
     return (x_flips == 2) and (y_flips == 2)
+
+
+def is_convex_many(vertices: NDArray) -> NDArray[np.bool_]:
+    """Check if each polygon in a stack of polygons is convex.
+
+    The polygons must all have the same number of vertices. Gives the same results as
+    calling is_convex on each polygon.
+
+    Args:
+        vertices (NDArray): array of shape (number of polygons, number of vertices, 2).
+
+    Returns:
+        NDArray[np.bool_]: array of shape (number of polygons,).
+
+    """
+    vertices = np.asarray(vertices, dtype=np.float64)
+
+    if vertices.ndim != 3 or vertices.shape[-1] != 2:
+        raise ValueError("vertices must have shape (n, m, 2).")
+
+    # edge vectors; after[:, i] goes from vertex i - 1 to vertex i and before[:, i]
+    # from vertex i - 2 to vertex i - 1
+    after = vertices - np.roll(vertices, 1, axis=1)
+    before = np.roll(after, 1, axis=1)
+
+    x_flips = _count_sign_flips(after[..., 0])
+    y_flips = _count_sign_flips(after[..., 1])
+
+    w = before[..., 0] * after[..., 1] - after[..., 0] * before[..., 1]
+
+    return ~_has_orientation_change(w) & (x_flips == 2) & (y_flips == 2)
+
+
+def _count_sign_flips(values: NDArray[np.float64]) -> NDArray[np.intp]:
+    """Count the changes of sign, going round each row, ignoring zeros.
+
+    Zeros, and nans, are replaced with the previous non zero sign in the row, going
+    round the end of the row back to the start, so they never add a flip.
+
+    """
+    signs = (values > 0).view(np.int8) - (values < 0).view(np.int8)
+
+    previous_non_zero = np.where(signs != 0, np.arange(signs.shape[1]), -1)
+    np.maximum.accumulate(previous_non_zero, axis=1, out=previous_non_zero)
+    previous_non_zero = np.where(
+        previous_non_zero < 0, previous_non_zero[:, -1:], previous_non_zero
+    )
+
+    filled_signs = np.take_along_axis(signs, previous_non_zero, axis=1)
+
+    return np.count_nonzero(filled_signs != np.roll(filled_signs, 1, axis=1), axis=1)
+
+
+def _has_orientation_change(w: NDArray[np.float64]) -> NDArray[np.bool_]:
+    """Check if the perp dot products in each row change sign.
+
+    The orientation is set by the first non zero value, so rows where that is nan are
+    treated as never changing orientation.
+
+    """
+    first_non_zero = np.take_along_axis(
+        w, np.argmax(w != 0, axis=1)[:, np.newaxis], axis=1
+    )[:, 0]
+
+    return (w > 0).any(axis=1) & (w < 0).any(axis=1) & ~np.isnan(first_non_zero)
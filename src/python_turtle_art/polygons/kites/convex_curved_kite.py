@@ -36,7 +36,7 @@ class ConvexCurvedKite(ConvexPolygon, CurvedKite):
                 with the horizontal bisector.
 
         """
-        vertices, corner_vertices_indices = CurvedKite.get_curved_kite_vertices(
+        vertices, corner_vertices_indices = CurvedKite.get_curved_kite_vertices_array(
             origin=origin,
             height=height,
             width=width,
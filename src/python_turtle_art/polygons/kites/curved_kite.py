@@ -2,8 +2,11 @@ from __future__ import annotations
 
 from turtle import Vec2D
 
-from ...lines.offset_from_line import OffsetFromLine
-from ...lines.quadratic_bezier_curve import get_points_on_quadratic_bezier_curve
+import numpy as np
+from numpy.typing import NDArray
+
+from ...lines.offset_from_line import OffsetFromLine, offset_points_from_lines
+from ...lines.quadratic_bezier_curve import evaluate_quadratic_bezier_curves
 from .kite import Kite
 
 
@@ -12,23 +15,23 @@ class CurvedKite(Kite):
 
     def __init__(
         self,
-        vertices: tuple[Vec2D, ...],
+        vertices: tuple[Vec2D, ...] | NDArray,
         corner_vertices_indices: tuple[int, ...],
     ):
         """Define the curved convex kite by it's vertices."""
-        self.vertices = vertices
+        self.vertices = vertices  # type: ignore
         self.corner_vertices_indices = corner_vertices_indices
 
     @property
     def vertices(self) -> tuple[Vec2D, ...]:
-        return self._vertices
+        return self._get_vertices()
 
     @vertices.setter
-    def vertices(self, vertices: tuple[Vec2D, ...]) -> None:
+    def vertices(self, vertices: tuple[Vec2D, ...] | NDArray) -> None:
         """Set vertices attribute and check there are at least 3 points."""
         if len(vertices) <= 4:
             raise ValueError("vertices must contain more than 4 points.")
-        self._vertices = vertices
+        self._set_vertices(vertices)
 
     @classmethod
     def from_origin_and_dimensions(
@@ -47,7 +50,7 @@ class CurvedKite(Kite):
     ) -> CurvedKite:
         """Define a CurvedKite from origin point and dimensions."""
 
-        vertices, corner_vertices_indices = CurvedKite.get_curved_kite_vertices(
+        vertices, corner_vertices_indices = CurvedKite.get_curved_kite_vertices_array(
             origin=origin,
             height=height,
             width=width,
@@ -74,6 +77,40 @@ class CurvedKite(Kite):
         ),
         steps_in_curves: int = 20,
     ) -> tuple[tuple[Vec2D, ...], tuple[int, ...]]:
+        vertices, corner_vertices_indices = CurvedKite.get_curved_kite_vertices_array(
+            origin=origin,
+            height=height,
+            width=width,
+            diagonal_intersection_along_height=diagonal_intersection_along_height,
+            off_lines=off_lines,
+            steps_in_curves=steps_in_curves,
+        )
+
+        return (
+            tuple(Vec2D(x, y) for x, y in vertices.tolist()),
+            corner_vertices_indices,
+        )
+
+    @staticmethod
+    def get_curved_kite_vertices_array(
+        origin: Vec2D,
+        height: int | float = 20,
+        width: int | float = 20,
+        diagonal_intersection_along_height: float = 0.5,
+        off_lines: tuple[OffsetFromLine, ...] = (
+            OffsetFromLine(),
+            OffsetFromLine(),
+            OffsetFromLine(),
+            OffsetFromLine(),
+        ),
+        steps_in_curves: int = 20,
+    ) -> tuple[NDArray[np.float64], tuple[int, ...]]:
+        """Get the vertices of the curved kite as a read only (n, 2) array.
+
+        The four curved edges are evaluated together with
+        evaluate_quadratic_bezier_curves.
+
+        """
         if len(off_lines) != 4:
             raise ValueError("off_lines must contain 4 elements.")
 
@@ -84,31 +121,26 @@ class CurvedKite(Kite):
             diagonal_intersection_along_height=diagonal_intersection_along_height,
         )
 
-        curved_edges: list[Vec2D]
-        curved_edges = []
+        control_points = np.empty((4, 3, 2), dtype=np.float64)
 
-        for index in range(len(kite_corner_points)):
-            end_index = index + 1
-            if end_index == 4:
-                end_index = 0
-
-            control_point = off_lines[index].to_point(
-                kite_corner_points[index], kite_corner_points[end_index]
-            )
-
-            curve_points = get_points_on_quadratic_bezier_curve(
-                start=kite_corner_points[index],
-                end=kite_corner_points[end_index],
-                off_line_point=control_point,
-                steps=steps_in_curves,
-            )
+        # each edge runs from a corner to the next, wrapping round to the first
+        control_points[:, 0] = kite_corner_points
+        control_points[:, 2] = np.roll(control_points[:, 0], -1, axis=0)
+        control_points[:, 1] = offset_points_from_lines(
+            p0=control_points[:, 0],
+            p1=control_points[:, 2],
+            proportion_lenths=np.array([x.proportion_lenth for x in off_lines]),
+            offsets=np.array([x.offset for x in off_lines]),
+        )
 
-            curved_edges.extend(curve_points[:-1])
+        curves = evaluate_quadratic_bezier_curves(control_points, steps=steps_in_curves)
 
-        vertices = tuple(curved_edges)
+        # the last point of each curve is the first point of the next
+        vertices = curves[:, :-1].reshape(-1, 2)
+        vertices.flags.writeable = False
 
         corner_vertices_indices = tuple(
-            x for x in range(0, len(curved_edges), steps_in_curves - 1)
+            x for x in range(0, len(vertices), steps_in_curves - 1)
         )
 
         return vertices, corner_vertices_indices
@@ -4,6 +4,9 @@ from math import sqrt
 from turtle import Vec2D
 from typing import Any
 
+import numpy as np
+from numpy.typing import NDArray
+
 from ..polygon import Polygon
 
 
@@ -17,22 +20,22 @@ class Kite(Polygon):
 
     def __init__(
         self,
-        vertices: tuple[Vec2D, ...],
+        vertices: tuple[Vec2D, ...] | NDArray,
     ):
         """Define the kite by it's vertices."""
-        self.vertices = vertices
+        self.vertices = vertices  # type: ignore
         self.corner_vertices_indices = (0, 1, 2, 3)
 
     @property
     def vertices(self) -> tuple[Vec2D, ...]:
-        return self._vertices
+        return self._get_vertices()
 
     @vertices.setter
-    def vertices(self, vertices: tuple[Vec2D, ...]) -> None:
+    def vertices(self, vertices: tuple[Vec2D, ...] | NDArray) -> None:
         """Set vertices attribute and check there are exactly 4 points."""
         if len(vertices) != 4:
             raise ValueError("vertices must contain exactly 4 points.")
-        self._vertices = vertices
+        self._set_vertices(vertices)
 
     @property
     def corner_vertices_indices(self) -> tuple[int, ...]:
@@ -113,7 +116,7 @@ class Kite(Polygon):
 
     def __eq__(self, other: Any) -> bool:
         if isinstance(other, Kite):
-            return (self.vertices == other.vertices) and (
+            return np.array_equal(self.vertices_array, other.vertices_array) and (
                 self.corner_vertices_indices == self.corner_vertices_indices
             )
         else:
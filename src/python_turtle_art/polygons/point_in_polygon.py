@@ -0,0 +1,149 @@
+import numpy as np
+from numpy.typing import NDArray
+
+# number of polygons tested together by polygons_overlap_polygon, limiting the size
+# of the (polygons, vertices, vertices) arrays created
+OVERLAP_CHUNK_SIZE = 256
+
+
+def points_in_polygon(points: NDArray, vertices: NDArray) -> NDArray[np.bool_]:
+    """Check if each point is inside the polygon with the given vertices.
+
+    Uses the even-odd rule; a point is inside if a ray from the point in the
+    positive x direction crosses the edges of the polygon an odd number of times.
+    https://wrfranklin.org/Research/Short_Notes/pnpoly.html. The polygon does not
+    need to be convex. Points exactly on an edge can be found either inside or
+    outside.
+
+    Args:
+        points (NDArray): array of shape (..., 2) of points to check.
+        vertices (NDArray): array of shape (n, 2) of the vertices of the polygon.
+
+    Returns:
+        NDArray[np.bool_]: array of shape (...), True for points inside the polygon.
+
+    """
+    points = np.asarray(points, dtype=np.float64)
+    vertices = _check_vertices(vertices)
+
+    if points.shape[-1:] != (2,):
+        raise ValueError("points must have shape (..., 2).")
+
+    return _is_odd_crossings(
+        points[..., np.newaxis, :], vertices, np.roll(vertices, -1, axis=0)
+    )
+
+
+def polygons_overlap_polygon(polygons: NDArray, vertices: NDArray) -> NDArray[np.bool_]:
+    """Check if each of a stack of polygons overlaps the polygon with vertices.
+
+    Two polygons overlap if a vertex of one is inside the other or if any of their
+    edges intersect, so a polygon containing, or contained in, the other overlaps
+    it. Edges that touch, or are collinear, count as intersecting, so polygons are
+    only found not to overlap when they are clearly separate. Neither polygon needs
+    to be convex.
+
+    Polygons with a vertex inside the polygon with vertices are found first, the
+    other tests are only done for the remaining polygons, in chunks of
+    OVERLAP_CHUNK_SIZE polygons.
+
+    Args:
+        polygons (NDArray): array of shape (k, m, 2) of the vertices of k polygons.
+        vertices (NDArray): array of shape (n, 2) of the vertices of the polygon.
+
+    Returns:
+        NDArray[np.bool_]: array of shape (k,), True for polygons overlapping.
+
+    """
+    polygons = np.asarray(polygons, dtype=np.float64)
+    vertices = _check_vertices(vertices)
+
+    if polygons.ndim != 3 or polygons.shape[-1] != 2:
+        raise ValueError("polygons must have shape (k, m, 2).")
+
+    overlaps = points_in_polygon(polygons, vertices).any(axis=1)
+
+    remaining = np.flatnonzero(~overlaps)
+
+    for start in range(0, len(remaining), OVERLAP_CHUNK_SIZE):
+        indices = remaining[start : start + OVERLAP_CHUNK_SIZE]
+        overlaps[indices] = _contains_any_point(
+            polygons[indices], vertices
+        ) | _edges_intersect(polygons[indices], vertices)
+
+    return overlaps
+
+
+def _check_vertices(vertices: NDArray) -> NDArray[np.float64]:
+    vertices = np.asarray(vertices, dtype=np.float64)
+
+    if vertices.ndim != 2 or vertices.shape[1] != 2 or len(vertices) < 3:
+        raise ValueError("vertices must have shape (n, 2) with n at least 3.")
+
+    return vertices
+
+
+def _contains_any_point(polygons: NDArray, points: NDArray) -> NDArray[np.bool_]:
+    """Check if each polygon in a stack contains any of points."""
+    inside = _is_odd_crossings(
+        points[np.newaxis, :, np.newaxis],
+        polygons[:, np.newaxis],
+        np.roll(polygons, -1, axis=1)[:, np.newaxis],
+    )
+
+    return inside.any(axis=1)
+
+
+def _is_odd_crossings(
+    points: NDArray[np.float64],
+    edge_starts: NDArray[np.float64],
+    edge_ends: NDArray[np.float64],
+) -> NDArray[np.bool_]:
+    """Check if a ray from each point crosses the edges an odd number of times.
+
+    The arrays are broadcast together, with the edges along the second to last axis
+    and the coordinates along the last axis.
+
+    """
+    x = points[..., 0]
+    y = points[..., 1]
+    x0 = edge_starts[..., 0]
+    y0 = edge_starts[..., 1]
+    x1 = edge_ends[..., 0]
+    y1 = edge_ends[..., 1]
+
+    # edges spanning the point's y coordinate, horizontal edges never do
+    spans = (y0 > y) != (y1 > y)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x_crossing = x0 + (y - y0) * (x1 - x0) / (y1 - y0)
+
+    return np.asarray(np.count_nonzero(spans & (x < x_crossing), axis=-1) % 2 == 1)
+
+
+def _edges_intersect(polygons: NDArray, vertices: NDArray) -> NDArray[np.bool_]:
+    """Check if any edge of each polygon in a stack intersects an edge of vertices.
+
+    Edges intersect when the ends of each are not strictly on the same side of the
+    other, using the sign of the perp dot product as in is_convex.
+
+    """
+    # (k, m, 1, 2) edges of the polygons and (n, 2) edges of vertices
+    a0 = polygons[:, :, np.newaxis]
+    a1 = np.roll(polygons, -1, axis=1)[:, :, np.newaxis]
+    b0 = vertices
+    b1 = np.roll(vertices, -1, axis=0)
+
+    a_straddles = _perp_dot(a0, a1, b0) * _perp_dot(a0, a1, b1) <= 0
+    b_straddles = _perp_dot(b0, b1, a0) * _perp_dot(b0, b1, a1) <= 0
+
+    return (a_straddles & b_straddles).any(axis=(1, 2))
+
+
+def _perp_dot(
+    p: NDArray[np.float64], q: NDArray[np.float64], r: NDArray[np.float64]
+) -> NDArray[np.float64]:
+    """Perp dot product of q - p and r - p."""
+    return (q[..., 0] - p[..., 0]) * (r[..., 1] - p[..., 1]) - (
+        q[..., 1] - p[..., 1]
+    ) * (r[..., 0] - p[..., 0])
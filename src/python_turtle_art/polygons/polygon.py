@@ -3,6 +3,8 @@ from __future__ import annotations
 from abc import abstractmethod
 from turtle import RawTurtle, Vec2D
 
+from numpy.typing import NDArray
+
 from ..vertices.vertices import DrawMixin, EqMixin, GetExtremeVerticesMixin, RotateMixin
 from .convex_polygon import BaseConvexFill, ConvexPolygon
 from .is_convex import is_convex
@@ -32,19 +34,19 @@ class Polygon(DrawMixin, RotateMixin, GetExtremeVerticesMixin, EqMixin):
 
     _jump_to_vertex_index: int = -1
 
-    def __init__(self, vertices: tuple[Vec2D, ...]):
-        self.vertices = vertices
+    def __init__(self, vertices: tuple[Vec2D, ...] | NDArray):
+        self.vertices = vertices  # type: ignore
 
     @property
     def vertices(self) -> tuple[Vec2D, ...]:
-        return self._vertices
+        return self._get_vertices()
 
     @vertices.setter
-    def vertices(self, vertices: tuple[Vec2D, ...]) -> None:
+    def vertices(self, vertices: tuple[Vec2D, ...] | NDArray) -> None:
         """Set vertices attribute and check there are at least 3 points."""
         if len(vertices) < 3:
             raise ValueError("vertices must contain at least 3 points.")
-        self._vertices = vertices
+        self._set_vertices(vertices)
 
     def is_convex(self) -> bool:
         """Check if the polygon is convex."""
@@ -0,0 +1,110 @@
+"""Uniform grid spatial index for finding shapes overlapping a region."""
+
+from collections import defaultdict
+from collections.abc import Iterable
+from math import floor
+from typing import Generic, TypeVar
+
+from .vertices import BoundingBox, VerticesMixin
+
+T = TypeVar("T")
+
+
+class SpatialIndex(Generic[T]):
+    """Index of items by bounding box on a uniform grid of square cells.
+
+    Each item is stored in every cell its bounding box overlaps. A query only checks
+    the items in the cells the query box overlaps, so the cost depends on the number
+    of items near the query rather than the total number of items.
+
+    Args:
+        cell_size (int | float): width and height of the grid cells. Cells around
+            the typical size of the indexed items work well.
+
+    """
+
+    def __init__(self, cell_size: int | float):
+        if cell_size <= 0:
+            raise ValueError("cell_size must be greater than zero.")
+
+        self.cell_size = cell_size
+        self._items: list[T] = []
+        self._bounding_boxes: list[BoundingBox] = []
+        self._cells: defaultdict[tuple[int, int], list[int]] = defaultdict(list)
+
+    @classmethod
+    def from_shapes(
+        cls, shapes: Iterable[VerticesMixin], cell_size: int | float
+    ) -> "SpatialIndex":
+        """Create index of shapes using their cached bounding boxes."""
+        index: SpatialIndex = cls(cell_size=cell_size)
+        for shape in shapes:
+            index.insert(shape, shape.bounding_box)
+        return index
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def _cell_range(self, bounding_box: BoundingBox) -> tuple[int, int, int, int]:
+        """Get the first and last column and row of the cells bounding_box overlaps."""
+        return (
+            floor(bounding_box.min_x / self.cell_size),
+            floor(bounding_box.max_x / self.cell_size),
+            floor(bounding_box.min_y / self.cell_size),
+            floor(bounding_box.max_y / self.cell_size),
+        )
+
+    def _cell_keys(self, bounding_box: BoundingBox) -> Iterable[tuple[int, int]]:
+        """Get keys of the cells to look in for items overlapping bounding_box.
+
+        For boxes covering more cells than are in use, e.g. a viewport much larger
+        than the drawing, the cells in use are filtered instead of looking in every
+        overlapped cell.
+
+        """
+        first_column, last_column, first_row, last_row = self._cell_range(bounding_box)
+
+        number_of_cells = (last_column - first_column + 1) * (last_row - first_row + 1)
+
+        if number_of_cells > len(self._cells):
+            return [
+                (column, row)
+                for column, row in self._cells
+                if first_column <= column <= last_column
+                and first_row <= row <= last_row
+            ]
+
+        return [
+            (column, row)
+            for column in range(first_column, last_column + 1)
+            for row in range(first_row, last_row + 1)
+        ]
+
+    def insert(self, item: T, bounding_box: BoundingBox) -> None:
+        """Add item, with the given bounding box, to the index."""
+        item_index = len(self._items)
+        self._items.append(item)
+        self._bounding_boxes.append(bounding_box)
+
+        first_column, last_column, first_row, last_row = self._cell_range(bounding_box)
+
+        for column in range(first_column, last_column + 1):
+            for row in range(first_row, last_row + 1):
+                self._cells[column, row].append(item_index)
+
+    def query(self, bounding_box: BoundingBox) -> list[T]:
+        """Get the items whose bounding boxes overlap bounding_box.
+
+        Items are returned in the order they were inserted, so shapes can be drawn
+        in their original order.
+
+        """
+        candidates: set[int] = set()
+        for key in self._cell_keys(bounding_box):
+            candidates.update(self._cells.get(key, ()))
+
+        return [
+            self._items[item_index]
+            for item_index in sorted(candidates)
+            if self._bounding_boxes[item_index].intersects(bounding_box)
+        ]
@@ -1,26 +1,193 @@
 """Mixins providing functionality for collections of vertices."""
 
 from collections import namedtuple
+from collections.abc import Sequence
 from enum import Enum
-from math import inf
 from turtle import RawTurtle, Vec2D
-from typing import Any, Self, Union
+from typing import Any, NamedTuple, Self, Union
 
-from ..helpers.rotation import rotate_about_point
-from ..helpers.turtle import jump_to
+import numpy as np
+from numpy.typing import NDArray
+
+from ..helpers.rotation import (
+    get_rotation_cos_and_sin,
+    rotate_array_about_point,
+    rotate_array_with_cos_and_sin,
+)
+from ..helpers.turtle import draw_polyline, jump_to
+from ..instrumentation import increment_counter
+
+
+class BoundingBox(NamedTuple):
+    """Axis aligned box given by its minimum and maximum x and y coordinates."""
+
+    min_x: int | float
+    min_y: int | float
+    max_x: int | float
+    max_y: int | float
+
+    @classmethod
+    def from_points(cls, points: Sequence[Vec2D] | NDArray) -> "BoundingBox":
+        """Get the smallest box containing points."""
+        points_array = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        min_x, min_y = points_array.min(axis=0).tolist()
+        max_x, max_y = points_array.max(axis=0).tolist()
+        return cls(min_x=min_x, min_y=min_y, max_x=max_x, max_y=max_y)
+
+    @classmethod
+    def from_dimensions(cls, width: int | float, height: int | float) -> "BoundingBox":
+        """Get box of width and height centred on the turtle origin.
+
+        This is the area shown on a screen, or image, of that size.
+
+        """
+        return cls(
+            min_x=-width / 2, min_y=-height / 2, max_x=width / 2, max_y=height / 2
+        )
+
+    def intersects(self, other: "BoundingBox") -> bool:
+        """Check if the boxes overlap, boxes that only touch count as overlapping."""
+        return (
+            self.min_x <= other.max_x
+            and other.min_x <= self.max_x
+            and self.min_y <= other.max_y
+            and other.min_y <= self.max_y
+        )
+
+    def expand(self, margin: int | float) -> "BoundingBox":
+        """Get box with margin added on every side."""
+        return BoundingBox(
+            min_x=self.min_x - margin,
+            min_y=self.min_y - margin,
+            max_x=self.max_x + margin,
+            max_y=self.max_y + margin,
+        )
+
+    def union(self, other: "BoundingBox") -> "BoundingBox":
+        """Get the smallest box containing both boxes."""
+        return BoundingBox(
+            min_x=min(self.min_x, other.min_x),
+            min_y=min(self.min_y, other.min_y),
+            max_x=max(self.max_x, other.max_x),
+            max_y=max(self.max_y, other.max_y),
+        )
 
 
 class VerticesMixin:
-    """Mixin class for a collection of vertices."""
+    """Mixin class for a collection of vertices.
+
+    Vertices can be set as a tuple of Vec2D objects or as an (n, 2) array. Both forms
+    are available, from the vertices and vertices_array properties, with the form
+    that was not set only being created the first time it is requested.
+
+    """
+
+    _vertices: tuple[Vec2D, ...] | None
+    _vertices_array: NDArray[np.float64] | None
+    _bounding_box: BoundingBox | None = None
 
     @property
     def vertices(self) -> tuple[Vec2D, ...]:
-        return self._vertices
+        return self._get_vertices()
 
     @vertices.setter
-    def vertices(self, vertices: tuple[Vec2D, ...]) -> None:
+    def vertices(self, vertices: tuple[Vec2D, ...] | NDArray) -> None:
         """Set vertices attribute."""
-        self._vertices = vertices
+        self._set_vertices(vertices)
+
+    @property
+    def vertices_array(self) -> NDArray[np.float64]:
+        """Read only (n, 2) array of the vertices.
+
+        The array is not copied, so it can be passed to backends without allocating.
+
+        """
+        if self._vertices_array is None:
+            array = np.array(self._vertices, dtype=np.float64).reshape(-1, 2)
+            array.flags.writeable = False
+            self._vertices_array = array
+        return self._vertices_array
+
+    @property
+    def bounding_box(self) -> BoundingBox:
+        """Smallest box containing the vertices.
+
+        The box is cached until the vertices are set again, e.g. by rotate.
+
+        """
+        if self._bounding_box is None:
+            vertices_array = self.vertices_array
+            min_x, min_y = np.nanmin(vertices_array, axis=0).tolist()
+            max_x, max_y = np.nanmax(vertices_array, axis=0).tolist()
+            self._bounding_box = BoundingBox(
+                min_x=min_x, min_y=min_y, max_x=max_x, max_y=max_y
+            )
+        return self._bounding_box
+
+    def _get_vertices(self) -> tuple[Vec2D, ...]:
+        """Get vertices as Vec2D objects, creating them from the array if needed."""
+        if self._vertices is None:
+            self._vertices = tuple(
+                Vec2D(x, y)
+                for x, y in self._vertices_array.tolist()  # type: ignore
+            )
+        return self._vertices
+
+    def _set_vertices(self, vertices: tuple[Vec2D, ...] | NDArray) -> None:
+        """Store vertices, as passed, discarding previous vertices and bounding box.
+
+        Arrays are copied unless they are already read only float64 arrays, which can
+        be shared between objects as they cannot be changed.
+
+        """
+        self._bounding_box = None
+
+        if isinstance(vertices, np.ndarray):
+            if vertices.dtype != np.float64 or vertices.flags.writeable:
+                vertices = np.array(vertices, dtype=np.float64)
+                vertices.flags.writeable = False
+
+            if vertices.ndim != 2 or vertices.shape[1] != 2:
+                raise ValueError("vertices array must have shape (n, 2).")
+
+            self._vertices = None
+            self._vertices_array = vertices
+        else:
+            self._vertices = vertices
+            self._vertices_array = None
+
+    def _set_trusted_vertices(self, vertices: NDArray) -> None:
+        """Store vertices without the checks done by the vertices setter.
+
+        Only for vertices derived from this shape's, already checked, vertices by a
+        transform that keeps them valid, e.g. a rotation or translation. Skipped
+        checks are counted by the vertex_validations_skipped counter.
+
+        """
+        self._set_vertices(vertices)
+        increment_counter("vertex_validations_skipped")
+
+    @classmethod
+    def from_trusted_vertices(cls, vertices: NDArray, **attributes: Any) -> Self:
+        """Create shape without checking vertices, e.g. for a translated copy.
+
+        __init__ is not called, vertices are stored without the checks done by the
+        vertices setter and then each of attributes is set. Only use for vertices
+        taken from, or transformed without changing their validity from, a shape of
+        the same class that has already been checked.
+
+        """
+        shape = cls.__new__(cls)
+        shape._set_trusted_vertices(vertices)
+        for name, value in attributes.items():
+            setattr(shape, name, value)
+        return shape
+
+    def _vertex_coordinates(self) -> tuple[Vec2D, ...] | list[list[float]]:
+        """Get vertices as a sequence of (x, y) pairs without creating Vec2D objects."""
+        if self._vertices is not None:
+            return self._vertices
+        return self._vertices_array.tolist()  # type: ignore
 
 
 class DrawMixin(VerticesMixin):
@@ -33,24 +200,52 @@ class DrawMixin(VerticesMixin):
         self,
         turtle: RawTurtle,
         colour: str = "black",
-        size: int | None = None,
+        size: int | float | None = None,
+        batch: bool = False,
     ):
-        """Set pensize and colour then draw polygon edges."""
+        """Set pensize and colour then draw polygon edges.
+
+        Args:
+            turtle (RawTurtle): turtle to draw with.
+            colour (str): pen colour for the edges.
+            size (int | None): pen size for the edges, defaults to the current size.
+            batch (bool): draw the edges as a single polyline with draw_polyline,
+                rather than moving the turtle to each vertex in turn. This is much
+                faster on a Tk screen as one canvas item is created for the shape.
+
+        """
+        if batch:
+            draw_polyline(
+                turtle=turtle, points=self._polyline_points(), colour=colour, size=size
+            )
+            return
 
         original_colour = turtle.pencolor()
         original_pensize = turtle.pensize()
 
         turtle.pencolor(colour)
-        turtle.pensize(size)
+        turtle.pensize(size)  # type: ignore[arg-type]
+
+        coordinates = self._vertex_coordinates()
 
-        jump_to(turtle=turtle, position=self.vertices[self._jump_to_vertex_index])
+        jump_to(turtle=turtle, position=Vec2D(*coordinates[self._jump_to_vertex_index]))
 
-        for point in self.vertices:
-            turtle.goto(point)
+        for x, y in coordinates:
+            turtle.goto(x, y)
 
         turtle.pencolor(original_colour)
         turtle.pensize(original_pensize)
 
+    def _polyline_points(self) -> tuple[Vec2D, ...] | NDArray:
+        """Get the points visited by draw, starting with the vertex jumped to."""
+        index = self._jump_to_vertex_index
+
+        if self._vertices is not None:
+            return (self._vertices[index], *self._vertices)
+
+        vertices_array = self.vertices_array
+        return np.concatenate((vertices_array[[index]], vertices_array))
+
 
 class RotateMixin(VerticesMixin):
     """Mixin class for rotating a collection of vertices."""
@@ -58,19 +253,83 @@ class RotateMixin(VerticesMixin):
     def rotate(self, angle: Union[int, float], about_point: Vec2D) -> Self:
         """Rotate vertices.
 
+        All vertices are rotated in one operation on the vertices array. Rotation
+        keeps the number of vertices and convexity, so the rotated vertices are not
+        checked again.
+
         Args:
             angle (Union[int, float]): angle, in degrees, to rotate the vertices.
             about_point (Vec2D): point to rotate about.
 
         """
         if (angle % 360) != 0:
-            self.vertices = tuple(
-                rotate_about_point(point, angle, about_point) for point in self.vertices
-            )
+            rotated = rotate_array_about_point(self.vertices_array, angle, about_point)
+            rotated.flags.writeable = False
+            self._set_trusted_vertices(rotated)
 
         return self
 
 
+def rotate_many(
+    shapes: Sequence[RotateMixin],
+    angles: Union[int, float] | Sequence[Union[int, float]],
+    about_points: Sequence[Vec2D],
+) -> list[RotateMixin]:
+    """Rotate each shape about its own point, in one operation for all shapes.
+
+    The vertices of all shapes are rotated together, rather than calling rotate once
+    per shape. As with rotate, the rotated vertices are not checked again.
+
+    Args:
+        shapes (Sequence[RotateMixin]): shapes to rotate.
+        angles (Union[int, float] | Sequence[Union[int, float]]): angle, in degrees,
+            to rotate all shapes by or one angle per shape.
+        about_points (Sequence[Vec2D]): point to rotate each shape about.
+
+    """
+    if isinstance(angles, int | float):
+        angles = [angles] * len(shapes)
+
+    if len(angles) != len(shapes):
+        raise ValueError("angles must have the same length as shapes.")
+
+    if len(about_points) != len(shapes):
+        raise ValueError("about_points must have the same length as shapes.")
+
+    to_rotate = [
+        (shape, angle, about_point)
+        for shape, angle, about_point in zip(shapes, angles, about_points, strict=True)
+        if (angle % 360) != 0
+    ]
+
+    if to_rotate:
+        arrays = [shape.vertices_array for shape, _, _ in to_rotate]
+        lengths = [len(array) for array in arrays]
+
+        cos_and_sin = np.array(
+            [get_rotation_cos_and_sin(angle) for _, angle, _ in to_rotate]
+        )
+
+        rotated = rotate_array_with_cos_and_sin(
+            np.concatenate(arrays),
+            np.repeat(cos_and_sin[:, 0], lengths),
+            np.repeat(cos_and_sin[:, 1], lengths),
+            np.repeat(
+                np.array([point for _, _, point in to_rotate], dtype=np.float64),
+                lengths,
+                axis=0,
+            ),
+        )
+        rotated.flags.writeable = False
+
+        for (shape, _, _), vertices in zip(
+            to_rotate, np.split(rotated, np.cumsum(lengths)[:-1]), strict=True
+        ):
+            shape._set_trusted_vertices(vertices)
+
+    return list(shapes)
+
+
 ExtremeIndices = namedtuple("ExtremeIndices", ["minimum", "maximum"])
 
 
@@ -95,25 +354,15 @@ class GetExtremeVerticesMixin(VerticesMixin):
         """
         axis_enum = Axis(axis)
 
-        minimum = inf
-        maximum = -inf
-
-        minimum_index = -1
-        maximum_index = -1
-
-        for vertex_index, vertex in enumerate(self.vertices):
-            if vertex[axis] < minimum:
-                minimum = vertex[axis]
-                minimum_index = vertex_index
-
-            if vertex[axis] > maximum:
-                maximum = vertex[axis]
-                maximum_index = vertex_index
+        values = self.vertices_array[:, axis_enum.value]
 
-        if minimum_index == -1 or maximum_index == -1:
+        if len(values) == 0 or np.isnan(values).all():
             raise ValueError(f"Failed to find min or max {axis_enum.name} index.")
 
-        return ExtremeIndices(minimum=minimum_index, maximum=maximum_index)
+        # the first occurrence of the min / max value is returned
+        return ExtremeIndices(
+            minimum=int(np.nanargmin(values)), maximum=int(np.nanargmax(values))
+        )
 
 
 class EqMixin(VerticesMixin):
@@ -124,4 +373,4 @@ class EqMixin(VerticesMixin):
         if not isinstance(other, EqMixin):
             return False
         else:
-            return self.vertices == other.vertices
+            return np.array_equal(self.vertices_array, other.vertices_array)
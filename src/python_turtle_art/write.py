@@ -1,13 +1,22 @@
 from io import BytesIO
-from turtle import TurtleScreen
+from tkinter import Canvas
+from turtle import ScrolledCanvas, TurtleScreen
 
+import numpy as np
 from PIL import Image, ImageGrab
 
+from .backends.raster import Raster
+from .capture import CAPTURE_METHODS
 from .helpers.turtle import update_screen
 
 
 def save_turtle_screen(
-    screen: TurtleScreen, file: str, height: int, width: int, page_width: bool = False
+    screen: TurtleScreen,
+    file: str,
+    height: int,
+    width: int,
+    page_width: bool = False,
+    method: str = "postscript",
 ) -> None:
     """Save turtle screen to file.
 
@@ -16,10 +25,23 @@ def save_turtle_screen(
         file (str): The file to save the canvas to.
         height (int): The height of the canvas.
         width (int): The width of the canvas.
+        page_width (bool): Passed to get_canvas_image, only used by the postscript
+            method.
+        method (str): "postscript" to rasterise the postscript of the canvas with
+            ghostscript, see get_canvas_image, or "canvas" to draw the canvas items
+            directly, see get_canvas_items_image.
 
     """
 
-    img = get_canvas_image(screen, height, width, page_width)
+    if method == "postscript":
+        img = get_canvas_image(screen, height, width, page_width)
+    elif method == "canvas":
+        img = get_canvas_items_image(screen, height, width)
+    else:
+        raise ValueError(
+            f"Unknown capture method {method}, expected one of {CAPTURE_METHODS}."
+        )
+
     img.save(file)
 
 
@@ -59,6 +81,99 @@ def get_canvas_image(
     return Image.open(BytesIO(ps.encode("utf-8")))
 
 
+def get_canvas_items_image(
+    screen: TurtleScreen, height: int, width: int
+) -> Image.Image:
+    """Get image on canvas by drawing the canvas items onto a Raster.
+
+    No postscript is generated and ghostscript is not needed. Line, polygon and oval
+    items are drawn, in stacking order, with the coordinates, widths and colours
+    read from the canvas. Other item types, e.g. text, are not drawn. The image is
+    of the visible area of the canvas at one pixel per canvas unit.
+
+    As in the postscript of the canvas, canvas coordinates are taken to be at pixel
+    edges, so the centre of the first pixel is half a pixel in from the top left
+    corner of the visible area. This lines the image up with get_canvas_image.
+
+    Args:
+        screen (TurtleScreen): The screen to get the image from.
+        height (int): The height of the image.
+        width (int): The width of the image.
+
+    """
+    update_screen(screen)
+    canvas = screen.getcanvas()
+
+    raster = Raster(
+        width=width,
+        height=height,
+        background=screen.bgcolor(),
+        left=canvas.canvasx(0) + 0.5,
+        top=-(canvas.canvasy(0) + 0.5),
+    )
+
+    colours: dict[str, str] = {}
+
+    for item in canvas.find_all():
+        _draw_canvas_item(raster, canvas, item, colours)
+
+    return raster.to_image()
+
+
+def _draw_canvas_item(
+    raster: Raster,
+    canvas: Canvas | ScrolledCanvas,
+    item: int,
+    colours: dict[str, str],
+) -> None:
+    """Draw a canvas item onto raster, with the y axis flipped to turtle coordinates.
+
+    Tk colours are converted to hex strings, with colours caching the conversions.
+
+    """
+    configuration = canvas.itemconfigure(item) or {}
+    options = {name: value[-1] for name, value in configuration.items()}
+
+    if options.get("state") == "hidden":
+        return
+
+    item_type = canvas.type(item)
+    if item_type not in ("line", "polygon", "oval"):
+        return
+
+    points = np.array(canvas.coords(item), dtype=np.float64).reshape(-1, 2)
+    points[:, 1] *= -1
+
+    fill = _tk_colour_to_hex(canvas, options.get("fill", ""), colours)
+    outline = _tk_colour_to_hex(canvas, options.get("outline", ""), colours)
+    width = float(options.get("width", 1))
+
+    if item_type == "line":
+        if fill is not None:
+            raster.draw_polyline(points, fill, width)
+    elif item_type == "polygon":
+        if fill is not None:
+            raster.draw_polygon(points, fill)
+        if outline is not None and width > 0:
+            raster.draw_polyline(np.vstack([points, points[:1]]), outline, width)
+    elif fill is not None:
+        raster.draw_dot(points.mean(axis=0), points[1, 0] - points[0, 0], fill)
+
+
+def _tk_colour_to_hex(
+    canvas: Canvas | ScrolledCanvas, colour: str, colours: dict[str, str]
+) -> str | None:
+    """Convert a Tk colour to a hex string, or None for an empty colour."""
+    if not colour:
+        return None
+
+    if colour not in colours:
+        red, green, blue = canvas.winfo_rgb(colour)
+        colours[colour] = f"#{red >> 8:02x}{green >> 8:02x}{blue >> 8:02x}"
+
+    return colours[colour]
+
+
 def save_turtle_screengrab(file: str) -> None:
     """Save turtle screen to file."""
     ImageGrab.grab().convert("RGB").save(file)
@@ -0,0 +1,122 @@
+from pathlib import Path
+from turtle import Vec2D
+
+import pytest
+from PIL import Image
+
+from python_turtle_art.backends import RasterTurtle
+from python_turtle_art.filling import ColourFill, HashFill
+from python_turtle_art.polygons.kites.convex_kite import ConvexKite
+from python_turtle_art.polygons.polygon import Polygon
+
+from ...helpers import assert_image_difference_within_tolerance
+from ..conftest import draw_grey_squares_on_yellow_background
+
+STAR = Polygon(
+    vertices=tuple(
+        3 * Vec2D(*coords)
+        for coords in [
+            [0, 5],
+            [1, 10],
+            [2, 5],
+            [10, 5],
+            [3, 2],
+            [6, -10],
+            [1, 0],
+            [-5, -10],
+            [-2, 2],
+            [-9, 5],
+        ]
+    )
+)
+
+
+@pytest.fixture
+def raster_turtle_with_squares_background() -> RasterTurtle:
+    """RasterTurtle with the pixel grid of a 100 x 100 canvas saved with postscript.
+
+    The postscript output of the canvas is scaled by 0.99 as the page width passed to
+    postscript is one pixel less than the width of the canvas.
+
+    """
+    turtle = RasterTurtle(width=100, height=100, left=-50, top=50, scale=0.99)
+
+    draw_grey_squares_on_yellow_background(turtle)
+
+    return turtle
+
+
+def test_star(raster_turtle_with_squares_background):
+    # Arrange
+
+    turtle = raster_turtle_with_squares_background
+
+    # Act
+
+    STAR.draw(turtle, size=2)
+
+    # Assert
+
+    expected_image_file = Path("tests/component/polygons/polygon/expected_star.png")
+    expected_image = Image.open(expected_image_file)
+
+    assert_image_difference_within_tolerance(
+        actual=turtle.get_image(),
+        expected=expected_image,
+        tolerance_non_matching_pixels=10,
+        tolerance_adjacent_pixels=2,
+    )
+
+
+def test_colour_fill(raster_turtle_with_squares_background):
+    # Arrange
+
+    turtle = raster_turtle_with_squares_background
+
+    # Act
+
+    STAR.draw(turtle, size=2)
+    STAR.fill(turtle, ColourFill("blue"))
+
+    # Assert
+
+    expected_image_file = Path("tests/component/filling/expected_colour_fill.png")
+    expected_image = Image.open(expected_image_file)
+
+    assert_image_difference_within_tolerance(
+        actual=turtle.get_image(),
+        expected=expected_image,
+        tolerance_non_matching_pixels=10,
+        tolerance_adjacent_pixels=2,
+    )
+
+
+def test_hash_fill(raster_turtle_with_squares_background):
+    # Arrange
+
+    turtle = raster_turtle_with_squares_background
+
+    # Act
+
+    square = ConvexKite(
+        vertices=(
+            Vec2D(-20, -20),
+            Vec2D(40, -20),
+            Vec2D(40, 30),
+            Vec2D(-20, 30),
+        )
+    )
+
+    square.fill(turtle, HashFill(gap=2, origin=1, size=1))
+
+    # Assert
+
+    expected_image_file = Path("tests/component/filling/stripes/expected_hash_fill.png")
+    expected_image = Image.open(expected_image_file)
+
+    assert_image_difference_within_tolerance(
+        actual=turtle.get_image(),
+        expected=expected_image,
+        tolerance_non_matching_pixels=10,
+        tolerance_adjacent_pixels=2,
+    )
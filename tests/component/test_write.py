@@ -0,0 +1,53 @@
+import shutil
+import tkinter as tk
+from turtle import Vec2D
+
+import numpy as np
+import pytest
+
+from python_turtle_art.cli import setup_turtle_and_screen
+from python_turtle_art.filling import ColourFill
+from python_turtle_art.helpers.turtle import turn_off_turtle_animation
+from python_turtle_art.polygons.kites.convex_kite import ConvexKite
+from python_turtle_art.write import get_canvas_image, get_canvas_items_image
+
+
+@pytest.fixture
+def screen():
+    try:
+        turtle, screen, root = setup_turtle_and_screen(
+            window_dimensions=(100, 100), screen_dimensions=None
+        )
+    except tk.TclError:
+        pytest.skip("no display available")
+
+    turtle.hideturtle()
+    turn_off_turtle_animation(screen)
+
+    square = ConvexKite(
+        vertices=(Vec2D(-20, -10), Vec2D(15, -10), Vec2D(15, 25), Vec2D(-20, 25))
+    )
+    square.fill(turtle, ColourFill("black"))
+    square.draw(turtle, size=3)
+
+    yield screen
+
+    root.destroy()
+
+
+def drawn_pixels_centre(image) -> np.ndarray:
+    """Get the mean row and column of the pixels that are not white."""
+    rows, columns = np.nonzero((np.asarray(image.convert("RGB")) != 255).any(axis=2))
+    return np.array([rows.mean(), columns.mean()])
+
+
+@pytest.mark.skipif(shutil.which("gs") is None, reason="ghostscript not installed")
+def test_canvas_capture_lines_up_with_postscript_capture(screen):
+    postscript_image = get_canvas_image(screen, 100, 100, page_width=True)
+    canvas_image = get_canvas_items_image(screen, 100, 100)
+
+    np.testing.assert_allclose(
+        drawn_pixels_centre(canvas_image),
+        drawn_pixels_centre(postscript_image),
+        atol=0.25,
+    )
@@ -0,0 +1,118 @@
+from turtle import RawTurtle, Vec2D
+
+import pytest
+
+from python_turtle_art.backends import HeadlessTurtle
+
+
+class PrimitiveListTurtle(HeadlessTurtle):
+    """HeadlessTurtle keeping a list of the primitives it is asked to draw."""
+
+    def __init__(self):
+        super().__init__()
+        self.primitives = []
+
+    def _draw_line(self, points, colour, width):
+        self.primitives.append(("line", tuple(points), colour, width))
+
+    def _draw_polygon(self, points, colour):
+        self.primitives.append(("polygon", tuple(points), colour))
+
+    def _draw_dot(self, position, size, colour):
+        self.primitives.append(("dot", position, size, colour))
+
+
+def test_is_raw_turtle():
+    assert isinstance(PrimitiveListTurtle(), RawTurtle)
+
+
+def test_base_class_cannot_be_created():
+    with pytest.raises(TypeError, match="abstract"):
+        HeadlessTurtle()
+
+
+def test_moves_joined_into_single_line():
+    turtle = PrimitiveListTurtle()
+
+    turtle.goto(10, 0)
+    turtle.goto(Vec2D(10, 10))
+    turtle.penup()
+    turtle.goto(20, 20)
+    turtle.pendown()
+    turtle.pencolor("red")
+
+    assert turtle.primitives == [
+        ("line", (Vec2D(0, 0), Vec2D(10, 0), Vec2D(10, 10)), "black", 1)
+    ]
+
+
+def test_pen_change_starts_new_line():
+    turtle = PrimitiveListTurtle()
+
+    turtle.goto(10, 0)
+    turtle.pensize(3)
+    turtle.pencolor(0.0, 0.5, 1.0)
+    turtle.goto(10, 10)
+    turtle.penup()
+
+    assert turtle.primitives == [
+        ("line", (Vec2D(0, 0), Vec2D(10, 0)), "black", 1),
+        ("line", (Vec2D(10, 0), Vec2D(10, 10)), (0.0, 0.5, 1.0), 3),
+    ]
+    assert turtle.pensize() == 3
+
+
+def test_lines_drawn_while_filling_drawn_after_fill():
+    turtle = PrimitiveListTurtle()
+
+    turtle.fillcolor("blue")
+    turtle.begin_fill()
+    turtle.goto(10, 0)
+    turtle.goto(10, 10)
+    turtle.goto(0, 0)
+
+    assert turtle.filling()
+    assert turtle.primitives == []
+
+    turtle.end_fill()
+
+    vertices = (Vec2D(0, 0), Vec2D(10, 0), Vec2D(10, 10), Vec2D(0, 0))
+
+    assert turtle.primitives == [
+        ("polygon", vertices, "blue"),
+        ("line", vertices, "black", 1),
+    ]
+
+
+def test_heading_and_forward():
+    turtle = PrimitiveListTurtle()
+
+    turtle.setheading(90)
+    turtle.forward(5)
+    turtle.right(90)
+    turtle.fd(5)
+
+    assert turtle.heading() == 0
+    assert turtle.position() == Vec2D(5, 5)
+
+
+def test_circle_ends_at_start():
+    turtle = PrimitiveListTurtle()
+
+    turtle.circle(radius=30)
+
+    assert abs(turtle.position()) < 1e-9
+    assert turtle.heading() == 0
+
+
+def test_dot_colour_in_place_of_size():
+    turtle = PrimitiveListTurtle()
+    turtle.pensize(2)
+
+    turtle.dot("red")
+    turtle.dot((0.0, 0.5, 1.0))
+
+    assert turtle.primitives == [
+        ("dot", Vec2D(0, 0), 6, "red"),
+        ("dot", Vec2D(0, 0), 6, (0.0, 0.5, 1.0)),
+    ]
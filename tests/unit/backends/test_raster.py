@@ -0,0 +1,103 @@
+from turtle import Vec2D
+
+import numpy as np
+import pytest
+
+from python_turtle_art.backends import Raster, RasterTurtle
+from python_turtle_art.backends.raster import colour_to_rgb
+
+
+@pytest.mark.parametrize(
+    "colour, expected",
+    [
+        ("white", (255, 255, 255)),
+        ("grey", (128, 128, 128)),
+        ("#ff0000", (255, 0, 0)),
+        ((0.0, 0.5, 1.0), (0, 128, 255)),
+    ],
+)
+def test_colour_to_rgb(colour, expected):
+    assert colour_to_rgb(colour) == expected
+
+
+def test_default_origin_in_centre():
+    raster = Raster(width=11, height=11)
+
+    raster.draw_dot(Vec2D(0, 0), size=2, colour="black")
+
+    painted = raster.pixels.sum(axis=2) == 0
+
+    expected = np.zeros((11, 11), dtype=bool)
+    expected[4:7, 4:7] = True
+
+    np.testing.assert_array_equal(painted, expected)
+
+
+def test_line_between_pixel_centres_paints_pixels_either_side():
+    raster = Raster(width=11, height=11)
+
+    raster.draw_polyline([Vec2D(-2, 2.5), Vec2D(2, 2.5)], colour="red", width=1)
+
+    painted = raster.pixels[..., 1] == 0
+
+    expected = np.zeros((11, 11), dtype=bool)
+    expected[2:4, 2:9] = True
+
+    np.testing.assert_array_equal(painted, expected)
+
+
+def test_polygon_fill():
+    raster = Raster(width=11, height=11, background="black")
+
+    raster.draw_polygon(
+        [Vec2D(-2.2, -2.2), Vec2D(2.2, -2.2), Vec2D(2.2, 2.2), Vec2D(-2.2, 2.2)],
+        colour="white",
+    )
+
+    painted = raster.pixels[..., 0] == 255
+
+    expected = np.zeros((11, 11), dtype=bool)
+    expected[3:8, 3:8] = True
+
+    np.testing.assert_array_equal(painted, expected)
+
+
+def test_shapes_outside_raster_ignored():
+    raster = Raster(width=11, height=11)
+
+    raster.draw_polyline([Vec2D(100, 100), Vec2D(200, 100)], colour="black", width=5)
+    raster.draw_polygon(
+        [Vec2D(100, 100), Vec2D(200, 100), Vec2D(200, 200)], colour="black"
+    )
+
+    assert (raster.pixels == 255).all()
+
+
+def test_part_of_larger_raster():
+    def draw(raster: Raster) -> None:
+        raster.draw_polyline([Vec2D(-4, -3), Vec2D(3, 4)], colour="red", width=2)
+        raster.draw_polygon(
+            [Vec2D(0, -5), Vec2D(5, 0), Vec2D(0, 5), Vec2D(-5, 0)], colour="blue"
+        )
+        raster.draw_dot(Vec2D(2.5, -2.5), size=3, colour="green")
+
+    full = Raster(width=11, height=11)
+    draw(full)
+
+    part = Raster(width=4, height=5, left=-5, top=5, first_column=6, first_row=3)
+    draw(part)
+
+    np.testing.assert_array_equal(part.pixels, full.pixels[3:8, 6:10])
+
+
+def test_raster_turtle_get_array():
+    turtle = RasterTurtle(width=11, height=11)
+
+    turtle.goto(4, 0)
+
+    array = turtle.get_array()
+
+    assert array.shape == (11, 11, 3)
+    assert array.dtype == np.uint8
+    assert (array[5, 5:10] == 0).all()
+    assert turtle.get_image().size == (11, 11)
@@ -0,0 +1,187 @@
+from turtle import RawTurtle, Vec2D
+
+import numpy as np
+import pytest
+
+from python_turtle_art.backends import (
+    DisplayList,
+    Opcode,
+    RasterTurtle,
+    RecordingTurtle,
+)
+from python_turtle_art.filling import ColourFill, HashFill
+from python_turtle_art.polygons.kites.convex_kite import ConvexKite
+from python_turtle_art.polygons.polygon import Polygon
+
+STAR = Polygon(
+    vertices=tuple(
+        3 * Vec2D(*coords)
+        for coords in [
+            [0, 5],
+            [1, 10],
+            [2, 5],
+            [10, 5],
+            [3, 2],
+            [6, -10],
+            [1, 0],
+            [-5, -10],
+            [-2, 2],
+            [-9, 5],
+        ]
+    )
+)
+
+
+def draw_scene(turtle: RawTurtle) -> None:
+    """Draw a hashed square, a filled star and a dot."""
+    square = ConvexKite(
+        vertices=(Vec2D(-40, -40), Vec2D(0, -40), Vec2D(0, 0), Vec2D(-40, 0))
+    )
+    square.fill(turtle, HashFill(gap=4, size=1, colour="red"))
+    STAR.draw(turtle, size=2, colour="blue")
+    STAR.fill(turtle, ColourFill("yellow"))
+    turtle.penup()
+    turtle.goto(20, 20)
+    turtle.dot(5, 0.0, 0.5, 0.0)
+
+
+@pytest.fixture
+def display_list() -> DisplayList:
+    turtle = RecordingTurtle()
+    draw_scene(turtle)
+    return turtle.get_display_list()
+
+
+def test_display_list_equality(display_list):
+    turtle = RecordingTurtle()
+    draw_scene(turtle)
+
+    assert display_list == turtle.get_display_list()
+
+    turtle.dot(3, "red")
+
+    assert display_list != turtle.get_display_list()
+
+
+def test_display_list_arrays(display_list):
+    assert display_list.opcodes.dtype == np.uint8
+    assert display_list.coordinates.shape == (display_list.offsets[-1], 2)
+    assert display_list.opcodes[-1] == Opcode.DOT
+    assert Opcode.POLYGON in display_list.opcodes
+
+    assert ("red", 1) in display_list.styles
+    assert ("blue", 2) in display_list.styles
+    assert ((0.0, 0.5, 0.0), 5) in display_list.styles
+    assert ("yellow", None) in display_list.styles
+    assert len(display_list.styles) < len(display_list)
+
+
+def test_offsets_and_opcodes_length_mismatch_error(display_list):
+    with pytest.raises(
+        ValueError, match="offsets must have one more entry than opcodes."
+    ):
+        DisplayList(
+            opcodes=display_list.opcodes,
+            offsets=display_list.offsets[:-1],
+            coordinates=display_list.coordinates,
+            style_indices=display_list.style_indices,
+            styles=display_list.styles,
+        )
+
+
+def test_replay_matches_drawing_directly(display_list):
+    expected = RasterTurtle(width=101, height=101)
+    draw_scene(expected)
+
+    actual = RasterTurtle(width=101, height=101)
+    display_list.replay(actual)
+
+    np.testing.assert_array_equal(actual.get_array(), expected.get_array())
+
+
+def test_replay_scaled(display_list):
+    turtle = RecordingTurtle()
+
+    display_list.replay(turtle, scale=2)
+
+    scaled = turtle.get_display_list()
+
+    np.testing.assert_array_equal(scaled.coordinates, 2 * display_list.coordinates)
+    assert ("blue", 4) in scaled.styles
+    assert ((0.0, 0.5, 0.0), 10) in scaled.styles
+
+
+def test_save_and_load(display_list, tmp_path):
+    file = tmp_path / "display_list.npz"
+
+    display_list.save(file)
+    loaded = DisplayList.load(file)
+
+    np.testing.assert_array_equal(loaded.opcodes, display_list.opcodes)
+    np.testing.assert_array_equal(loaded.offsets, display_list.offsets)
+    np.testing.assert_array_equal(loaded.coordinates, display_list.coordinates)
+    np.testing.assert_array_equal(loaded.style_indices, display_list.style_indices)
+    assert loaded.styles == display_list.styles
+
+
+def test_replay_with_turtle_commands(mocker):
+    recorder = RecordingTurtle()
+    recorder.goto(10, 0)
+    recorder.dot(3, "red")
+
+    turtle = mocker.MagicMock(spec=RawTurtle)
+    turtle.screen = mocker.MagicMock()
+    turtle.items = []
+    turtle.filling.return_value = False
+    turtle.pencolor.return_value = "blue"
+    turtle.pensize.return_value = 5
+    turtle.fillcolor.return_value = "green"
+    turtle.isdown.return_value = True
+
+    recorder.get_display_list().replay(turtle)
+
+    turtle.screen._drawline.assert_called_once_with(
+        turtle.screen._createline.return_value,
+        [Vec2D(0, 0), Vec2D(10, 0)],
+        "black",
+        1,
+    )
+    turtle.goto.assert_called_once_with(10.0, 0.0)
+    turtle.dot.assert_called_once_with(3, "red")
+
+    turtle.pencolor.assert_called_with("blue")
+    turtle.pensize.assert_called_with(5)
+    turtle.fillcolor.assert_called_with("green")
+    assert turtle.pendown.call_args_list[-1] == mocker.call()
+    assert turtle.penup.call_args_list[-1:] == [mocker.call()]
+
+
+def test_replay_selected_primitives(display_list):
+    turtle = RecordingTurtle()
+
+    display_list.replay(turtle, indices=np.array([len(display_list) - 1, 0]))
+
+    replayed = turtle.get_display_list()
+
+    np.testing.assert_array_equal(
+        replayed.opcodes, display_list.opcodes[[len(display_list) - 1, 0]]
+    )
+    np.testing.assert_array_equal(
+        replayed.coordinates[1:],
+        display_list.coordinates[display_list.offsets[0] : display_list.offsets[1]],
+    )
+
+
+def test_bounding_boxes():
+    turtle = RecordingTurtle()
+    turtle.goto(10, -5)
+    turtle.goto(3, 8)
+    turtle.penup()
+    turtle.dot(4)
+
+    display_list = turtle.get_display_list()
+
+    np.testing.assert_array_equal(
+        display_list.get_bounding_boxes(), [[0, -5, 10, 8], [3, 8, 3, 8]]
+    )
+    assert RecordingTurtle().get_display_list().get_bounding_boxes().shape == (0, 4)
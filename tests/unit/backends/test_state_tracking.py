@@ -0,0 +1,91 @@
+from turtle import RawTurtle, Vec2D
+
+import numpy as np
+import pytest
+
+from python_turtle_art.backends import RasterTurtle, StateTrackingTurtle
+from python_turtle_art.filling.colour_fill import ColourFill
+from python_turtle_art.filling.stripes.vertical_stripe_fill import VerticalStripeFill
+from python_turtle_art.helpers.turtle import jump_to
+from python_turtle_art.instrumentation import get_counters, reset_counters
+from python_turtle_art.polygons.kites.convex_kite import ConvexKite
+
+KITE_VERTICES = (Vec2D(0, -20), Vec2D(15, 10), Vec2D(0, 20), Vec2D(-15, 10))
+
+
+@pytest.fixture
+def turtle(mocker):
+    turtle = mocker.MagicMock(spec=RawTurtle)
+    turtle.position.return_value = Vec2D(0, 0)
+    turtle.isdown.return_value = True
+    turtle.pencolor.return_value = "black"
+    turtle.pensize.return_value = 1
+    turtle.fillcolor.return_value = "black"
+    return turtle
+
+
+def test_jump_to_current_position_makes_no_calls(turtle):
+    state_tracking_turtle = StateTrackingTurtle(turtle)
+
+    jump_to(state_tracking_turtle, Vec2D(0, 0))
+    state_tracking_turtle.flush()
+
+    turtle.penup.assert_not_called()
+    turtle.goto.assert_not_called()
+    turtle.pendown.assert_not_called()
+    assert state_tracking_turtle.elided_calls == {"goto": 1, "pen": 2}
+
+
+def test_pen_down_passed_on_when_turtle_moves(turtle, mocker):
+    state_tracking_turtle = StateTrackingTurtle(turtle)
+
+    jump_to(state_tracking_turtle, Vec2D(5, 5))
+
+    assert turtle.mock_calls[-2:] == [mocker.call.penup(), mocker.call.goto((5, 5))]
+    assert state_tracking_turtle.position() == Vec2D(5, 5)
+
+    state_tracking_turtle.goto(10, 5)
+
+    assert turtle.mock_calls[-2:] == [mocker.call.pendown(), mocker.call.goto((10, 5))]
+    assert state_tracking_turtle.elided_calls == {}
+
+
+@pytest.mark.parametrize(
+    "method, current_value, new_value",
+    [("pencolor", "black", "red"), ("pensize", 1, 3), ("fillcolor", "black", "red")],
+)
+def test_unchanged_pen_and_fill_settings_elided(
+    turtle, method, current_value, new_value
+):
+    state_tracking_turtle = StateTrackingTurtle(turtle)
+    turtle.reset_mock()
+    reset_counters()
+
+    getattr(state_tracking_turtle, method)(current_value)
+    getattr(state_tracking_turtle, method)(new_value)
+    getattr(state_tracking_turtle, method)(new_value)
+
+    getattr(turtle, method).assert_called_once_with(new_value)
+    assert getattr(state_tracking_turtle, method)() == new_value
+    assert state_tracking_turtle.elided_calls == {method: 2}
+    assert get_counters() == {"turtle_calls_elided": 2}
+
+
+def test_drawing_unchanged():
+    def draw(turtle):
+        kite = ConvexKite(vertices=KITE_VERTICES)
+        for filler in [ColourFill(fill_colour="red"), VerticalStripeFill(gap=3)]:
+            jump_to(turtle, kite.vertices[0])
+            kite.draw(turtle, colour="blue", size=2)
+            kite.fill(turtle, filler=filler)
+            kite.draw(turtle, colour="blue", size=2, batch=True)
+
+    turtle = RasterTurtle(width=50, height=50)
+    draw(turtle)
+
+    wrapped_turtle = RasterTurtle(width=50, height=50)
+    state_tracking_turtle = StateTrackingTurtle(wrapped_turtle)
+    draw(state_tracking_turtle)
+
+    np.testing.assert_array_equal(wrapped_turtle.get_array(), turtle.get_array())
+    assert sum(state_tracking_turtle.elided_calls.values()) > 0
@@ -0,0 +1,93 @@
+import xml.etree.ElementTree as ET
+from io import StringIO
+from turtle import Vec2D
+
+import pytest
+
+from python_turtle_art.backends import SvgTurtle
+from python_turtle_art.filling import ColourFill
+from python_turtle_art.polygons.kites.convex_kite import ConvexKite
+
+SVG_NAMESPACE = "{http://www.w3.org/2000/svg}"
+
+
+def parse(file: StringIO) -> ET.Element:
+    return ET.fromstring(file.getvalue())  # noqa: S314
+
+
+def test_empty_drawing():
+    file = StringIO()
+
+    with SvgTurtle(file=file, width=100, height=80):
+        pass
+
+    svg = parse(file)
+
+    assert svg.tag == f"{SVG_NAMESPACE}svg"
+    assert svg.attrib["viewBox"] == "-50 -40 100 80"
+    assert [child.tag for child in svg] == [f"{SVG_NAMESPACE}rect"]
+    assert svg[0].attrib["fill"] == "#ffffff"
+
+
+def test_no_background():
+    file = StringIO()
+
+    with SvgTurtle(file=file, width=100, height=80, background=None):
+        pass
+
+    assert len(parse(file)) == 0
+
+
+def test_elements_written_as_drawn():
+    file = StringIO()
+    turtle = SvgTurtle(file=file, width=100, height=100)
+
+    turtle.goto(10, 20)
+    turtle.penup()
+
+    assert "<polyline" in file.getvalue()
+    assert "</svg>" not in file.getvalue()
+
+    turtle.close()
+
+    polyline = parse(file)[1]
+
+    assert polyline.attrib["points"] == "0.000,-0.000 10.000,-20.000"
+    assert polyline.attrib["stroke"] == "#000000"
+    assert polyline.attrib["stroke-width"] == "1"
+
+
+def test_fill_written_before_outline():
+    file = StringIO()
+
+    with SvgTurtle(file=file, width=100, height=100) as turtle:
+        kite = ConvexKite.from_origin_and_dimensions(origin=Vec2D(0, 0))
+        turtle.begin_fill()
+        kite.draw(turtle, colour="red", size=3)
+        turtle.fillcolor(0.0, 0.0, 1.0)
+        turtle.end_fill()
+        kite.fill(turtle, ColourFill("yellow"))
+
+    tags = [child.tag.removeprefix(SVG_NAMESPACE) for child in parse(file)]
+
+    assert tags == ["rect", "polygon", "polyline", "polygon"]
+    assert parse(file)[1].attrib["fill"] == "#0000ff"
+    assert parse(file)[2].attrib["stroke"] == "#ff0000"
+    assert parse(file)[3].attrib["fill"] == "#ffff00"
+
+
+@pytest.mark.parametrize("colour", [(), ("green",)])
+def test_dot(colour):
+    file = StringIO()
+
+    with SvgTurtle(file=file, width=100, height=100) as turtle:
+        turtle.pencolor("purple")
+        turtle.goto(5, 5)
+        turtle.dot(10, *colour)
+
+    circle = parse(file)[-1]
+
+    assert circle.tag == f"{SVG_NAMESPACE}circle"
+    assert (circle.attrib["cx"], circle.attrib["cy"]) == ("5.000", "-5.000")
+    assert circle.attrib["r"] == "5.0"
+    assert circle.attrib["fill"] == ("#008000" if colour else "#800080")
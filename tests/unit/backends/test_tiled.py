@@ -0,0 +1,155 @@
+from concurrent.futures import Future
+from turtle import RawTurtle, Vec2D
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from python_turtle_art.backends import (
+    DisplayList,
+    RasterTurtle,
+    RecordingTurtle,
+    Tile,
+    TiledRaster,
+)
+from python_turtle_art.backends.tiled import TILES_IN_FLIGHT_PER_PROCESS
+from python_turtle_art.filling import ColourFill, HashFill
+from python_turtle_art.polygons.kites.convex_kite import ConvexKite
+
+
+def draw_scene(turtle: RawTurtle) -> None:
+    """Draw shapes spread over several tiles."""
+    kite = ConvexKite.from_origin_and_dimensions(
+        origin=Vec2D(-30, -40), height=70, width=50
+    )
+    kite.fill(turtle, ColourFill("yellow"))
+    kite.draw(turtle, colour="red", size=3)
+    kite.fill(turtle, HashFill(gap=5, size=1, colour="blue"))
+    turtle.penup()
+    turtle.goto(35, 35)
+    turtle.dot(9, "green")
+
+
+@pytest.fixture(scope="module")
+def display_list() -> DisplayList:
+    turtle = RecordingTurtle()
+    draw_scene(turtle)
+    return turtle.get_display_list()
+
+
+@pytest.fixture(scope="module")
+def expected(display_list) -> np.ndarray:
+    turtle = RasterTurtle(width=101, height=91, left=-50.5, top=45.2, scale=1.1)
+    display_list.replay(turtle)
+    return turtle.get_array()
+
+
+def test_tiles_cover_image():
+    tiles = TiledRaster(width=25, height=12, tile_size=10).get_tiles()
+
+    assert tiles == [
+        Tile(0, 0, 10, 10),
+        Tile(0, 10, 10, 10),
+        Tile(0, 20, 10, 5),
+        Tile(10, 0, 2, 10),
+        Tile(10, 10, 2, 10),
+        Tile(10, 20, 2, 5),
+    ]
+
+
+def test_tile_size_error():
+    with pytest.raises(ValueError, match="tile_size must be greater than zero."):
+        TiledRaster(width=10, height=10, tile_size=0)
+
+
+def test_dot_binned_into_its_tile_only(display_list):
+    tiled_raster = TiledRaster(width=100, height=100, tile_size=50)
+
+    bins = tiled_raster.bin_primitives(display_list)
+
+    dot_index = len(display_list) - 1
+    assert [tile for tile, indices in bins.items() if dot_index in indices] == [
+        Tile(0, 50, 50, 50)
+    ]
+
+
+@pytest.mark.parametrize(["tile_size", "processes"], [(7, 1), (32, 1), (40, 2)])
+def test_render_matches_single_raster(display_list, expected, tile_size, processes):
+    tiled_raster = TiledRaster(
+        width=101, height=91, tile_size=tile_size, left=-50.5, top=45.2, scale=1.1
+    )
+
+    actual = tiled_raster.render(display_list, processes=processes)
+
+    np.testing.assert_array_equal(actual, expected)
+
+
+def test_write_tiles_pyramid(display_list, expected, tmp_path):
+    tiled_raster = TiledRaster(
+        width=101, height=91, tile_size=40, left=-50.5, top=45.2, scale=1.1
+    )
+
+    files = tiled_raster.write_tiles(display_list, tmp_path, levels=2, processes=1)
+
+    assert len(files) == 9 + 4
+
+    stitched = np.concatenate(
+        [
+            np.concatenate(
+                [
+                    np.asarray(Image.open(tmp_path / "0" / f"{row}_{column}.png"))
+                    for column in range(3)
+                ],
+                axis=1,
+            )
+            for row in range(3)
+        ],
+        axis=0,
+    )
+    np.testing.assert_array_equal(stitched, expected)
+
+    with Image.open(tmp_path / "1" / "1_1.png") as image:
+        assert image.size == (10, 5)
+
+
+class InProcessExecutor:
+    """Executor running each task when submitted, counting tasks not yet consumed."""
+
+    instances: list["InProcessExecutor"] = []
+
+    def __init__(self, max_workers, initializer, initargs):
+        initializer(*initargs)
+        self.submitted = 0
+        InProcessExecutor.instances.append(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def submit(self, function, *args):
+        self.submitted += 1
+        future = Future()
+        future.set_result(function(*args))
+        return future
+
+
+def test_tiles_in_flight_limited(display_list, mocker):
+    mocker.patch(
+        "python_turtle_art.backends.tiled.ProcessPoolExecutor", InProcessExecutor
+    )
+    tiled_raster = TiledRaster(
+        width=101, height=91, tile_size=7, left=-50.5, top=45.2, scale=1.1
+    )
+    binned_tiles = len(tiled_raster.bin_primitives(display_list))
+
+    yielded = 0
+    for _, pixels in tiled_raster._render_tiles(display_list, processes=2):
+        if pixels is not None:
+            yielded += 1
+            submitted = InProcessExecutor.instances[-1].submitted
+            assert submitted - yielded <= TILES_IN_FLIGHT_PER_PROCESS * 2
+
+    assert binned_tiles > TILES_IN_FLIGHT_PER_PROCESS * 2
+    assert yielded == binned_tiles
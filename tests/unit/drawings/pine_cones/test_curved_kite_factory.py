@@ -0,0 +1,128 @@
+from turtle import Vec2D
+
+import numpy as np
+import pytest
+
+from python_turtle_art.drawings.pine_cones.cuvred_kite_factory import (
+    CurvedKiteFactory,
+    get_curved_kite_template,
+)
+from python_turtle_art.instrumentation import get_counters, reset_counters
+from python_turtle_art.lines.offset_from_line import OffsetFromLine
+from python_turtle_art.polygons.kites.curved_kite import CurvedKite
+
+OFF_LINES = (
+    OffsetFromLine(offset=1),
+    OffsetFromLine(offset=2),
+    OffsetFromLine(0.4, offset=-1),
+    OffsetFromLine(offset=3),
+)
+
+
+@pytest.mark.parametrize("rotation", [0, 35, 180, 360, -72.5])
+@pytest.mark.parametrize("origin", [Vec2D(0, 0), Vec2D(120.5, -43), Vec2D(-3, 2000)])
+def test_kite_matches_rotated_curved_kite(rotation, origin):
+    factory = CurvedKiteFactory(
+        rotation=rotation,
+        height=30,
+        width=20,
+        diagonal_intersection_along_height=0.6,
+        off_lines=OFF_LINES,
+    )
+
+    expected = CurvedKite.from_origin_and_dimensions(
+        origin=origin,
+        height=30,
+        width=20,
+        diagonal_intersection_along_height=0.6,
+        off_lines=OFF_LINES,
+    ).rotate(angle=rotation, about_point=origin)
+
+    actual = factory.get_kite(origin=origin)
+
+    assert actual.corner_vertices_indices == expected.corner_vertices_indices
+    np.testing.assert_allclose(
+        actual.vertices_array, expected.vertices_array, rtol=0, atol=1e-9
+    )
+
+
+def test_template_reused_between_kites():
+    factory = CurvedKiteFactory(
+        rotation=10,
+        height=31,
+        width=21,
+        diagonal_intersection_along_height=0.5,
+        off_lines=OFF_LINES,
+    )
+
+    misses_before = get_curved_kite_template.cache_info().misses
+
+    factory.get_kite(origin=Vec2D(0, 0))
+    factory.get_kite(origin=Vec2D(100, 50))
+    factory.get_kite(origin=Vec2D(100, 50), width=22)
+
+    assert get_curved_kite_template.cache_info().misses == misses_before + 2
+
+
+def test_kites_vertices_match_kites():
+    factory = CurvedKiteFactory(
+        rotation=-20,
+        height=30,
+        width=20,
+        diagonal_intersection_along_height=0.6,
+        off_lines=OFF_LINES,
+    )
+    origins = np.array([[0, 0], [120.5, -43], [-3, 2000]])
+
+    vertices, corner_vertices_indices = factory.get_kites_vertices(origins)
+
+    assert not vertices.flags.writeable
+    for origin, kite_vertices in zip(origins, vertices, strict=True):
+        kite = factory.get_kite(origin=Vec2D(*origin))
+        assert corner_vertices_indices == kite.corner_vertices_indices
+        np.testing.assert_array_equal(kite_vertices, kite.vertices_array)
+
+
+def test_kite_bounding_box_moves_with_origin():
+    factory = CurvedKiteFactory(
+        rotation=15,
+        height=30,
+        width=20,
+        diagonal_intersection_along_height=0.6,
+        off_lines=OFF_LINES,
+    )
+
+    bounding_box = factory.get_kite_bounding_box()
+    kite_bounding_box = factory.get_kite(origin=Vec2D(50, -10)).bounding_box
+
+    assert kite_bounding_box.min_x == pytest.approx(bounding_box.min_x + 50)
+    assert kite_bounding_box.min_y == pytest.approx(bounding_box.min_y - 10)
+    assert kite_bounding_box.max_x == pytest.approx(bounding_box.max_x + 50)
+    assert kite_bounding_box.max_y == pytest.approx(bounding_box.max_y - 10)
+
+
+def test_missing_argument_error():
+    factory = CurvedKiteFactory(rotation=10, height=30, width=20)
+
+    with pytest.raises(ValueError, match="origin not specified"):
+        factory.get_kite()
+
+
+def test_kites_not_checked_again(mocker):
+    factory = CurvedKiteFactory(
+        rotation=10,
+        height=32,
+        width=22,
+        diagonal_intersection_along_height=0.5,
+        off_lines=OFF_LINES,
+    )
+    factory.get_kite(origin=Vec2D(0, 0))
+
+    init = mocker.spy(CurvedKite, "__init__")
+    reset_counters()
+
+    factory.get_kite(origin=Vec2D(5, 5))
+    factory.get_kite(origin=Vec2D(10, 5))
+
+    init.assert_not_called()
+    assert get_counters() == {"vertex_validations_skipped": 2}
@@ -0,0 +1,90 @@
+from math import cos, sin
+from turtle import Vec2D
+
+import numpy as np
+import pytest
+
+from python_turtle_art.drawings.pine_cones.layout import (
+    get_inner_kite_origins,
+    get_origins_within,
+)
+from python_turtle_art.helpers.angles import convert_degrees_to_radians
+from python_turtle_art.vertices.vertices import BoundingBox
+
+
+def get_inner_kite_origins_one_at_a_time(
+    first_vertex,
+    outer_kite_height,
+    outer_kite_width,
+    rotation,
+    inner_kite_height,
+    inner_kite_width,
+    inner_kite_diagonal_intersection_along_height,
+    horizontal_offset,
+    vertical_offset,
+):
+    """Move along each row one kite at a time with Vec2D arithmetic."""
+    n_side = int((outer_kite_width / 2 - inner_kite_width / 2) // inner_kite_width) + 1
+    n_rows = int(outer_kite_height // inner_kite_height) + 1
+
+    angle = convert_degrees_to_radians(rotation)
+    vertical = Vec2D(
+        outer_kite_height * sin(angle) / outer_kite_height,
+        outer_kite_height * cos(angle) / outer_kite_height,
+    )
+    horizontal = Vec2D(
+        outer_kite_width * cos(angle) / outer_kite_width,
+        -outer_kite_width * sin(angle) / outer_kite_width,
+    )
+    column_step = inner_kite_width + horizontal_offset
+
+    origins = []
+    for row in range(n_rows):
+        center = (
+            first_vertex + row * (inner_kite_height + 2 * vertical_offset) * vertical
+        )
+        origins.append(center)
+
+        center_half_row_up = (
+            center
+            + (
+                vertical_offset
+                + inner_kite_diagonal_intersection_along_height * inner_kite_height
+            )
+            * vertical
+        )
+
+        for sign in (1, -1):
+            for i in range(n_side):
+                origins.append(center + sign * ((i + 1) * column_step * horizontal))
+                origins.append(
+                    center_half_row_up
+                    + sign * ((column_step / 2 + i * column_step) * horizontal)
+                )
+
+    return origins
+
+
+@pytest.mark.parametrize(
+    "arguments",
+    [
+        (Vec2D(0, 0), 300, 200, 5, 40, 80, 0.45, 5, 5),
+        (Vec2D(-1000.5, 34), 1200, 800, -17.5, 100, 70, 0.6, 3, 7),
+        (Vec2D(3, 3), 50, 20, 0, 49, 30, 0.5, 1, 1),
+    ],
+)
+def test_origins_equal_to_moving_one_kite_at_a_time(arguments):
+    expected = get_inner_kite_origins_one_at_a_time(*arguments)
+
+    actual = get_inner_kite_origins(*arguments)
+
+    np.testing.assert_array_equal(actual, np.array(expected))
+
+
+def test_origins_within():
+    origins = np.array([[0, 0], [10, 0], [21, 5], [-12, -30]])
+    kite_bounding_box = BoundingBox(-1, 0, 1, 4)
+
+    actual = get_origins_within(origins, kite_bounding_box, BoundingBox(-5, -5, 11, 5))
+
+    np.testing.assert_array_equal(actual, [True, True, False, False])
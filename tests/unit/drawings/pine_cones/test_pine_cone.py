@@ -0,0 +1,237 @@
+import pickle
+from dataclasses import FrozenInstanceError
+from turtle import Vec2D
+
+import numpy as np
+import pytest
+
+from python_turtle_art.backends import DisplayList, RasterTurtle, RecordingTurtle
+from python_turtle_art.drawings.pine_cones.cuvred_kite_factory import CurvedKiteFactory
+from python_turtle_art.drawings.pine_cones.main import draw_image
+from python_turtle_art.drawings.pine_cones.pine_cone import (
+    PineCone,
+    RandomPineConeFactory,
+)
+from python_turtle_art.instrumentation import get_counters, reset_counters
+from python_turtle_art.lines.offset_from_line import OffsetFromLine
+from python_turtle_art.polygons.kites.curved_kite import CurvedKite
+from python_turtle_art.polygons.point_in_polygon import points_in_polygon
+from python_turtle_art.vertices.vertices import BoundingBox
+
+
+def create_pine_cone(**kwargs):
+    return PineCone(
+        outer_kite=CurvedKite.from_origin_and_dimensions(
+            origin=Vec2D(0, 0),
+            off_lines=(
+                OffsetFromLine(offset=20),
+                OffsetFromLine(offset=5),
+                OffsetFromLine(offset=5),
+                OffsetFromLine(offset=20),
+            ),
+            height=300,
+            width=200,
+            diagonal_intersection_along_height=0.45,
+        ),
+        outer_kite_rotation=5,
+        inner_kite_factory=CurvedKiteFactory(
+            off_lines=(
+                OffsetFromLine(offset=6),
+                OffsetFromLine(offset=-6),
+                OffsetFromLine(offset=-6),
+                OffsetFromLine(offset=6),
+            ),
+            height=40,
+            width=80,
+            diagonal_intersection_along_height=0.45,
+            rotation=7,
+        ),
+        **kwargs,
+    )
+
+
+def test_viewport_skips_inner_kites_outside_it():
+    recording_turtle = RecordingTurtle()
+    create_pine_cone().draw(recording_turtle)
+
+    culled_recording_turtle = RecordingTurtle()
+    create_pine_cone().draw(
+        culled_recording_turtle, viewport=BoundingBox(-20, 100, 20, 140)
+    )
+
+    assert len(culled_recording_turtle.get_display_list()) < len(
+        recording_turtle.get_display_list()
+    )
+
+
+def test_viewport_does_not_change_pixels_inside_it():
+    raster_arguments = {"width": 60, "height": 60, "left": -30, "top": 150}
+    viewport = BoundingBox(min_x=-30, min_y=91, max_x=29, max_y=150).expand(20)
+
+    turtle = RasterTurtle(**raster_arguments)
+    create_pine_cone().draw(turtle)
+
+    culled_turtle = RasterTurtle(**raster_arguments)
+    create_pine_cone().draw(culled_turtle, viewport=viewport)
+
+    np.testing.assert_array_equal(culled_turtle.get_array(), turtle.get_array())
+    assert (turtle.get_array() != 255).any()
+
+
+def record(draw) -> DisplayList:
+    turtle = RecordingTurtle()
+    draw(turtle)
+    return turtle.get_display_list()
+
+
+def assert_display_lists_equal(actual: DisplayList, expected: DisplayList):
+    np.testing.assert_array_equal(actual.opcodes, expected.opcodes)
+    np.testing.assert_array_equal(actual.coordinates, expected.coordinates)
+    assert [actual.styles[i] for i in actual.style_indices] == [
+        expected.styles[i] for i in expected.style_indices
+    ]
+
+
+def test_build_does_not_change_pine_cone():
+    pine_cone = create_pine_cone()
+    outer_kite_vertices = pine_cone.outer_kite.vertices_array.copy()
+
+    first_scene = pine_cone.build()
+    second_scene = pine_cone.build()
+
+    np.testing.assert_array_equal(
+        pine_cone.outer_kite.vertices_array, outer_kite_vertices
+    )
+    np.testing.assert_array_equal(
+        first_scene.outer_kite_vertices, second_scene.outer_kite_vertices
+    )
+    np.testing.assert_array_equal(
+        first_scene.inner_kite_vertices, second_scene.inner_kite_vertices
+    )
+
+
+def test_pine_cone_drawn_twice_the_same():
+    pine_cone = create_pine_cone()
+
+    assert_display_lists_equal(record(pine_cone.draw), record(pine_cone.draw))
+
+
+def test_scene_rendered_after_pickling():
+    scene = create_pine_cone().build()
+
+    unpickled_scene = pickle.loads(pickle.dumps(scene))  # noqa: S301
+
+    assert_display_lists_equal(record(unpickled_scene.render), record(scene.render))
+    assert_display_lists_equal(record(scene.render), record(create_pine_cone().draw))
+
+
+def test_scene_immutable():
+    scene = create_pine_cone().build()
+
+    with pytest.raises(FrozenInstanceError):
+        scene.outer_kite_line_width = 10  # type: ignore
+
+    assert not scene.outer_kite_vertices.flags.writeable
+    assert not scene.inner_kite_vertices.flags.writeable
+    assert not scene.inner_kite_bounding_boxes.flags.writeable
+    assert not scene.initial_body_parts.coordinates.flags.writeable
+    assert not scene.final_body_parts.coordinates.flags.writeable
+
+
+def test_scenes_from_same_seed_equal():
+    def build(seed):
+        return (
+            RandomPineConeFactory(
+                origin=Vec2D(0, 0), height_range=(300, 350), seed=seed
+            )
+            .create()
+            .build()
+        )
+
+    scene = build(seed=0)
+
+    assert len(scene.final_body_parts) > 0
+    assert scene == build(seed=0)
+    assert scene.diff(build(seed=0)) == []
+    assert scene != build(seed=1)
+    assert {
+        "outer_kite_vertices",
+        "inner_kite_vertices",
+        "final_body_parts",
+    } <= set(scene.diff(build(seed=1)))
+
+
+def test_get_inner_kites_in_viewport():
+    scene = create_pine_cone().build()
+    viewport = BoundingBox(-20, 100, 20, 140)
+
+    expected = [
+        kite.vertices_array
+        for kite in scene.get_inner_kites()
+        if kite.bounding_box.intersects(viewport)
+    ]
+
+    actual = [kite.vertices_array for kite in scene.get_inner_kites(viewport)]
+
+    assert 0 < len(actual) < len(scene.inner_kite_vertices)
+    np.testing.assert_array_equal(actual, expected)
+
+
+def test_clip_inner_kites_outside_outer_kite():
+    scene = create_pine_cone().build()
+
+    reset_counters()
+    clipped_scene = create_pine_cone(clip_inner_kites=True).build()
+
+    outer_kite = scene.get_outer_kite()
+    expected = [
+        kite.vertices_array
+        for kite in scene.get_inner_kites()
+        if points_in_polygon(kite.vertices_array, outer_kite.vertices_array).any()
+    ]
+
+    assert 0 < len(clipped_scene.inner_kite_vertices) < len(scene.inner_kite_vertices)
+    np.testing.assert_array_equal(clipped_scene.inner_kite_vertices, expected)
+    n_culled = len(scene.inner_kite_vertices) - len(expected)
+    assert get_counters()["inner_kites_culled"] == n_culled
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_scene_bounding_box_contains_drawing(seed):
+    scene = (
+        RandomPineConeFactory(origin=Vec2D(0, 0), height_range=(300, 350), seed=seed)
+        .create()
+        .build()
+    )
+
+    turtle = RasterTurtle(width=1000, height=1000)
+    scene.render(turtle)
+
+    rows, columns = np.nonzero((turtle.get_array() != 255).any(axis=2))
+    bounding_box = scene.get_bounding_box().expand(10)
+
+    assert len(rows) > 0
+    assert bounding_box.min_x <= (columns - 500).min()
+    assert (columns - 500).max() <= bounding_box.max_x
+    assert bounding_box.min_y <= (500 - rows).min()
+    assert (500 - rows).max() <= bounding_box.max_y
+
+
+def test_draw_image_skips_pine_cones_outside_viewport():
+    reset_counters()
+    recording_turtle = RecordingTurtle()
+
+    draw_image(recording_turtle, viewport=BoundingBox(-5000, 5000, -4000, 6000))
+
+    assert len(recording_turtle.get_display_list()) == 0
+    assert get_counters()["pine_cones_culled"] == 60
+
+
+def test_draw_image_draws_pine_cones_in_viewport():
+    reset_counters()
+    recording_turtle = RecordingTurtle()
+
+    draw_image(recording_turtle, viewport=BoundingBox(-50, -50, 50, 50))
+
+    assert len(recording_turtle.get_display_list()) > 0
+    assert 0 < get_counters()["pine_cones_culled"] < 60
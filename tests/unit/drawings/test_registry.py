@@ -0,0 +1,43 @@
+import subprocess
+import sys
+
+import pytest
+
+from python_turtle_art import drawings
+from python_turtle_art.drawings import MODULE_DRAW_FUNCTION_MAPPING, DrawingRegistry
+from python_turtle_art.drawings.stars_3bp.main import draw_image
+
+
+def test_names_listed():
+    assert list(MODULE_DRAW_FUNCTION_MAPPING) == ["pine_cones", "stars_3bp"]
+    assert len(MODULE_DRAW_FUNCTION_MAPPING) == 2
+    assert "stars_3bp" in MODULE_DRAW_FUNCTION_MAPPING
+
+
+def test_draw_function_imported_on_lookup():
+    assert MODULE_DRAW_FUNCTION_MAPPING["stars_3bp"] is draw_image
+    assert drawings.draw_image_stars_3bp is draw_image
+
+
+def test_unknown_drawing_error():
+    registry = DrawingRegistry({"stars_3bp": ".stars_3bp.main"})
+
+    with pytest.raises(KeyError):
+        registry["pine_cones"]
+
+    with pytest.raises(AttributeError, match="has no attribute 'draw_image_x'"):
+        drawings.draw_image_x  # noqa: B018
+
+
+def test_cli_import_does_not_import_drawings_or_pillow():
+    code = (
+        "import sys, python_turtle_art.cli; "
+        "print(sorted(m for m in sys.modules if m.startswith(("
+        "'PIL', 'python_turtle_art.drawings.', 'python_turtle_art.batch'))))"
+    )
+
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.strip() == "[]"
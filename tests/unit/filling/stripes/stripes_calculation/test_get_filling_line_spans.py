@@ -0,0 +1,97 @@
+from turtle import Vec2D
+
+import numpy as np
+import pytest
+
+from python_turtle_art.filling.stripes.stripes_calculation import (
+    get_filling_line_endpoints,
+    get_filling_line_spans,
+)
+from python_turtle_art.polygons.kites.convex_kite import ConvexKite
+from python_turtle_art.polygons.point_in_polygon import points_in_polygon
+from python_turtle_art.polygons.polygon import Polygon
+
+
+@pytest.fixture(scope="module")
+def notched_square() -> Polygon:
+    """Square with a notch cut into the top edge, down to (5, 2)."""
+    return Polygon(
+        vertices=np.array(
+            [[0, 0], [10, 0], [10, 10], [6, 10], [5, 2], [4, 10], [0, 10]],
+            dtype=np.float64,
+        )
+    )
+
+
+@pytest.mark.parametrize("axis", [0, 1])
+@pytest.mark.parametrize("rotation", [0, 20, 135])
+def test_convex_polygon_spans_match_endpoints(axis, rotation):
+    kite = ConvexKite.from_origin_and_dimensions(
+        origin=Vec2D(0, 0), height=100, width=60, diagonal_intersection_along_height=0.3
+    ).rotate(rotation, Vec2D(0, 0))
+
+    expected = get_filling_line_endpoints(gap=7, origin=2, polygon=kite, axis=axis)
+
+    actual = get_filling_line_spans(gap=7, origin=2, polygon=kite, axis=axis)
+
+    assert actual.shape == expected.shape
+    np.testing.assert_allclose(actual, np.sort(expected, axis=1), rtol=0, atol=1e-9)
+
+
+def test_horizontal_spans_either_side_of_notch(notched_square):
+    actual = get_filling_line_spans(gap=2, origin=0, polygon=notched_square, axis=1)
+
+    # stripe y = 2 only touches the bottom of the notch, so is one span
+    expected = [
+        [[0, 2], [10, 2]],
+        [[0, 4], [4.75, 4]],
+        [[5.25, 4], [10, 4]],
+        [[0, 6], [4.5, 6]],
+        [[5.5, 6], [10, 6]],
+        [[0, 8], [4.25, 8]],
+        [[5.75, 8], [10, 8]],
+    ]
+
+    np.testing.assert_allclose(actual, expected, rtol=0, atol=1e-12)
+    assert not actual.flags.writeable
+
+
+def test_vertical_spans_below_notch(notched_square):
+    actual = get_filling_line_spans(gap=2, origin=1, polygon=notched_square, axis=0)
+
+    np.testing.assert_allclose(
+        actual,
+        [
+            [[1, 0], [1, 10]],
+            [[3, 0], [3, 10]],
+            [[5, 0], [5, 2]],
+            [[7, 0], [7, 10]],
+            [[9, 0], [9, 10]],
+        ],
+        rtol=0,
+        atol=1e-12,
+    )
+
+
+def test_spans_inside_star():
+    star = Polygon(
+        vertices=np.array(
+            [[0, 5], [1, 10], [2, 5], [10, 5], [3, 2], [6, -10], [1, 0], [-5, -10]],
+            dtype=np.float64,
+        )
+        * 10
+    )
+
+    # stripes miss the vertices, so no span midpoint is on a horizontal edge
+    spans = get_filling_line_spans(gap=4, origin=1, polygon=star, axis=1)
+
+    midpoints = spans.mean(axis=1)
+    assert points_in_polygon(midpoints, star.vertices_array).all()
+    assert (np.diff(spans[..., 0], axis=1) > 0).all()
+
+
+def test_no_area_error():
+    line = Polygon(vertices=np.array([[0, 0], [5, 0], [10, 0]], dtype=np.float64))
+
+    with pytest.raises(ValueError, match="Polygon has no area to fill"):
+        get_filling_line_spans(gap=2, origin=0, polygon=line, axis=1)
@@ -1,8 +1,12 @@
 from turtle import Vec2D
 
+import numpy as np
 import pytest
 
-from python_turtle_art.filling.stripes.stripes_calculation import get_filling_lines
+from python_turtle_art.filling.stripes.stripes_calculation import (
+    get_filling_line_endpoints,
+    get_filling_lines,
+)
 from python_turtle_art.lines.line import Line
 from python_turtle_art.polygons.kites.convex_kite import ConvexKite
 
@@ -101,3 +105,32 @@ def test_vertical_lines_in_square(fill_origin, expected_x_coords, square):
     actual = get_filling_lines(gap=3, origin=fill_origin, polygon=square, axis=0)
 
     assert actual == expected
+
+
+def test_endpoints_array(kite):
+    actual = get_filling_line_endpoints(gap=10, origin=0, polygon=kite, axis=1)
+
+    expected = np.array(
+        [[[-y, y], [y, y]] for y in [10, 20, 30, 40]]
+        + [[[-50, 50], [50, 50]]]
+        + [[[y - 100, y], [100 - y, y]] for y in [60, 70, 80, 90]],
+        dtype=np.float64,
+    )
+
+    np.testing.assert_array_equal(actual, expected)
+    assert not actual.flags.writeable
+
+
+def test_no_endpoints_if_gap_larger_than_polygon(square):
+    with pytest.warns(UserWarning, match="No increments of 50"):
+        actual = get_filling_line_endpoints(gap=50, origin=30, polygon=square, axis=0)
+
+    assert actual.shape == (0, 2, 2)
+
+
+def test_lines_created_from_endpoints(square):
+    endpoints = get_filling_line_endpoints(gap=3, origin=0, polygon=square, axis=0)
+    lines = get_filling_lines(gap=3, origin=0, polygon=square, axis=0)
+
+    for line, stripe in zip(lines, endpoints, strict=True):
+        np.testing.assert_array_equal(line.vertices_array, stripe)
@@ -3,9 +3,10 @@ from unittest.mock import call
 
 from python_turtle_art.filling.stripes.hash_fill import HashFill
 from python_turtle_art.polygons.kites.convex_kite import ConvexKite
+from python_turtle_art.polygons.polygon import Polygon
 
 
-def test_get_filling_lines_called_with_both_axes(mocker, mocked_turtle):
+def test_get_filling_line_endpoints_called_with_both_axes(mocker, mocked_turtle):
     kite = ConvexKite.from_origin_and_dimensions(
         origin=Vec2D(0, 0),
         height=10,
@@ -16,7 +17,7 @@ def test_get_filling_lines_called_with_both_axes(mocker, mocked_turtle):
     fill = HashFill(gap=6, origin=0)
 
     mocked = mocker.patch(
-        "python_turtle_art.filling.stripes.hash_fill.get_filling_lines",
+        "python_turtle_art.filling.stripes.hash_fill.get_filling_line_endpoints",
         return_value=[],
     )
 
@@ -31,3 +32,24 @@ def test_get_filling_lines_called_with_both_axes(mocker, mocked_turtle):
         ],
         any_order=False,
     )
+
+
+def test_get_filling_line_spans_called_for_polygon(mocker, mocked_turtle):
+    polygon = Polygon(vertices=(Vec2D(0, 0), Vec2D(10, 0), Vec2D(5, 2), Vec2D(5, 10)))
+
+    fill = HashFill(gap=6, origin=0)
+
+    mocked = mocker.patch(
+        "python_turtle_art.filling.stripes.hash_fill.get_filling_line_spans",
+        return_value=[],
+    )
+
+    fill.fill(turtle=mocked_turtle, polygon=polygon)
+
+    mocked.assert_has_calls(
+        calls=[
+            call(origin=0, gap=6, polygon=polygon, axis=0),
+            call(origin=0, gap=6, polygon=polygon, axis=1),
+        ],
+        any_order=False,
+    )
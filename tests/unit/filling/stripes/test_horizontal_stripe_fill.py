@@ -2,9 +2,10 @@ from turtle import Vec2D
 
 from python_turtle_art.filling.stripes.horizontal_stripe_fill import HorizontalStipeFill
 from python_turtle_art.polygons.kites.convex_kite import ConvexKite
+from python_turtle_art.polygons.polygon import Polygon
 
 
-def test_get_filling_lines_called_with_axis_one(mocker, mocked_turtle):
+def test_get_filling_line_endpoints_called_with_axis_one(mocker, mocked_turtle):
     kite = ConvexKite.from_origin_and_dimensions(
         origin=Vec2D(0, 0),
         height=10,
@@ -15,10 +16,25 @@ def test_get_filling_lines_called_with_axis_one(mocker, mocked_turtle):
     fill = HorizontalStipeFill(gap=6, origin=0)
 
     mocked = mocker.patch(
-        "python_turtle_art.filling.stripes.horizontal_stripe_fill.get_filling_lines",
+        "python_turtle_art.filling.stripes.horizontal_stripe_fill.get_filling_line_endpoints",
         return_value=[],
     )
 
     fill.fill(turtle=mocked_turtle, polygon=kite)
 
     mocked.assert_called_once_with(origin=0, gap=6, polygon=kite, axis=1)
+
+
+def test_get_filling_line_spans_called_for_polygon(mocker, mocked_turtle):
+    polygon = Polygon(vertices=(Vec2D(0, 0), Vec2D(10, 0), Vec2D(5, 2), Vec2D(5, 10)))
+
+    fill = HorizontalStipeFill(gap=6, origin=0)
+
+    mocked = mocker.patch(
+        "python_turtle_art.filling.stripes.horizontal_stripe_fill.get_filling_line_spans",
+        return_value=[],
+    )
+
+    fill.fill(turtle=mocked_turtle, polygon=polygon)
+
+    mocked.assert_called_once_with(origin=0, gap=6, polygon=polygon, axis=1)
@@ -2,11 +2,12 @@ from turtle import Vec2D
 
 from python_turtle_art.filling.stripes.vertical_stripe_fill import VerticalStripeFill
 from python_turtle_art.polygons.kites.convex_kite import ConvexKite
+from python_turtle_art.polygons.polygon import Polygon
 
 
-def test_get_filling_lines_called_with_axis_one(mocker, mocked_turtle):
+def test_get_filling_line_endpoints_called_with_axis_one(mocker, mocked_turtle):
     mocked = mocker.patch(
-        "python_turtle_art.filling.stripes.vertical_stripe_fill.get_filling_lines",
+        "python_turtle_art.filling.stripes.vertical_stripe_fill.get_filling_line_endpoints",
         return_value=[],
     )
 
@@ -22,3 +23,18 @@ def test_get_filling_lines_called_with_axis_one(mocker, mocked_turtle):
     fill.fill(turtle=mocked_turtle, polygon=kite)
 
     mocked.assert_called_once_with(origin=0, gap=6, polygon=kite, axis=0)
+
+
+def test_get_filling_line_spans_called_for_polygon(mocker, mocked_turtle):
+    polygon = Polygon(vertices=(Vec2D(0, 0), Vec2D(10, 0), Vec2D(5, 2), Vec2D(5, 10)))
+
+    fill = VerticalStripeFill(gap=6, origin=0)
+
+    mocked = mocker.patch(
+        "python_turtle_art.filling.stripes.vertical_stripe_fill.get_filling_line_spans",
+        return_value=[],
+    )
+
+    fill.fill(turtle=mocked_turtle, polygon=polygon)
+
+    mocked.assert_called_once_with(origin=0, gap=6, polygon=polygon, axis=0)
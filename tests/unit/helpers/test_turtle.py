@@ -0,0 +1,83 @@
+from turtle import RawTurtle, Vec2D
+
+import numpy as np
+import pytest
+
+from python_turtle_art.backends import RecordingTurtle
+from python_turtle_art.helpers.turtle import draw_polyline
+from python_turtle_art.lines.line import Line
+from python_turtle_art.polygons.polygon import Polygon
+
+POINTS = (Vec2D(0, 0), Vec2D(10, 0), Vec2D(10, 10))
+
+
+def draw_shapes(turtle: RawTurtle, batch: bool) -> None:
+    """Draw a line, and a polygon with array vertices, inside and outside a fill."""
+    line = Line(vertices=POINTS)
+    polygon = Polygon(vertices=np.array(POINTS) - 20)
+
+    turtle.pencolor("green")
+    line.draw(turtle, colour="red", size=3, batch=batch)
+    polygon.draw(turtle, colour="blue", batch=batch)
+
+    turtle.fillcolor("yellow")
+    turtle.begin_fill()
+    polygon.draw(turtle, colour="red", size=2, batch=batch)
+    turtle.end_fill()
+
+    turtle.goto(50, 50)
+
+
+@pytest.mark.parametrize("attribute", ["opcodes", "offsets", "coordinates"])
+def test_batched_draw_same_as_unbatched(attribute):
+    display_lists = []
+
+    for batch in [False, True]:
+        turtle = RecordingTurtle()
+        draw_shapes(turtle, batch=batch)
+        display_lists.append(turtle.get_display_list())
+
+    unbatched, batched = display_lists
+
+    np.testing.assert_array_equal(
+        getattr(batched, attribute), getattr(unbatched, attribute)
+    )
+    assert batched.styles == unbatched.styles
+
+
+def test_turtle_state_after_draw_polyline():
+    turtle = RecordingTurtle()
+    turtle.penup()
+    turtle.pensize(4)
+
+    draw_polyline(turtle, POINTS, colour="red")
+
+    assert turtle.position() == Vec2D(10, 10)
+    assert turtle.isdown()
+    assert turtle.pencolor() == "black"
+
+    display_list = turtle.get_display_list()
+
+    assert display_list.styles == [("red", 4)]
+    np.testing.assert_array_equal(display_list.coordinates, np.array(POINTS))
+
+
+def test_tk_turtle_line_item_created(mocker):
+    turtle = mocker.MagicMock(spec=RawTurtle)
+    turtle.screen = mocker.MagicMock()
+    turtle.items = []
+    turtle.filling.return_value = True
+    turtle._fillpath = [Vec2D(5, 5)]
+
+    draw_polyline(turtle, np.array(POINTS), colour=(1.0, 0.0, 0.0), size=2)
+
+    line_item = turtle.screen._createline.return_value
+
+    turtle.screen._drawline.assert_called_once_with(
+        line_item, list(POINTS), turtle._colorstr.return_value, 2
+    )
+    assert turtle.items == [line_item]
+    assert turtle._fillpath == [Vec2D(5, 5), *POINTS]
+    assert turtle._position == Vec2D(10, 10)
+    turtle.penup.assert_called_once_with()
+    turtle.pendown.assert_called_once_with()
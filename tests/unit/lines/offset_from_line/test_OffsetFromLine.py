@@ -3,6 +3,7 @@ from turtle import Vec2D
 
 import pytest
 
+from python_turtle_art.lines import offset_from_line
 from python_turtle_art.lines.offset_from_line import (
     OffsetFromLine,
     point_perpendicular_distance_from_line,
@@ -82,3 +83,15 @@ def test_zero_offset_returns_point_along_line(proportion_lenth, p0, p1):
     expected = p0 + proportion_lenth * diff_p1_p0
 
     assert actual == expected
+
+
+def test_to_point_memoised(mocker):
+    """Test repeated calls with the same points reuse the calculated point."""
+    spy = mocker.spy(offset_from_line, "point_perpendicular_distance_from_line")
+    offset = OffsetFromLine(proportion_lenth=0.25, offset=-7.5)
+
+    first = offset.to_point(Vec2D(1.5, 2), Vec2D(31, -4))
+    second = offset.to_point(Vec2D(1.5, 2), Vec2D(31, -4))
+
+    assert first == second
+    assert spy.call_count == 1
@@ -0,0 +1,67 @@
+from turtle import Vec2D
+
+import numpy as np
+import pytest
+
+from python_turtle_art.lines.offset_from_line import (
+    OffsetFromLine,
+    offset_points_from_lines,
+    point_perpendicular_distance_from_line,
+    points_perpendicular_distance_from_lines,
+)
+
+P0 = np.array([[0, 0], [-3, 9], [-3, -4], [4.5, 3.25], [10, 10]])
+P1 = np.array([[10, 0], [0, 17], [12, 21], [-10, 3], [0, 10]])
+PROPORTIONS = np.array([0.5, 0.3, 0.2, 1.3, 0.75])
+OFFSETS = np.array([10, 3, -6, 2.5, 0])
+
+
+def test_points_equal_to_point():
+    """Test vectorised points are identical to OffsetFromLine.to_point."""
+    expected = [
+        OffsetFromLine(proportion_lenth=proportion, offset=offset).to_point(
+            Vec2D(*p0), Vec2D(*p1)
+        )
+        for p0, p1, proportion, offset in zip(
+            P0.tolist(),
+            P1.tolist(),
+            PROPORTIONS.tolist(),
+            OFFSETS.tolist(),
+            strict=True,
+        )
+    ]
+
+    actual = offset_points_from_lines(P0, P1, PROPORTIONS, OFFSETS)
+
+    np.testing.assert_array_equal(actual, np.array(expected))
+
+
+def test_scalar_proportion_and_offset():
+    actual = offset_points_from_lines(P0, P1, 0.5, 10)
+
+    expected = offset_points_from_lines(P0, P1, np.full(5, 0.5), np.full(5, 10))
+
+    np.testing.assert_array_equal(actual, expected)
+
+
+def test_points_equal_to_point_perpendicular_distance_from_line():
+    expected = [
+        point_perpendicular_distance_from_line(
+            p0=Vec2D(*p0), p1=Vec2D(*p1), distance=distance
+        )
+        for p0, p1, distance in zip(
+            P0.tolist(), P1.tolist(), OFFSETS.tolist(), strict=True
+        )
+    ]
+
+    actual = points_perpendicular_distance_from_lines(P0, P1, OFFSETS)
+
+    np.testing.assert_array_equal(actual, np.array(expected))
+
+
+@pytest.mark.parametrize(
+    ["p0", "p1"], [(np.zeros((3, 2)), np.zeros((2, 2))), (np.zeros(2), np.zeros(2))]
+)
+def test_shape_error(p0, p1):
+    with pytest.raises(ValueError, match="must have the same shape"):
+        offset_points_from_lines(p0, p1, 0.5, 10)
@@ -1,10 +1,16 @@
 from math import sqrt
 from turtle import Vec2D
 
+import numpy as np
 import pytest
 
 from python_turtle_art.lines.offset_from_line import OffsetFromLine
-from python_turtle_art.lines.quadratic_bezier_curve import QuadraticBezierCurve
+from python_turtle_art.lines.quadratic_bezier_curve import (
+    QuadraticBezierCurve,
+    evaluate_quadratic_bezier_curves,
+    get_quadratic_bernstein_basis,
+    quadratic_bezier_curve,
+)
 
 
 def test_cannot_initalise_with_one_step():
@@ -156,3 +162,44 @@ def test_default_control_point_produces_points_on_straight_line():
         assert 0 < vertex[0] < 10
         assert 0 < vertex[1] < 10
         assert vertex[0] == vertex[1]
+
+
+@pytest.mark.parametrize("steps", [2, 5, 20])
+def test_bernstein_basis(steps):
+    basis = get_quadratic_bernstein_basis(steps)
+
+    assert basis.shape == (steps, 3)
+    np.testing.assert_allclose(basis.sum(axis=1), 1)
+    np.testing.assert_array_equal(basis[0], [1, 0, 0])
+    np.testing.assert_array_equal(basis[-1], [0, 0, 1])
+
+
+def test_bernstein_basis_cached_and_read_only():
+    basis = get_quadratic_bernstein_basis(7)
+
+    assert get_quadratic_bernstein_basis(7) is basis
+
+    with pytest.raises(ValueError, match="read-only"):
+        basis[0, 0] = 2
+
+
+def test_evaluate_many_curves_matches_single_curve_formula():
+    control_points = np.array(
+        [
+            [[0, 0], [5, 10], [10, 0]],
+            [[4, 5], [-3, 2.5], [10, -9]],
+            [[1, 1], [1, 1], [2, 2]],
+        ],
+        dtype=np.float64,
+    )
+
+    actual = evaluate_quadratic_bezier_curves(control_points, steps=11)
+
+    assert actual.shape == (3, 11, 2)
+
+    for curve_points, (p0, p1, p2) in zip(actual, control_points, strict=True):
+        expected = [
+            quadratic_bezier_curve(t, Vec2D(*p0), Vec2D(*p1), Vec2D(*p2))
+            for t in np.linspace(0, 1, 11)
+        ]
+        np.testing.assert_allclose(curve_points, expected, rtol=0, atol=1e-12)
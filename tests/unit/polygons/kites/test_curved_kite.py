@@ -2,6 +2,7 @@ from math import sqrt
 from operator import gt, lt
 from turtle import Vec2D
 
+import numpy as np
 import pytest
 
 from python_turtle_art.lines.offset_from_line import OffsetFromLine
@@ -506,3 +507,18 @@ class TestGetWidth:
         ).rotate(angle=angle, about_point=about_point)
 
         assert kite.get_width() == pytest.approx(width)
+
+
+def test_vertices_array_matches_vertices():
+    off_lines = tuple(OffsetFromLine(offset=offset) for offset in (1, -2, 3, 4))
+
+    vertices, corner_indices = CurvedKite.get_curved_kite_vertices(
+        origin=Vec2D(3, -4), height=30, width=12, off_lines=off_lines
+    )
+    vertices_array, corner_indices_array = CurvedKite.get_curved_kite_vertices_array(
+        origin=Vec2D(3, -4), height=30, width=12, off_lines=off_lines
+    )
+
+    assert corner_indices_array == corner_indices
+    assert vertices_array.shape == (76, 2)
+    np.testing.assert_array_equal(vertices_array, vertices)
@@ -0,0 +1,99 @@
+from turtle import Vec2D
+
+import numpy as np
+import pytest
+
+from python_turtle_art.polygons.clipping import clip_polygon, clip_vertices
+from python_turtle_art.polygons.kites.convex_kite import ConvexKite
+from python_turtle_art.polygons.polygon import Polygon
+
+SQUARE = np.array([[0, 0], [4, 0], [4, 4], [0, 4]])
+
+# non convex polygon, a square with a notch cut into the top edge
+NOTCHED_SQUARE = np.array(
+    [[0, 0], [10, 0], [10, 10], [6, 10], [5, 2], [4, 10], [0, 10]]
+)
+
+
+def area(vertices):
+    x, y = np.asarray(vertices, dtype=np.float64).T
+    return abs(np.sum(x * np.roll(y, -1) - np.roll(x, -1) * y)) / 2
+
+
+def sorted_vertices(vertices):
+    return sorted(map(tuple, np.asarray(vertices).tolist()))
+
+
+@pytest.mark.parametrize(
+    "clip_manipulation",
+    [
+        pytest.param(lambda x: x, id="anticlockwise"),
+        pytest.param(lambda x: x[::-1], id="clockwise"),
+        pytest.param(lambda x: np.roll(x, 1, axis=0), id="move last to start"),
+    ],
+)
+def test_overlapping_squares(clip_manipulation):
+    clip = clip_manipulation(SQUARE + 2)
+
+    actual = clip_vertices(SQUARE, clip)
+
+    assert sorted_vertices(actual) == [(2, 2), (2, 4), (4, 2), (4, 4)]
+
+
+def test_polygon_inside_unchanged():
+    actual = clip_vertices(SQUARE + 1, SQUARE * 2)
+
+    np.testing.assert_array_equal(actual, SQUARE + 1)
+
+
+def test_polygon_containing_clip_polygon():
+    actual = clip_vertices(SQUARE * 4 - 1, SQUARE)
+
+    assert sorted_vertices(actual) == sorted_vertices(SQUARE)
+
+
+def test_polygon_outside_empty():
+    actual = clip_vertices(SQUARE, SQUARE + 10)
+
+    assert actual.shape == (0, 2)
+
+
+def test_touching_polygons_empty():
+    actual = clip_vertices(SQUARE, SQUARE + [4, 0])
+
+    assert actual.shape == (0, 2)
+
+
+def test_non_convex_polygon():
+    clip = np.array([[2, 1], [8, 1], [8, 6], [2, 6]])
+
+    actual = clip_vertices(NOTCHED_SQUARE, clip)
+
+    # the clip rectangle less the part of the notch inside it, the triangle with
+    # vertices (5, 2), (4.5, 6) and (5.5, 6)
+    assert area(actual) == pytest.approx(6 * 5 - 4 / 2)
+    assert sorted_vertices(actual) == sorted_vertices(
+        [[2, 1], [8, 1], [8, 6], [5.5, 6], [5, 2], [4.5, 6], [2, 6]]
+    )
+
+
+def test_polygon_objects():
+    kite = ConvexKite.from_origin_and_dimensions(origin=Vec2D(0, 0), height=10, width=6)
+    polygon = Polygon(NOTCHED_SQUARE - [5, 0])
+
+    expected = clip_vertices(polygon.vertices_array, kite.vertices_array)
+
+    actual = clip_polygon(polygon, kite)
+
+    assert 0 < area(actual) < area(kite.vertices_array)
+    np.testing.assert_array_equal(actual, expected)
+
+
+def test_non_convex_clip_error():
+    with pytest.raises(ValueError, match="must form a convex polygon"):
+        clip_vertices(SQUARE, NOTCHED_SQUARE)
+
+
+def test_vertices_shape_error():
+    with pytest.raises(ValueError, match="vertices must have shape"):
+        clip_vertices(SQUARE[:2], SQUARE)
@@ -0,0 +1,82 @@
+from math import sqrt
+from turtle import Vec2D
+
+import numpy as np
+import pytest
+
+from python_turtle_art.lines.offset_from_line import OffsetFromLine
+from python_turtle_art.polygons import is_convex as is_convex_module
+from python_turtle_art.polygons.is_convex import is_convex, is_convex_many
+from python_turtle_art.polygons.kites.curved_kite import CurvedKite
+
+COORDINATES = [
+    pytest.param([[0, 0], [0, 1], [1, 0]], id="right angle triangle"),
+    pytest.param([[-1, -1], [0, 5], [3, -0.5]], id="scalene triangle"),
+    pytest.param([[0, 0], [1, 0], [1, 1], [0, 1]], id="square"),
+    pytest.param(
+        [[-4, 0], [0, 0], [sqrt(8), sqrt(8)], [sqrt(8) - 4, sqrt(8)]], id="rhombus"
+    ),
+    pytest.param([[0, -3], [0, 9], [4, 8], [-4, 8]], id="self-intersecting kite"),
+    pytest.param([[0, 0], [2, 0], [3, 3], [1, 5], [-2, 3]], id="pentagon"),
+    pytest.param(
+        [[0, 0], [0, 1], [0.5, 0.5], [1, 1], [1, 0]], id="square, top edge in centre"
+    ),
+    pytest.param(
+        [[0, 5], [1, 10], [2, 5], [10, 5], [3, 2], [6, -10], [1, 0], [-5, -10]],
+        id="star",
+    ),
+    pytest.param([[0, 0], [1, 0], [2, 0], [1, 1]], id="collinear vertices"),
+    pytest.param([[0, 0], [1, 0], [1, 0], [1, 1]], id="repeated vertex"),
+    pytest.param([[0, 0], [np.nan, 0], [1, 1], [0, 1]], id="nan vertex"),
+]
+
+
+@pytest.mark.parametrize("coordinates", COORDINATES)
+def test_vectorised_matches_loop(coordinates, monkeypatch):
+    array = np.array(coordinates, dtype=np.float64)
+    expected = is_convex_module._is_convex_loop(array)
+
+    monkeypatch.setattr(is_convex_module, "VECTORISED_MIN_VERTICES", 0)
+
+    assert is_convex(array) is expected
+    assert is_convex_many(array[np.newaxis]).tolist() == [expected]
+
+
+@pytest.mark.parametrize("offset", [-1, -0.1, 0.1, 3.7, 3.8, 10])
+def test_vectorised_matches_loop_for_curved_kites(offset):
+    kites = [
+        CurvedKite.from_origin_and_dimensions(
+            origin=Vec2D(0, -5),
+            height=10,
+            width=10,
+            diagonal_intersection_along_height=0.5,
+            off_lines=tuple(OffsetFromLine(offset=offset) for _ in range(4)),
+            steps_in_curves=20,
+        ).rotate(angle, Vec2D(0, 0))
+        for angle in (0, 30, 45, 90, 200)
+    ]
+
+    expected = [is_convex_module._is_convex_loop(kite.vertices) for kite in kites]
+
+    result = is_convex_many(np.stack([kite.vertices_array for kite in kites]))
+
+    assert result.tolist() == expected
+
+
+def test_large_arrays_vectorised():
+    angles = np.linspace(0, 2 * np.pi, 1000, endpoint=False)
+    circle = np.column_stack([np.cos(angles), np.sin(angles)])
+    star = circle * np.where(np.arange(1000) % 2 == 0, 1, 0.9)[:, np.newaxis]
+
+    assert is_convex(circle)
+    assert not is_convex(star)
+    assert is_convex_many(np.stack([circle, star, circle[::-1]])).tolist() == [
+        True,
+        False,
+        True,
+    ]
+
+
+def test_is_convex_many_shape_error():
+    with pytest.raises(ValueError, match=r"vertices must have shape \(n, m, 2\)."):
+        is_convex_many(np.zeros((4, 2)))
@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+
+from python_turtle_art.polygons import point_in_polygon as point_in_polygon_module
+from python_turtle_art.polygons.point_in_polygon import (
+    points_in_polygon,
+    polygons_overlap_polygon,
+)
+
+# non convex polygon, a square with a notch cut into the top edge
+NOTCHED_SQUARE = np.array(
+    [[0, 0], [10, 0], [10, 10], [6, 10], [5, 2], [4, 10], [0, 10]]
+)
+
+
+def square(x, y, size=1):
+    return [[x, y], [x + size, y], [x + size, y + size], [x, y + size]]
+
+
+@pytest.mark.parametrize(
+    "point, expected",
+    [
+        pytest.param([1, 1], True, id="inside"),
+        pytest.param([9, 9], True, id="inside, right of notch"),
+        pytest.param([5, 5], False, id="in notch"),
+        pytest.param([5, 1], True, id="below notch"),
+        pytest.param([-1, 5], False, id="left"),
+        pytest.param([11, 5], False, id="right"),
+        pytest.param([5, 12], False, id="above"),
+    ],
+)
+def test_points_in_polygon(point, expected):
+    assert points_in_polygon(np.array(point), NOTCHED_SQUARE) == expected
+
+
+def test_points_in_polygon_keeps_shape():
+    points = np.array([[[1, 1], [5, 5]], [[9, 9], [-1, 5]]])
+
+    actual = points_in_polygon(points, NOTCHED_SQUARE)
+
+    np.testing.assert_array_equal(actual, [[True, False], [True, False]])
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 256])
+def test_polygons_overlap_polygon(chunk_size, monkeypatch):
+    monkeypatch.setattr(point_in_polygon_module, "OVERLAP_CHUNK_SIZE", chunk_size)
+
+    polygons = np.array(
+        [
+            square(1, 1),  # inside
+            square(4.8, 5, size=0.4),  # in notch
+            square(-2, -2, size=14),  # contains the polygon
+            square(9.5, 4),  # crosses right edge
+            square(11, 5),  # right of polygon
+            square(10, 4),  # touches right edge
+            [[-1, 5], [11, 5], [11, 5.5], [-1, 5.5]],  # crosses, no vertices inside
+        ]
+    )
+
+    actual = polygons_overlap_polygon(polygons, NOTCHED_SQUARE)
+
+    np.testing.assert_array_equal(actual, [True, False, True, True, False, True, True])
+
+
+def test_vertices_shape_error():
+    with pytest.raises(ValueError, match="vertices must have shape"):
+        points_in_polygon(np.array([0, 0]), np.array([[0, 0], [1, 1]]))
+
+
+def test_polygons_shape_error():
+    with pytest.raises(ValueError, match="polygons must have shape"):
+        polygons_overlap_polygon(np.array(square(0, 0)), NOTCHED_SQUARE)
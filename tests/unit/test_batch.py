@@ -0,0 +1,121 @@
+import json
+
+import pytest
+from PIL import Image
+
+from python_turtle_art.batch import get_batch_jobs, run_batch
+
+
+def test_images_written(tmp_path):
+    results = run_batch(
+        drawing="stars_3bp",
+        seeds=range(2),
+        output_directory=tmp_path,
+        processes=1,
+        width=50,
+        height=40,
+        progress=lambda message: None,
+    )
+
+    assert [result.seed for result in results] == [0, 1]
+
+    for seed in range(2):
+        with Image.open(tmp_path / f"stars_3bp_{seed}.png") as image:
+            assert image.size == (50, 40)
+
+    assert not list(tmp_path.glob("*.partial"))
+
+
+def test_existing_outputs_skipped(tmp_path):
+    (tmp_path / "stars_3bp_1.svg").write_text("existing")
+    messages = []
+
+    results = run_batch(
+        drawing="stars_3bp",
+        seeds=range(3),
+        output_directory=tmp_path,
+        processes=1,
+        backend="svg",
+        progress=messages.append,
+    )
+
+    assert [result.seed for result in results] == [0, 2]
+    assert (tmp_path / "stars_3bp_1.svg").read_text() == "existing"
+    assert messages[0] == "Skipping 1 existing outputs."
+    assert messages[-1].startswith("[2/2] seed 2")
+
+
+def test_timings_appended(tmp_path):
+    for seeds in [range(1), range(2)]:
+        run_batch(
+            drawing="stars_3bp",
+            seeds=seeds,
+            output_directory=tmp_path,
+            processes=1,
+            progress=lambda message: None,
+        )
+
+    with open(tmp_path / "timings.jsonl") as file:
+        timings = [json.loads(line) for line in file]
+
+    assert [timing["seed"] for timing in timings] == [0, 1]
+    assert all(timing["seconds"] > 0 for timing in timings)
+
+
+def test_process_pool(tmp_path):
+    results = run_batch(
+        drawing="stars_3bp",
+        seeds=range(3),
+        output_directory=tmp_path,
+        processes=2,
+        backend="svg",
+        progress=lambda message: None,
+    )
+
+    assert sorted(result.seed for result in results) == [0, 1, 2]
+    assert len(list(tmp_path.glob("stars_3bp_*.svg"))) == 3
+
+
+@pytest.mark.parametrize(
+    ["drawing", "backend", "message"],
+    [
+        ("circles", "raster", "Unknown drawing circles."),
+        ("stars_3bp", "tk", "Unknown batch backend tk."),
+    ],
+)
+def test_invalid_jobs(tmp_path, drawing, backend, message):
+    with pytest.raises(ValueError, match=message):
+        get_batch_jobs(
+            drawing=drawing, seeds=range(1), output_directory=tmp_path, backend=backend
+        )
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_failed_job_recorded_and_batch_continues(tmp_path, processes):
+    # the partial output of seed 1 is a directory so writing its image raises
+    (tmp_path / "stars_3bp_1.png.partial").mkdir()
+    messages = []
+
+    results = run_batch(
+        drawing="stars_3bp",
+        seeds=range(3),
+        output_directory=tmp_path,
+        processes=processes,
+        progress=messages.append,
+    )
+
+    results_by_seed = {result.seed: result for result in results}
+
+    assert sorted(results_by_seed) == [0, 1, 2]
+    assert results_by_seed[1].seconds is None
+    assert results_by_seed[1].error.startswith("IsADirectoryError")
+    assert results_by_seed[0].error is None
+    assert results_by_seed[2].error is None
+    assert (tmp_path / "stars_3bp_0.png").exists()
+    assert (tmp_path / "stars_3bp_2.png").exists()
+    assert messages[-1] == "1 of 3 jobs failed, seeds 1."
+
+    with open(tmp_path / "timings.jsonl") as file:
+        timings = [json.loads(line) for line in file]
+
+    assert sorted(timing["seed"] for timing in timings) == [0, 1, 2]
@@ -0,0 +1,95 @@
+import json
+
+import pytest
+
+from python_turtle_art.benchmark import (
+    Benchmark,
+    compare_results,
+    get_benchmarks,
+    run,
+    run_benchmark,
+)
+from python_turtle_art.instrumentation import increment_counter
+
+
+def test_run_benchmark_measurements():
+    setup_calls = []
+
+    def setup():
+        setup_calls.append(1)
+        return (100_000,)
+
+    benchmark = Benchmark(
+        name="allocate", group="test", function=lambda n: [0] * n, setup=setup
+    )
+
+    result = run_benchmark(benchmark, repeats=3)
+
+    assert len(result.wall_times) == 3
+    assert len(setup_calls) == 4
+    assert result.peak_memory >= 100_000 * 8
+    assert result.wall_time_min <= result.wall_time_mean
+    assert result.to_dict()["name"] == "allocate"
+
+
+def test_run_benchmark_counters():
+    benchmark = Benchmark(
+        name="count",
+        group="test",
+        function=lambda: increment_counter("calls"),
+    )
+
+    result = run_benchmark(benchmark, repeats=3)
+
+    assert result.counters == {"calls": 1}
+
+
+def test_benchmark_names_unique():
+    names = [benchmark.name for benchmark in get_benchmarks()]
+
+    assert len(names) == len(set(names))
+    assert "draw_image[pine_cones]" in names
+
+
+def test_compare_results():
+    results = [
+        {"name": "a", "wall_time_min": 2.0},
+        {"name": "b", "wall_time_min": 1.0},
+    ]
+    baseline = [{"name": "a", "wall_time_min": 1.0}]
+
+    assert compare_results(results, baseline) == [("a", 1.0, 2.0, 2.0)]
+
+
+def test_run_writes_json(tmp_path, capsys):
+    output = tmp_path / "results.json"
+
+    run(["-k", "^is_convex$", "-r", "2", "-o", str(output)])
+
+    with open(output) as file:
+        results = json.load(file)["results"]
+
+    assert [result["name"] for result in results] == ["is_convex"]
+    assert len(results[0]["wall_times"]) == 2
+    assert "is_convex" in capsys.readouterr().out
+
+
+def test_stars_3bp_benchmarks_run():
+    for benchmark in get_benchmarks():
+        if "stars_3bp" in benchmark.name:
+            result = run_benchmark(benchmark, repeats=1)
+            assert result.peak_memory > 0
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "import[python_turtle_art.cli, DISABLE_BEARTYPE]",
+        "parse_arguments[drawing, DISABLE_BEARTYPE]",
+        "parse_arguments[batch, DISABLE_BEARTYPE]",
+    ],
+)
+def test_cli_startup_benchmark_imports(name):
+    benchmarks = {benchmark.name: benchmark for benchmark in get_benchmarks()}
+
+    benchmarks[name].function()
@@ -0,0 +1,154 @@
+import json
+import pstats
+import sys
+from turtle import Vec2D
+
+import pytest
+
+from python_turtle_art.backends import RecordingTurtle
+from python_turtle_art.cli import run
+from python_turtle_art.filling import ColourFill
+from python_turtle_art.instrumentation import (
+    Profiler,
+    get_counters,
+    increment_counter,
+    instrument_turtle,
+    reset_counters,
+    timed,
+)
+from python_turtle_art.polygons.kites import ConvexKite
+from python_turtle_art.polygons.polygon import Polygon
+
+
+def test_increment_and_reset_counters():
+    reset_counters()
+
+    increment_counter("a")
+    increment_counter("a", 2)
+    increment_counter("b")
+
+    assert get_counters() == {"a": 3, "b": 1}
+
+    reset_counters()
+
+    assert get_counters() == {}
+
+
+def test_get_counters_returns_copy():
+    reset_counters()
+    increment_counter("a")
+
+    get_counters()["a"] = 10
+
+    assert get_counters() == {"a": 1}
+
+
+def draw_square(turtle):
+    square = ConvexKite(
+        vertices=(Vec2D(0, 0), Vec2D(10, 0), Vec2D(10, 10), Vec2D(0, 10))
+    )
+    square.fill(turtle, ColourFill("red"))
+    square.rotate(45, about_point=Vec2D(5, 5))
+    ConvexKite.from_trusted_vertices(square.vertices_array).draw(turtle)
+
+
+def test_profiler_records_shapes_fills_and_turtle_commands():
+    with Profiler() as profiler:
+        turtle = RecordingTurtle()
+        instrument_turtle(turtle)
+        draw_square(turtle)
+        with timed("export", "png"):
+            pass
+
+    timings = profiler.get_report()["timings"]
+
+    assert timings["shapes"]["ConvexKite"]["count"] == 2
+    assert "Kite" not in timings["shapes"]
+    assert timings["fills"]["ColourFill"]["count"] == 1
+    assert timings["turtle_commands"]["begin_fill"]["count"] == 1
+    assert timings["export"]["png"]["count"] == 1
+    assert profiler.get_report()["counters"] == {"vertex_validations_skipped": 2}
+
+
+def test_nothing_recorded_outside_profiler():
+    profiler = Profiler()
+    with profiler:
+        pass
+
+    turtle = RecordingTurtle()
+    instrument_turtle(turtle)
+    draw_square(turtle)
+    with timed("export", "png"):
+        pass
+
+    assert profiler.get_report()["timings"] == {}
+
+
+def test_patches_removed_on_exit():
+    init = Polygon.__init__
+    fill = ColourFill.fill
+
+    with Profiler():
+        assert Polygon.__init__ is not init
+        assert "__init__" in vars(ConvexKite)
+
+    assert Polygon.__init__ is init
+    assert ColourFill.fill is fill
+    assert "__init__" not in vars(ConvexKite)
+
+
+def test_one_active_profiler():
+    with Profiler(), pytest.raises(ValueError, match="already active"), Profiler():
+        pass
+
+
+def test_chrome_trace_and_pstats_written(tmp_path):
+    with Profiler(trace=True, cprofile=True) as profiler:
+        draw_square(RecordingTurtle())
+
+    profiler.write_chrome_trace(tmp_path / "trace.json")
+    profiler.write_pstats(tmp_path / "stats")
+
+    events = json.loads((tmp_path / "trace.json").read_text())["traceEvents"]
+
+    assert {event["name"] for event in events} == {"ConvexKite", "ColourFill"}
+    assert all(event["ph"] == "X" for event in events)
+    assert pstats.Stats(str(tmp_path / "stats")).total_calls > 0
+
+
+def test_trace_not_kept_error():
+    with Profiler() as profiler:
+        pass
+
+    with pytest.raises(ValueError, match="trace=True"):
+        profiler.write_chrome_trace("trace.json")
+
+    with pytest.raises(ValueError, match="cprofile=True"):
+        profiler.write_pstats("stats")
+
+
+def test_profile_from_command_line(monkeypatch, tmp_path):
+    report_file = tmp_path / "report.json"
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "python_turtle_drawing",
+            "-b",
+            "raster",
+            "-d",
+            "stars_3bp",
+            "--profile",
+            str(report_file),
+        ],
+    )
+
+    run()
+
+    report = json.loads(report_file.read_text())
+
+    assert report["drawing"] == "stars_3bp"
+    assert report["backend"] == "raster"
+    assert report["timings"]["drawing"]["stars_3bp"]["count"] == 1
+    assert report["timings"]["turtle_commands"]["polyline"]["count"] > 0
+    assert report["timings"]["fills"]["HashFill"]["count"] > 0
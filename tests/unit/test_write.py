@@ -0,0 +1,86 @@
+from tkinter import Canvas
+from turtle import TurtleScreen, Vec2D
+
+import numpy as np
+import pytest
+
+from python_turtle_art import write
+from python_turtle_art.backends import Raster
+
+RGB = {
+    "red": (65535, 0, 0),
+    "blue": (0, 0, 65535),
+    "green": (0, 32896, 0),
+}
+
+ITEMS = {
+    1: ("polygon", [-10, -10, 10, -10, 10, 10, -10, 10], "red", "", "1.0", ""),
+    2: ("line", [-10, 5, 10, 5], "blue", "", "3.0", ""),
+    3: ("line", [0, 0, 0, 0], "", "", "2", ""),
+    4: ("oval", [15, -5, 19, -1], "green", "", "0", ""),
+    5: ("polygon", [-18, 18, -12, 18, -12, 12], "", "blue", "1.0", ""),
+    6: ("line", [-20, -20, 20, 20], "green", "", "5", "hidden"),
+    7: ("text", [0, 0], "red", "", "0", ""),
+}
+
+
+@pytest.fixture
+def screen(mocker):
+    canvas = mocker.MagicMock(spec=Canvas)
+    canvas.find_all.return_value = tuple(ITEMS)
+    canvas.type.side_effect = lambda item: ITEMS[item][0]
+    canvas.coords.side_effect = lambda item: ITEMS[item][1]
+    canvas.itemconfigure.side_effect = lambda item: {
+        name: (name, "", "", "", value)
+        for name, value in zip(
+            ["fill", "outline", "width", "state"], ITEMS[item][2:], strict=True
+        )
+    }
+    canvas.winfo_rgb.side_effect = RGB.__getitem__
+    canvas.canvasx.return_value = -20.0
+    canvas.canvasy.return_value = -20.0
+
+    screen = mocker.MagicMock(spec=TurtleScreen)
+    screen.getcanvas.return_value = canvas
+    screen.bgcolor.return_value = "white"
+
+    return screen
+
+
+def test_canvas_items_drawn_with_y_axis_flipped(screen):
+    expected = Raster(width=40, height=40, left=-19.5, top=19.5)
+    expected.draw_polygon(
+        np.array([[-10, 10], [10, 10], [10, -10], [-10, -10]]), "#ff0000"
+    )
+    expected.draw_polyline(np.array([[-10, -5], [10, -5]]), "#0000ff", 3)
+    expected.draw_dot(Vec2D(17, 3), 4, "#008000")
+    expected.draw_polyline(
+        np.array([[-18, -18], [-12, -18], [-12, -12], [-18, -18]]), "#0000ff", 1
+    )
+
+    image = write.get_canvas_items_image(screen, height=40, width=40)
+
+    np.testing.assert_array_equal(np.asarray(image), expected.pixels)
+
+
+def test_colours_converted_once(screen):
+    write.get_canvas_items_image(screen, height=40, width=40)
+
+    assert screen.getcanvas().winfo_rgb.call_count == 3
+
+
+@pytest.mark.parametrize(
+    "method, function",
+    [("postscript", "get_canvas_image"), ("canvas", "get_canvas_items_image")],
+)
+def test_save_turtle_screen_method(screen, mocker, method, function):
+    get_image = mocker.patch.object(write, function)
+
+    write.save_turtle_screen(screen, "image.png", 40, 40, method=method)
+
+    get_image.return_value.save.assert_called_once_with("image.png")
+
+
+def test_save_turtle_screen_unknown_method_error(screen):
+    with pytest.raises(ValueError, match="Unknown capture method ghostscript."):
+        write.save_turtle_screen(screen, "image.png", 40, 40, method="ghostscript")
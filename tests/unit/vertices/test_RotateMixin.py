@@ -0,0 +1,107 @@
+from turtle import Vec2D
+
+import numpy as np
+import pytest
+
+from python_turtle_art.helpers.rotation import rotate_about_point
+from python_turtle_art.instrumentation import get_counters, reset_counters
+from python_turtle_art.lines.line import Line
+from python_turtle_art.lines.offset_from_line import OffsetFromLine
+from python_turtle_art.polygons.kites.convex_curved_kite import ConvexCurvedKite
+from python_turtle_art.polygons.kites.convex_kite import ConvexKite
+from python_turtle_art.polygons.polygon import Polygon
+from python_turtle_art.vertices.vertices import rotate_many
+
+VERTICES = (Vec2D(0, 0), Vec2D(3.5, 1), Vec2D(2, 7.25), Vec2D(-1, 4))
+
+
+@pytest.mark.parametrize("angle", [1, 30, 90, 137.5, 180, 359, -45, 720.5])
+@pytest.mark.parametrize("about_point", [Vec2D(0, 0), Vec2D(2, 7.25), Vec2D(-3, 8)])
+def test_rotate_matches_rotate_about_point(angle, about_point):
+    expected = tuple(
+        rotate_about_point(point, angle, about_point) for point in VERTICES
+    )
+
+    actual = Polygon(vertices=VERTICES).rotate(angle=angle, about_point=about_point)
+
+    assert actual.vertices == expected
+
+
+def test_rotate_multiple_of_360_no_change():
+    polygon = Polygon(vertices=VERTICES)
+
+    polygon.rotate(angle=720, about_point=Vec2D(5, 5))
+
+    assert polygon.vertices is VERTICES
+
+
+def test_rotate_many_matches_rotate():
+    def get_shapes():
+        return [
+            Polygon(vertices=VERTICES),
+            Line(vertices=(Vec2D(0, 5), Vec2D(0, 15))),
+            Polygon(vertices=VERTICES),
+            ConvexCurvedKite.from_origin_and_dimensions(
+                origin=Vec2D(10, 10),
+                height=40,
+                width=30,
+                off_lines=tuple(OffsetFromLine(offset=2) for _ in range(4)),
+            ),
+        ]
+
+    angles = [30, 45, 360, -60]
+    about_points = [Vec2D(0, 0), Vec2D(1, 2), Vec2D(3, 4), Vec2D(10, 10)]
+
+    expected = [
+        shape.rotate(angle=angle, about_point=about_point)
+        for shape, angle, about_point in zip(
+            get_shapes(), angles, about_points, strict=True
+        )
+    ]
+
+    actual = rotate_many(get_shapes(), angles=angles, about_points=about_points)
+
+    assert actual == expected
+    for actual_shape, expected_shape in zip(actual, expected, strict=True):
+        np.testing.assert_array_equal(
+            actual_shape.vertices_array, expected_shape.vertices_array
+        )
+
+
+def test_rotate_many_single_angle():
+    shapes = [Polygon(vertices=VERTICES), Polygon(vertices=VERTICES)]
+
+    rotate_many(shapes, angles=90, about_points=[Vec2D(0, 0), Vec2D(1, 1)])
+
+    assert shapes[0] == Polygon(vertices=VERTICES).rotate(90, Vec2D(0, 0))
+    assert shapes[1] == Polygon(vertices=VERTICES).rotate(90, Vec2D(1, 1))
+
+
+def test_rotate_many_about_points_length_error():
+    with pytest.raises(
+        ValueError, match="about_points must have the same length as shapes."
+    ):
+        rotate_many(
+            [Polygon(vertices=VERTICES)], angles=90, about_points=[Vec2D(0, 0)] * 2
+        )
+
+
+def test_rotate_many_angles_length_error():
+    with pytest.raises(ValueError, match="angles must have the same length as shapes."):
+        rotate_many(
+            [Polygon(vertices=VERTICES)], angles=[90, 45], about_points=[Vec2D(0, 0)]
+        )
+
+
+def test_rotate_skips_validation(mocker):
+    kite = ConvexKite(vertices=VERTICES)
+    is_convex = mocker.patch(
+        "python_turtle_art.polygons.convex_polygon.is_convex", return_value=True
+    )
+    reset_counters()
+
+    kite.rotate(angle=30, about_point=Vec2D(0, 0))
+    rotate_many([kite, kite], angles=10, about_points=[Vec2D(0, 0), Vec2D(1, 1)])
+
+    is_convex.assert_not_called()
+    assert get_counters() == {"vertex_validations_skipped": 3}
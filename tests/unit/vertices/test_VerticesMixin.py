@@ -0,0 +1,173 @@
+from turtle import Vec2D
+
+import numpy as np
+import pytest
+
+from python_turtle_art.instrumentation import get_counters, reset_counters
+from python_turtle_art.lines.line import Line
+from python_turtle_art.polygons.kites.convex_kite import ConvexKite
+from python_turtle_art.vertices.vertices import BoundingBox, VerticesMixin
+
+
+class DummyImplmentation(VerticesMixin):
+    def __init__(self, vertices):
+        self.vertices = vertices
+
+
+def test_vertices_array_from_tuple():
+    x = DummyImplmentation(vertices=(Vec2D(0, 1), Vec2D(2, 3), Vec2D(4, 5)))
+
+    np.testing.assert_array_equal(x.vertices_array, [[0, 1], [2, 3], [4, 5]])
+    assert x.vertices_array.dtype == np.float64
+
+
+def test_vertices_from_array():
+    x = DummyImplmentation(vertices=np.array([[0, 1], [2, 3], [4, 5]]))
+
+    assert x.vertices == (Vec2D(0, 1), Vec2D(2, 3), Vec2D(4, 5))
+    assert all(isinstance(vertex, Vec2D) for vertex in x.vertices)
+
+
+def test_vertices_array_read_only():
+    x = DummyImplmentation(vertices=(Vec2D(0, 1), Vec2D(2, 3)))
+
+    with pytest.raises(ValueError, match="read-only"):
+        x.vertices_array[0, 0] = 10
+
+
+def test_writeable_array_copied():
+    array = np.array([[0.0, 1.0], [2.0, 3.0]])
+
+    x = DummyImplmentation(vertices=array)
+    array[0, 0] = 10
+
+    assert x.vertices[0] == Vec2D(0, 1)
+
+
+def test_read_only_array_shared():
+    x = DummyImplmentation(vertices=np.array([[0.0, 1.0], [2.0, 3.0]]))
+    y = DummyImplmentation(vertices=x.vertices_array)
+
+    assert y.vertices_array is x.vertices_array
+
+
+def test_setting_vertices_replaces_both_forms():
+    x = DummyImplmentation(vertices=(Vec2D(0, 1), Vec2D(2, 3)))
+    assert x.vertices_array.shape == (2, 2)
+
+    x.vertices = np.array([[4.0, 5.0], [6.0, 7.0]])
+
+    assert x.vertices == (Vec2D(4, 5), Vec2D(6, 7))
+
+    x.vertices = (Vec2D(8, 9), Vec2D(10, 11))
+
+    np.testing.assert_array_equal(x.vertices_array, [[8, 9], [10, 11]])
+
+
+def test_array_wrong_shape_error():
+    with pytest.raises(ValueError, match=r"vertices array must have shape \(n, 2\)."):
+        DummyImplmentation(vertices=np.zeros((3, 3)))
+
+
+def test_line_from_array_length_checked():
+    with pytest.raises(ValueError, match="vertices must contain at least 2 points."):
+        Line(vertices=np.array([[0.0, 1.0]]))
+
+
+def test_convex_kite_from_array_checked():
+    with pytest.raises(
+        ValueError, match="Polygon defined by supplied vertices are not convex."
+    ):
+        ConvexKite(
+            vertices=np.array([[0.0, 0.0], [5.0, 10.0], [10.0, 0.0], [5.0, 3.0]])
+        )
+
+
+def test_equality_between_array_and_tuple_vertices():
+    assert Line(vertices=np.array([[0.0, 1.0], [2.0, 3.0]])) == Line(
+        vertices=(Vec2D(0, 1), Vec2D(2, 3))
+    )
+
+
+def test_bounding_box():
+    x = DummyImplmentation(vertices=(Vec2D(0, 1), Vec2D(-2, 3), Vec2D(4, -5)))
+
+    assert x.bounding_box == BoundingBox(min_x=-2, min_y=-5, max_x=4, max_y=3)
+
+
+def test_bounding_box_cached():
+    x = DummyImplmentation(vertices=(Vec2D(0, 1), Vec2D(2, 3)))
+
+    assert x.bounding_box is x.bounding_box
+
+
+def test_bounding_box_reset_when_vertices_set():
+    x = DummyImplmentation(vertices=(Vec2D(0, 1), Vec2D(2, 3)))
+    assert x.bounding_box == BoundingBox(min_x=0, min_y=1, max_x=2, max_y=3)
+
+    x.vertices = (Vec2D(4, 5), Vec2D(6, 7))
+
+    assert x.bounding_box == BoundingBox(min_x=4, min_y=5, max_x=6, max_y=7)
+
+
+def test_bounding_box_reset_when_rotated():
+    line = Line(vertices=(Vec2D(0, 0), Vec2D(2, 0)))
+    assert line.bounding_box == BoundingBox(min_x=0, min_y=0, max_x=2, max_y=0)
+
+    line.rotate(90, Vec2D(0, 0))
+
+    np.testing.assert_allclose(line.bounding_box, (0, -2, 0, 0), atol=1e-12)
+
+
+@pytest.mark.parametrize(
+    "other, expected",
+    [
+        (BoundingBox(1, 1, 3, 3), True),
+        (BoundingBox(2, 2, 3, 3), True),
+        (BoundingBox(-1, -1, 3, 3), True),
+        (BoundingBox(2.5, 0, 3, 2), False),
+        (BoundingBox(0, -3, 2, -0.5), False),
+    ],
+)
+def test_bounding_box_intersects(other, expected):
+    box = BoundingBox(min_x=0, min_y=0, max_x=2, max_y=2)
+
+    assert box.intersects(other) is expected
+    assert other.intersects(box) is expected
+
+
+def test_bounding_box_expand():
+    box = BoundingBox(min_x=0, min_y=1, max_x=2, max_y=3)
+
+    assert box.expand(1.5) == BoundingBox(-1.5, -0.5, 3.5, 4.5)
+
+
+def test_bounding_box_union():
+    box = BoundingBox(min_x=0, min_y=1, max_x=2, max_y=3)
+
+    assert box.union(BoundingBox(1, -1, 4, 2)) == BoundingBox(0, -1, 4, 3)
+
+
+def test_bounding_box_from_points():
+    points = (Vec2D(1, 2), Vec2D(-3, 5), Vec2D(0, -1))
+
+    assert BoundingBox.from_points(points) == BoundingBox(-3, -1, 1, 5)
+    assert BoundingBox.from_points(np.array(points)) == BoundingBox(-3, -1, 1, 5)
+
+
+def test_bounding_box_from_dimensions():
+    assert BoundingBox.from_dimensions(100, 50) == BoundingBox(-50, -25, 50, 25)
+
+
+def test_from_trusted_vertices_skips_checks():
+    reset_counters()
+
+    kite = ConvexKite.from_trusted_vertices(
+        np.array([[0.0, 0.0], [1.0, 0.0], [0.2, 0.2], [0.0, 1.0]]),
+        corner_vertices_indices=(0, 1, 2, 3),
+    )
+
+    assert isinstance(kite, ConvexKite)
+    assert not kite.is_convex()
+    assert kite.corner_vertices_indices == (0, 1, 2, 3)
+    assert get_counters() == {"vertex_validations_skipped": 1}
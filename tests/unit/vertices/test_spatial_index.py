@@ -0,0 +1,51 @@
+from turtle import Vec2D
+
+import pytest
+
+from python_turtle_art.lines.line import Line
+from python_turtle_art.vertices.spatial_index import SpatialIndex
+from python_turtle_art.vertices.vertices import BoundingBox
+
+
+def test_cell_size_error():
+    with pytest.raises(ValueError, match="cell_size must be greater than zero."):
+        SpatialIndex(cell_size=0)
+
+
+def test_query_returns_overlapping_items_in_insertion_order():
+    index: SpatialIndex[str] = SpatialIndex(cell_size=10)
+    index.insert("c", BoundingBox(50, 50, 60, 60))
+    index.insert("a", BoundingBox(0, 0, 5, 5))
+    index.insert("b", BoundingBox(-25, -25, 25, 25))
+
+    assert index.query(BoundingBox(-1, -1, 1, 1)) == ["a", "b"]
+    assert index.query(BoundingBox(4, 4, 55, 55)) == ["c", "a", "b"]
+    assert index.query(BoundingBox(100, 100, 110, 110)) == []
+
+
+def test_query_checks_bounding_boxes_not_just_cells():
+    index: SpatialIndex[str] = SpatialIndex(cell_size=10)
+    index.insert("a", BoundingBox(0, 0, 1, 1))
+
+    assert index.query(BoundingBox(8, 8, 9, 9)) == []
+
+
+def test_large_query_matches_small_cells():
+    index: SpatialIndex[int] = SpatialIndex(cell_size=1)
+    for i in range(10):
+        index.insert(i, BoundingBox(i, i, i + 0.5, i + 0.5))
+
+    assert index.query(BoundingBox(-1e6, -1e6, 1e6, 1e6)) == list(range(10))
+    assert index.query(BoundingBox(2.6, 2.6, 4.2, 4.2)) == [3, 4]
+
+
+def test_from_shapes():
+    lines = [
+        Line(vertices=(Vec2D(0, 0), Vec2D(10, 0))),
+        Line(vertices=(Vec2D(0, 20), Vec2D(10, 30))),
+    ]
+
+    index = SpatialIndex.from_shapes(lines, cell_size=5)
+
+    assert len(index) == 2
+    assert index.query(BoundingBox(5, 25, 6, 26)) == [lines[1]]